@@ -8,11 +8,12 @@ from conans.client.build.compiler_flags import (architecture_flag, format_librar
                                                 sysroot_flag, format_include_paths,
                                                 build_type_flags, libcxx_flag, build_type_define,
                                                 libcxx_define, pic_flag, rpath_flags)
+from conans.client.build.compiler_cache import CompilerCache
 from conans.client.build.cppstd_flags import cppstd_flag
 from conans.client.tools.oss import OSInfo
 from conans.client.tools.win import unix_path
 from conans.tools import (environment_append, args_to_string, cpu_count, cross_building,
-                          detected_architecture, get_gnu_triplet)
+                          detected_architecture, get_gnu_triplet, job_slots, no_op)
 from conans.errors import ConanException
 
 
@@ -39,6 +40,7 @@ class AutoToolsBuildEnvironment(object):
         self._compiler_version = conanfile.settings.get_safe("compiler.version")
         self._libcxx = conanfile.settings.get_safe("compiler.libcxx")
         self._cppstd = conanfile.settings.get_safe("cppstd")
+        self._compiler_cache = CompilerCache(conanfile, self._compiler)
 
         # Set the generic objects before mapping to env vars to let the user
         # alter some value
@@ -141,7 +143,8 @@ class AutoToolsBuildEnvironment(object):
                 args.append("--prefix=%s" % self._conanfile.package_folder.replace("\\", "/"))
 
         with environment_append(pkg_env):
-            with environment_append(vars or self.vars):
+            with environment_append(vars or self.vars), \
+                    environment_append(self._compiler_cache.env):
                 configure_dir = self._adjust_path(configure_dir)
                 command = '%s/configure %s %s' % (configure_dir,
                                                   args_to_string(args), " ".join(triplet_args))
@@ -159,8 +162,9 @@ class AutoToolsBuildEnvironment(object):
         if not self._conanfile.should_build:
             return
         make_program = os.getenv("CONAN_MAKE_PROGRAM") or make_program or "make"
-        with environment_append(vars or self.vars):
-            str_args = args_to_string(args)
+        str_args = args_to_string(args)
+        jobs = job_slots(self._conanfile.output) if "-j" not in str_args else no_op()
+        with environment_append(vars or self.vars), self._compiler_cache.build(), jobs:
             cpu_count_option = ("-j%s" % cpu_count()) if "-j" not in str_args else None
             self._conanfile.run("%s" % join_arguments([make_program, target, str_args,
                                                        cpu_count_option]),
@@ -302,6 +306,7 @@ class AutoToolsBuildEnvironment(object):
                "LDFLAGS": ldflags.strip(),
                "LIBS": libs.strip(),
                }
+        ret.update(self._compiler_cache.compilers())
         return ret
 
 
@@ -5,6 +5,7 @@ from collections import OrderedDict
 from itertools import chain
 
 from conans.client import defs_to_string, join_arguments
+from conans.client.build.compiler_cache import CompilerCache
 from conans.client.build.cppstd_flags import cppstd_flag
 from conans.client.tools import cross_building
 from conans.client.tools.oss import get_cross_building_settings
@@ -61,6 +62,7 @@ class CMake(object):
         self._runtime = self._settings.get_safe("compiler.runtime")
         self._build_type = self._settings.get_safe("build_type")
         self._cppstd = self._settings.get_safe("cppstd")
+        self._compiler_cache = CompilerCache(conanfile, self._compiler)
 
         self.generator = generator or self._generator()
         self.toolset = self._toolset(toolset)
@@ -311,6 +313,10 @@ class CMake(object):
         if self._libcxx:
             ret["CONAN_LIBCXX"] = self._libcxx
 
+        if self._compiler_cache:
+            ret["CMAKE_C_COMPILER_LAUNCHER"] = self._compiler_cache.launcher
+            ret["CMAKE_CXX_COMPILER_LAUNCHER"] = self._compiler_cache.launcher
+
         # Shared library
         try:
             ret["BUILD_SHARED_LIBS"] = "ON" if self._conanfile.options.shared else "OFF"
@@ -388,11 +394,12 @@ class CMake(object):
             args_to_string([source_dir])
         ])
         command = "cd %s && cmake %s" % (args_to_string([self.build_dir]), arg_list)
-        if platform.system() == "Windows" and self.generator == "MinGW Makefiles":
-            with tools.remove_from_path("sh"):
+        with tools.environment_append(self._compiler_cache.env):
+            if platform.system() == "Windows" and self.generator == "MinGW Makefiles":
+                with tools.remove_from_path("sh"):
+                    self._run(command)
+            else:
                 self._run(command)
-        else:
-            self._run(command)
 
     def build(self, args=None, build_dir=None, target=None):
         if not self._conanfile.should_build:
@@ -402,24 +409,26 @@ class CMake(object):
         if target is not None:
             args = ["--target", target] + args
 
-        if self.parallel:
-            if "Makefiles" in self.generator and "NMake" not in self.generator:
-                if "--" not in args:
-                    args.append("--")
-                args.append("-j%i" % cpu_count())
-            elif "Visual Studio" in self.generator and \
-                    self._compiler_version and Version(self._compiler_version) >= "10":
-                if "--" not in args:
-                    args.append("--")
-                args.append("/m:%i" % cpu_count())
-
-        arg_list = join_arguments([
-            args_to_string([build_dir]),
-            self.build_config,
-            args_to_string(args)
-        ])
-        command = "cmake --build %s" % arg_list
-        self._run(command)
+        with tools.job_slots(self._conanfile.output) if self.parallel else tools.no_op():
+            if self.parallel:
+                if "Makefiles" in self.generator and "NMake" not in self.generator:
+                    if "--" not in args:
+                        args.append("--")
+                    args.append("-j%i" % cpu_count())
+                elif "Visual Studio" in self.generator and \
+                        self._compiler_version and Version(self._compiler_version) >= "10":
+                    if "--" not in args:
+                        args.append("--")
+                    args.append("/m:%i" % cpu_count())
+
+            arg_list = join_arguments([
+                args_to_string([build_dir]),
+                self.build_config,
+                args_to_string(args)
+            ])
+            command = "cmake --build %s" % arg_list
+            with self._compiler_cache.build():
+                self._run(command)
 
     def install(self, args=None, build_dir=None):
         if not self._conanfile.should_install:
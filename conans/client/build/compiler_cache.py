@@ -0,0 +1,96 @@
+import os
+import re
+import subprocess
+from contextlib import contextmanager
+
+from conans.client.tools.env import environment_append
+from conans.util.env_reader import get_env
+from conans.util.log import logger
+
+
+# ccache 3.x "cache hit (direct)", ccache 4.x "Hits:", sccache "Cache hits"
+_HITS = re.compile(r"^\s*(cache hit \((?:direct|preprocessed)\)|hits:|cache hits)\s+(\d+)",
+                   re.IGNORECASE | re.MULTILINE)
+_MISSES = re.compile(r"^\s*(cache miss|misses:|cache misses)\s+(\d+)",
+                     re.IGNORECASE | re.MULTILINE)
+
+# Compiler executables of the settings compiler, when CC/CXX are not defined
+_COMPILERS = {"gcc": ("gcc", "g++"),
+              "clang": ("clang", "clang++"),
+              "apple-clang": ("clang", "clang++")}
+
+
+def parse_stats(text):
+    """ returns the (hits, misses) of the statistics output of ccache or sccache
+    """
+    def count(regex):
+        values = {}
+        for label, value in regex.findall(text):
+            values.setdefault(label.lower(), int(value))  # ccache 4 repeats them per storage
+        return sum(values.values())
+    return count(_HITS), count(_MISSES)
+
+
+class CompilerCache(object):
+    """ Compiler launcher, as ccache or sccache, used by the build helpers when the
+    CONAN_COMPILER_LAUNCHER environment variable is defined, typically in the [env] section
+    of a profile. The cache directory is CONAN_COMPILER_CACHE_DIR, defined by conan to a
+    folder per package id when building in the local cache, so the rebuilds after a recipe
+    change reuse the previous objects. sccache only uses it when starting its server.
+    """
+    def __init__(self, conanfile, compiler=None):
+        self._conanfile = conanfile
+        self._compiler = compiler
+        self.launcher = get_env("CONAN_COMPILER_LAUNCHER", None)
+        self.folder = get_env("CONAN_COMPILER_CACHE_DIR", None)
+
+    def __bool__(self):
+        return bool(self.launcher)
+
+    __nonzero__ = __bool__
+
+    @property
+    def env(self):
+        if not self.launcher or not self.folder:
+            return {}
+        return {"CCACHE_DIR": self.folder, "SCCACHE_DIR": self.folder}
+
+    def compilers(self):
+        """ CC and CXX values that call the compilers through the launcher
+        """
+        if not self.launcher:
+            return {}
+        ret = {}
+        defaults = _COMPILERS.get(self._compiler, (None, None))
+        for var, default in zip(("CC", "CXX"), defaults):
+            compiler = os.environ.get(var, default)
+            if compiler and not compiler.startswith(self.launcher):
+                ret[var] = "%s %s" % (self.launcher, compiler)
+        return ret
+
+    def _call(self, *args):
+        try:
+            return subprocess.check_output([self.launcher] + list(args),
+                                           stderr=subprocess.STDOUT).decode("utf-8", "replace")
+        except (OSError, subprocess.CalledProcessError) as exc:
+            logger.debug("Compiler cache: '%s %s' failed: %s"
+                         % (self.launcher, " ".join(args), str(exc)))
+            return None
+
+    @contextmanager
+    def build(self):
+        """ context of a build command, reporting the cache hits of the build
+        """
+        if not self.launcher:
+            yield
+            return
+        with environment_append(self.env):
+            self._call("--zero-stats")
+            yield
+            stats = self._call("--show-stats")
+        if stats:
+            hits, misses = parse_stats(stats)
+            if hits or misses:
+                self._conanfile.output.info("Compiler cache (%s): %d hits, %d misses, %d%% hit rate"
+                                            % (os.path.basename(self.launcher), hits, misses,
+                                               100 * hits // (hits + misses)))
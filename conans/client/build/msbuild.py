@@ -26,7 +26,8 @@ class MSBuild(object):
 
     def build(self, project_file, targets=None, upgrade_project=True, build_type=None, arch=None,
               parallel=True, force_vcvars=False, toolset=None, platforms=None, use_env=True):
-        with tools.environment_append(self.build_env.vars):
+        jobs = tools.job_slots(self._output) if parallel else tools.no_op()
+        with tools.environment_append(self.build_env.vars), jobs:
             # Path for custom properties file
             props_file_contents = self._get_props_file_contents()
             with tmp_file(props_file_contents) as props_file_path:
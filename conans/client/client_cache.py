@@ -1,3 +1,4 @@
+import marshal
 import os
 import shutil
 from os.path import join, normpath
@@ -7,22 +8,36 @@ from conans.client.conf import ConanClientConfigParser, default_client_conf, def
 from conans.client.conf.detect import detect_defaults_settings
 from conans.client.output import Color
 from conans.client.profile_loader import read_profile
+from conans.client.store.blob_store import BlobStore
+from conans.client.store.cache_index import CacheIndex
+from conans.client.store.source_cache import SourceCache
 from conans.errors import ConanException
 from conans.model.manifest import FileTreeManifest
 from conans.model.profile import Profile
 from conans.model.ref import ConanFileReference
 from conans.model.settings import Settings
 from conans.paths import SimplePaths, PUT_HEADERS, check_ref_case,\
-    CONAN_MANIFEST
-from conans.util.files import save, load, normalize, list_folder_subdirs
-from conans.util.locks import SimpleLock, ReadLock, WriteLock, NoLock, Lock
+    CONAN_MANIFEST, path_shortener
+from conans.util.env_reader import get_env
+from conans.util.files import save, load, normalize
+from conans.util.locks import SimpleLock, ReadLock, WriteLock, NoLock, Lock, FcntlLock,\
+    FcntlReadLock, FcntlWriteLock
+from conans.util.log import logger
+from conans.util.sha import sha1
 from conans.unicode import get_cwd
 
 
 CONAN_CONF = 'conan.conf'
 CONAN_SETTINGS = "settings.yml"
+CONAN_SETTINGS_CACHE = ".settings.cache"
 LOCALDB = ".conan.db"
 REGISTRY = "registry.txt"
+REMOTES_HEALTH = ".remotes_health.json"
+CACHE_INDEX = ".cache_index.db"
+BLOBS_FOLDER = ".blobs"
+SOURCES_CACHE_FOLDER = ".sources"
+COMPILER_CACHE_FOLDER = "compiler_cache"
+LINT_CACHE_FOLDER = ".lint_cache"
 PROFILES_FOLDER = "profiles"
 
 # Client certificates
@@ -46,11 +61,66 @@ class ClientCache(SimplePaths):
         self._store_folder = store_folder or self.conan_config.storage_path or self.conan_folder
         self._default_profile = None
         self._no_lock = None
+        self._fcntl_locks = None
+        self._cache_index = None
+        self._dedup_warned = False
         self.client_cert_path = normpath(join(self.conan_folder, CLIENT_CERT))
         self.client_cert_key_path = normpath(join(self.conan_folder, CLIENT_KEY))
 
         super(ClientCache, self).__init__(self._store_folder)
 
+    @property
+    def shared_store(self):
+        """ optional read-only store, pre-populated and shared by several users. The recipes
+        and packages not in the user store are used from it, the writes always go to the user one
+        """
+        return self.conan_config.shared_storage_path
+
+    def _layered(self, path):
+        """ the path in the user store, or its equivalent in the shared store if only there
+        """
+        shared_store = self.shared_store
+        if not shared_store or os.path.exists(path):
+            return path
+        shared_path = os.path.join(shared_store, os.path.relpath(path, self.store))
+        return shared_path if os.path.exists(shared_path) else path
+
+    def conanfile(self, conan_reference):
+        # Only used to read it, a recipe only in the shared store is used from there
+        return self._layered(super(ClientCache, self).conanfile(conan_reference))
+
+    def export(self, conan_reference, layered=False):
+        """ layered: to read the export folder, from the shared store if only there
+        """
+        path = super(ClientCache, self).export(conan_reference)
+        return self._layered(path) if layered else path
+
+    def export_sources(self, conan_reference, short_paths=False, layered=False):
+        """ layered: to read the export sources folder, from the shared store if only there
+        """
+        if layered and self.shared_store:
+            path = super(ClientCache, self).export_sources(conan_reference, short_paths=False)
+            shared_path = self._layered(path)
+            if shared_path != path:
+                return path_shortener(shared_path, None)
+        return super(ClientCache, self).export_sources(conan_reference, short_paths)
+
+    def package(self, package_reference, short_paths=False, layered=False):
+        """ layered: to read the package folder, from the shared store if only there
+        """
+        if layered and self.shared_store:
+            path = super(ClientCache, self).package(package_reference, short_paths=False)
+            shared_path = self._layered(path)
+            if shared_path != path:
+                return path_shortener(shared_path, None)
+        return super(ClientCache, self).package(package_reference, short_paths)
+
+    def compiler_cache(self, package_reference):
+        """ ccache/sccache directory of the builds of a package id
+        """
+        return normpath(join(self.conan(package_reference.conan), COMPILER_CACHE_FOLDER,
+                             package_reference.package_id))
+
     @property
     def cacert_path(self):
         return normpath(join(self.conan_folder, CACERT_FILE))
@@ -60,27 +130,49 @@ class ClientCache(SimplePaths):
             self._no_lock = self.conan_config.cache_no_locks
         return self._no_lock
 
+    def _use_fcntl_locks(self):
+        if self._fcntl_locks is None:
+            backend = self.conan_config.cache_lock_backend
+            if backend not in ("counter", "fcntl"):
+                raise ConanException("Invalid general.cache_lock_backend '%s', use 'counter' "
+                                     "or 'fcntl'" % backend)
+            self._fcntl_locks = backend == "fcntl" and FcntlLock.available()
+            if backend == "fcntl" and not self._fcntl_locks:
+                self._output.warn("The 'fcntl' cache lock backend is not available in this "
+                                  "platform, using 'counter'")
+        return self._fcntl_locks
+
     def conanfile_read_lock(self, conan_ref):
         if self._no_locks():
             return NoLock()
+        if self._use_fcntl_locks():
+            return FcntlReadLock(self.conan(conan_ref), conan_ref, self._output)
         return ReadLock(self.conan(conan_ref), conan_ref, self._output)
 
     def conanfile_write_lock(self, conan_ref):
         if self._no_locks():
             return NoLock()
+        if self._use_fcntl_locks():
+            return FcntlWriteLock(self.conan(conan_ref), conan_ref, self._output)
         return WriteLock(self.conan(conan_ref), conan_ref, self._output)
 
     def conanfile_lock_files(self, conan_ref):
         # Used in ConanRemover
         if self._no_locks():
             return ()
+        if self._use_fcntl_locks():
+            # Removing it while other process waits for it would break the exclusion
+            return ()
         return WriteLock(self.conan(conan_ref), conan_ref, self._output).files
 
     def package_lock(self, package_ref):
         if self._no_locks():
             return NoLock()
-        return SimpleLock(join(self.conan(package_ref.conan), "locks",
-                               package_ref.package_id))
+        locks_folder = join(self.conan(package_ref.conan), "locks")
+        if self._use_fcntl_locks():
+            return FcntlWriteLock(join(locks_folder, package_ref.package_id), package_ref,
+                                  self._output)
+        return SimpleLock(join(locks_folder, package_ref.package_id))
 
     @property
     def put_headers_path(self):
@@ -109,6 +201,55 @@ class ClientCache(SimplePaths):
     def registry(self):
         return join(self.conan_folder, REGISTRY)
 
+    @property
+    def remotes_health(self):
+        return join(self.conan_folder, REMOTES_HEALTH)
+
+    @property
+    def cache_index(self):
+        if self._cache_index is None:
+            self._cache_index = CacheIndex(join(self.conan_folder, CACHE_INDEX), self)
+        return self._cache_index
+
+    @property
+    def blob_store(self):
+        """ None if the deduplication of the packages files is not enabled. It needs the read
+        only cache, the package files are shared with the other packages
+        """
+        if not get_env("CONAN_CACHE_DEDUP", False):
+            return None
+        if not get_env("CONAN_READ_ONLY_CACHE", False):
+            if not self._dedup_warned:
+                self._output.warn("cache_dedup needs read_only_cache, the packages won't be "
+                                  "deduplicated")
+                self._dedup_warned = True
+            return None
+        return BlobStore(self.blobs_folder)
+
+    @property
+    def blobs_folder(self):
+        # In the store, so the packages files can be hardlinked
+        return join(self.store, BLOBS_FOLDER)
+
+    @property
+    def lint_cache_folder(self):
+        """ results of the recipes linter, keyed by the recipe contents
+        """
+        return join(self.conan_folder, LINT_CACHE_FOLDER)
+
+    @property
+    def source_cache(self):
+        """ None if the cache of the source() results is not enabled
+        """
+        if not get_env("CONAN_SOURCE_CACHE", False):
+            return None
+        return SourceCache(self.source_cache_folder)
+
+    @property
+    def source_cache_folder(self):
+        # Next to the store, so the sources can be cloned where the file system allows it
+        return join(self.conan_folder, SOURCES_CACHE_FOLDER)
+
     @property
     def conan_config(self):
         if not self._conan_config:
@@ -134,6 +275,10 @@ class ClientCache(SimplePaths):
     def settings_path(self):
         return join(self.conan_folder, CONAN_SETTINGS)
 
+    @property
+    def settings_cache_path(self):
+        return join(self.conan_folder, CONAN_SETTINGS_CACHE)
+
     @property
     def default_profile_path(self):
         if os.path.isabs(self.conan_config.default_profile):
@@ -184,11 +329,32 @@ class ClientCache(SimplePaths):
                 settings = Settings.loads(default_settings_yml)
             else:
                 content = load(self.settings_path)
-                settings = Settings.loads(content)
+                settings = self._load_settings(content)
 
             self._settings = settings
         return self._settings
 
+    def _load_settings(self, content):
+        """ Parsing settings.yml is slow, so the parsed definition is stored in a marshal
+        file, reused while the settings.yml content doesn't change
+        """
+        content_hash = sha1(content.encode("utf-8"))
+        try:
+            with open(self.settings_cache_path, "rb") as f:
+                cached_hash, definition = marshal.load(f)
+            if cached_hash == content_hash:
+                return Settings(definition)
+        except Exception:  # Missing, corrupted or written by other python version
+            pass
+
+        definition = Settings.loads_definition(content)
+        settings = Settings(definition)
+        try:
+            save(self.settings_cache_path, marshal.dumps((content_hash, definition)))
+        except Exception as e:  # e.g. read-only conan folder, or not marshallable definition
+            logger.debug("Cannot cache the parsed settings.yml: %s" % str(e))
+        return settings
+
     def conan_packages(self, conan_reference):
         """ Returns a list of package_id from a local cache package folder """
         assert isinstance(conan_reference, ConanFileReference)
@@ -216,15 +382,15 @@ class ClientCache(SimplePaths):
         assert isinstance(conan_reference, ConanFileReference)
         export_folder = self.export(conan_reference)
         check_ref_case(conan_reference, export_folder, self.store)
-        return FileTreeManifest.load(export_folder)
+        return FileTreeManifest.load(self._layered(export_folder))
 
     def load_package_manifest(self, package_reference):
         """conan_id = sha(zip file)"""
-        package_folder = self.package(package_reference, short_paths=None)
+        package_folder = self.package(package_reference, short_paths=None, layered=True)
         return FileTreeManifest.load(package_folder)
 
     def package_manifests(self, package_reference):
-        package_folder = self.package(package_reference, short_paths=None)
+        package_folder = self.package(package_reference, short_paths=None, layered=True)
         if not os.path.exists(os.path.join(package_folder, CONAN_MANIFEST)):
             return None, None
         return self._digests(package_folder)
@@ -247,7 +413,7 @@ class ClientCache(SimplePaths):
                 ref_path = os.path.dirname(ref_path)
 
     def remove_locks(self):
-        folders = list_folder_subdirs(self._store_folder, 4)
+        folders = self.cache_index.recipe_folders()
         for folder in folders:
             conan_folder = os.path.join(self._store_folder, folder)
             Lock.clean(conan_folder)
@@ -263,6 +429,7 @@ class ClientCache(SimplePaths):
         self._settings = None
         self._default_profile = None
         self._no_lock = None
+        self._fcntl_locks = None
 
 
 def _mix_settings_with_env(settings):
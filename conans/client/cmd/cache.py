@@ -0,0 +1,150 @@
+import os
+import re
+import time
+
+from conans.client.remover import DiskRemover
+from conans.client.store.blob_store import BlobStore
+from conans.client.store.cache_index import folder_size
+from conans.client.store.source_cache import SourceCache
+from conans.errors import ConanException
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.util.config_parser import parse_size
+from conans.util.files import list_folder_subdirs
+
+
+_AGE_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 24 * 3600, "w": 7 * 24 * 3600}
+
+
+def parse_age(value):
+    """ "3600", "90m", "12h", "30d", "2w" => seconds
+    """
+    match = re.match(r"^\s*(\d+(?:\.\d+)?)\s*([smhdw]?)\s*$", str(value), re.IGNORECASE)
+    if not match:
+        raise ConanException("Invalid age '%s', use a number of seconds or a number followed "
+                             "by s, m, h, d or w" % value)
+    return float(match.group(1)) * _AGE_UNITS[match.group(2).lower()]
+
+
+def _mb(size):
+    return "%.1f MB" % (size / (1024.0 * 1024.0))
+
+
+class _CacheItem(object):
+    """ A binary package, a build folder or a cached source() result of the local cache, that
+    can be evicted
+    """
+    def __init__(self, kind, package_ref, folder, size, last_access):
+        self.kind = kind  # "package", "build" or "sources"
+        self.package_ref = package_ref  # None for the "sources"
+        self.folder = folder
+        self.size = size
+        self.last_access = last_access
+
+    def __str__(self):
+        return "%s %s" % (self.kind, self.package_ref or os.path.basename(self.folder))
+
+
+def _cache_items(client_cache):
+    """ returns the total size of the store and the list of _CacheItem that can be evicted
+    """
+    store = client_cache.store
+    total = folder_size(store)
+    last_accesses = client_cache.cache_index.last_accesses()
+    items = []
+    for recipe_folder in client_cache.cache_index.recipe_folders():
+        reference = ConanFileReference(*recipe_folder.split("/"), validate=False)
+        for kind, parent, get_folder in (("package", client_cache.packages(reference),
+                                          client_cache.package),
+                                         ("build", client_cache.builds(reference),
+                                          client_cache.build)):
+            for item_id in list_folder_subdirs(parent, level=1):
+                package_ref = PackageReference(reference, item_id)
+                folder = get_folder(package_ref)
+                real_folder = get_folder(package_ref, short_paths=None)
+                size = folder_size(real_folder, exclusive=True)
+                if real_folder != folder:  # short_paths, not inside the store
+                    total += size
+                rel_path = os.path.relpath(folder, store).replace("\\", "/")
+                try:
+                    mtime = os.path.getmtime(folder)
+                except OSError:
+                    continue
+                last_access = max(last_accesses.get(rel_path, 0), mtime)
+                items.append(_CacheItem(kind, package_ref, folder, size, last_access))
+
+    # Restoring them updates their modification time
+    for entry in SourceCache(client_cache.source_cache_folder).entries():
+        size = folder_size(entry)
+        try:
+            last_access = os.path.getmtime(entry)
+        except OSError:
+            continue
+        total += size
+        items.append(_CacheItem("sources", None, entry, size, last_access))
+    return total, items
+
+
+def _remove_item(client_cache, item):
+    """ removes the item if it is not being used, returns True if removed
+    """
+    if item.kind == "sources":
+        return SourceCache(client_cache.source_cache_folder).remove(item.folder)
+    recipe_lock = client_cache.conanfile_write_lock(item.package_ref.conan)
+    if not recipe_lock.try_acquire():
+        return False
+    try:
+        package_lock = client_cache.package_lock(item.package_ref)
+        if not package_lock.try_acquire():
+            return False
+        try:
+            remover = DiskRemover(client_cache)
+            if item.kind == "package":
+                remover.remove_packages(item.package_ref.conan, [item.package_ref.package_id])
+            else:
+                remover.remove_builds(item.package_ref.conan, [item.package_ref.package_id])
+        finally:
+            package_lock.release()
+    finally:
+        recipe_lock.release()
+    client_cache.cache_index.forget([item.folder])
+    return True
+
+
+def cmd_cache_gc(client_cache, output, max_size=None, max_age=None):
+    """ evicts the least recently used binary packages, build folders and cached sources of the
+    local cache, the ones not used in max_age, and then the ones needed to reduce the cache to max_size.
+    The ones being used by other conan processes (locked) are skipped.
+    Returns {"removed": n, "reclaimed": bytes, "size": bytes}
+    """
+    if max_size is None and max_age is None:
+        raise ConanException("Specify --max-size and/or --max-age")
+    max_size = parse_size(max_size) if max_size is not None else None
+    max_age = parse_age(max_age) if max_age is not None else None
+
+    total, items = _cache_items(client_cache)
+    now = time.time()
+    removed, reclaimed = 0, 0
+    for item in sorted(items, key=lambda i: i.last_access):
+        expired = max_age is not None and now - item.last_access > max_age
+        oversized = max_size is not None and total > max_size
+        if not expired and not oversized:
+            break  # The following ones were used more recently
+        if not _remove_item(client_cache, item):
+            output.warn("Skipping %s, it is being used" % item)
+            continue
+        output.info("Removed %s (%s, last used %s)"
+                    % (item, _mb(item.size), time.strftime("%Y-%m-%d %H:%M",
+                                                           time.localtime(item.last_access))))
+        removed += 1
+        reclaimed += item.size
+        total -= item.size
+
+    # The files of the removed packages that were deduplicated are still in the blob store
+    BlobStore(client_cache.blobs_folder).purge()
+
+    output.success("Reclaimed %s removing %d folders, the cache size is %s"
+                   % (_mb(reclaimed), removed, _mb(total)))
+    if max_size is not None and total > max_size:
+        output.warn("The cache is still bigger than %s, only binary packages, build folders "
+                    "and cached sources are removed" % _mb(max_size))
+    return {"removed": removed, "reclaimed": reclaimed, "size": total}
@@ -1,8 +1,11 @@
 from conans.model.ref import PackageReference, ConanFileReference
 import os
-from conans.util.files import rmdir
+from conans.util.files import rmdir, copy_tree_linking
 import shutil
 from conans.errors import ConanException
+from conans.model.manifest import FileTreeManifest
+from conans.paths import CONAN_MANIFEST, CONANINFO
+from conans.util.concurrency import parallel_map
 from conans.client.loader_parse import load_conanfile_class
 from conans.client.source import complete_recipe_sources
 
@@ -28,7 +31,7 @@ def _get_package_ids(client_cache, reference, package_ids):
 
 
 def cmd_copy(reference, user_channel, package_ids, client_cache, user_io, remote_manager,
-             registry, force=False):
+             registry, force=False, link=None):
     """
     param package_ids: Falsey=do not copy binaries. True=All existing. []=list of ids
     """
@@ -37,11 +40,39 @@ def cmd_copy(reference, user_channel, package_ids, client_cache, user_io, remote
     short_paths = _prepare_sources(client_cache, src_ref, remote_manager, registry)
     package_ids = _get_package_ids(client_cache, src_ref, package_ids)
     package_copy(src_ref, user_channel, package_ids, client_cache, user_io,
-                 short_paths, force)
+                 short_paths, force, link)
+
+
+# Written by conan in place, they cannot be hardlinks to the origin ones
+_NOT_LINKED = (CONAN_MANIFEST, CONANINFO)
+
+
+def _copy_folder(src, dst, link):
+    if link:
+        excluded = _NOT_LINKED if link == "hardlink" else ()
+        copy_tree_linking(src, dst, link, excluded)
+    else:
+        shutil.copytree(src, dst, symlinks=True)
+
+
+def _check_manifest(folder, exports_sources_folder=None):
+    """ after linking, checks that the copied files are the expected ones
+    """
+    try:
+        expected = FileTreeManifest.load(folder)
+    except IOError:  # Nothing to check against
+        return
+    if FileTreeManifest.create(folder, exports_sources_folder) != expected:
+        raise ConanException("The manifest of the copy in %s doesn't match, remove it and "
+                             "copy again without --link" % folder)
 
 
 def package_copy(src_ref, user_channel, package_ids, paths, user_io,
-                 short_paths=False, force=False):
+                 short_paths=False, force=False, link=None):
+    """
+    param link: None to copy the files, "hardlink" or "reflink" to link them when the file
+    system allows it, checking the manifests of the copies afterwards
+    """
     dest_ref = ConanFileReference.loads("%s/%s@%s" % (src_ref.name,
                                                       src_ref.version,
                                                       user_channel))
@@ -55,17 +86,23 @@ def package_copy(src_ref, user_channel, package_ids, paths, user_io,
                                                      % str(dest_ref)):
             return
         rmdir(export_dest)
-    shutil.copytree(export_origin, export_dest, symlinks=True)
+    _copy_folder(export_origin, export_dest, link)
     user_io.out.info("Copied %s to %s" % (str(src_ref), str(dest_ref)))
+    cache_index = getattr(paths, "cache_index", None)
+    if cache_index is not None:
+        cache_index.recipe_changed(dest_ref)
 
     export_sources_origin = paths.export_sources(src_ref, short_paths)
     export_sources_dest = paths.export_sources(dest_ref, short_paths)
     if os.path.exists(export_sources_dest):
         rmdir(export_sources_dest)
-    shutil.copytree(export_sources_origin, export_sources_dest, symlinks=True)
+    _copy_folder(export_sources_origin, export_sources_dest, link)
+    if link:
+        _check_manifest(export_dest, export_sources_dest)
     user_io.out.info("Copied sources %s to %s" % (str(src_ref), str(dest_ref)))
 
-    # Copy packages
+    # Copy packages, the overrides are asked first, then they are copied concurrently
+    to_copy = []
     for package_id in package_ids:
         package_origin = PackageReference(src_ref, package_id)
         package_dest = PackageReference(dest_ref, package_id)
@@ -76,5 +113,21 @@ def package_copy(src_ref, user_channel, package_ids, paths, user_io,
                                                          " Override?" % str(package_id)):
                 continue
             rmdir(package_path_dest)
-        shutil.copytree(package_path_origin, package_path_dest, symlinks=True)
+        to_copy.append((package_id, package_path_origin, package_path_dest))
+
+    blob_store = getattr(paths, "blob_store", None)
+
+    def _copy_package(item):
+        _, package_path_origin, package_path_dest = item
+        if blob_store and not link:
+            return blob_store.copy_package(package_path_origin, package_path_dest)
+        _copy_folder(package_path_origin, package_path_dest, link)
+        if link:
+            _check_manifest(package_path_dest)
+
+    for (package_id, _, _), stats in zip(to_copy, parallel_map(_copy_package, to_copy)):
+        if stats:
+            stats.report(user_io.out)
+        if cache_index is not None:
+            cache_index.package_added(PackageReference(dest_ref, package_id))
         user_io.out.info("Copied %s to %s" % (str(package_id), str(dest_ref)))
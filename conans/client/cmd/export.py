@@ -5,7 +5,7 @@ to the local store, as an initial step before building or uploading to remotes
 import os
 import shutil
 
-from conans.client.cmd.export_linter import conan_linter
+from conans.client.cmd.export_linter import RecipeLinter
 from conans.client.file_copier import FileCopier
 from conans.client.loader_parse import load_conanfile_class
 from conans.client.output import ScopedOutput
@@ -45,7 +45,8 @@ def cmd_export(conanfile_path, name, version, user, channel, keep_source,
     """
     logger.debug("Exporting %s" % conanfile_path)
 
-    conan_linter(conanfile_path, output)
+    linter = RecipeLinter(conanfile_path, output, client_cache.lint_cache_folder)
+    linter.start()
     conanfile = _load_export_conanfile(conanfile_path, output, name, version)
     conan_ref = ConanFileReference(conanfile.name, conanfile.version, user, channel)
     conan_ref_str = str(conan_ref)
@@ -58,6 +59,8 @@ def cmd_export(conanfile_path, name, version, user, channel, keep_source,
     output = ScopedOutput(str(conan_ref), output)
     with client_cache.conanfile_write_lock(conan_ref):
         _export_conanfile(conanfile_path, output, client_cache, conanfile, conan_ref, keep_source)
+    client_cache.cache_index.recipe_changed(conan_ref)
+    linter.report()
 
 
 def _load_export_conanfile(conanfile_path, output, name, version):
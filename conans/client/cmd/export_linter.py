@@ -1,43 +1,202 @@
+import hashlib
 import json
 import os
 import sys
+import threading
 
 import platform
 
 from conans.client.output import Color
 from conans.errors import ConanException
 from subprocess import PIPE, Popen
-from conans import __path__ as root_path
+from conans import __path__ as root_path, __version__ as client_version
+from conans.util.files import load, save
+from conans.util.log import logger
 
 
-def conan_linter(conanfile_path, out):
+_LINT_ARGS = ['--py3k', "--enable=all", "--reports=no", "--disable=no-absolute-import",
+              "--persistent=no"]
+
+
+def _linter_enabled(out):
     if getattr(sys, 'frozen', False):
         out.info("No linter available. Use a pip installed conan for recipe linting")
-        return
+        return False
     apply_lint = os.environ.get("CONAN_RECIPE_LINTER", True)
-    if not apply_lint or apply_lint == "False":
-        return
+    return bool(apply_lint) and apply_lint != "False"
 
-    dir_path = os.path.dirname(root_path[0]).replace("\\", "/")
-    dirname = os.path.dirname(conanfile_path).replace("\\", "/")
-    hook = '--init-hook="import sys;sys.path.extend([\'%s\', \'%s\'])"' % (dirname, dir_path)
 
+def conan_linter(conanfile_path, out, cache_folder=None):
+    RecipeLinter(conanfile_path, out, cache_folder).start()
+
+
+class RecipeLinter(object):
+    """ Lints a recipe and reports the result. With CONAN_RECIPE_LINTER_ASYNC it lints in a
+    thread, so the export continues meanwhile, and the result is reported when report() is
+    called. The results are cached in cache_folder, if given, keyed by the recipe contents
+    and the linter configuration
+    """
+    def __init__(self, conanfile_path, out, cache_folder=None):
+        self._conanfile_path = conanfile_path
+        self._out = out
+        self._cache_folder = cache_folder
+        self._thread = None
+        self._result = None
+        self._error = None
+        self._reported = False
+
+    def start(self):
+        if not _linter_enabled(self._out):
+            return
+        # The linter errors must stop the export, so they are not checked asynchronously
+        lint_async = os.environ.get("CONAN_RECIPE_LINTER_ASYNC", "False") not in ("", "False")
+        if lint_async and not os.environ.get("CONAN_PYLINT_WERR", None):
+            self._thread = threading.Thread(target=self._lint)
+            self._thread.daemon = True
+            self._thread.start()
+        else:
+            self._lint()
+            self.report()
+
+    def _lint(self):
+        try:
+            self._result = lint_recipes([self._conanfile_path],
+                                        self._cache_folder)[self._conanfile_path]
+        except Exception as e:
+            self._error = e
+
+    def report(self):
+        if self._reported:
+            return
+        self._reported = True
+        if self._thread:
+            self._thread.join()
+        if self._error:
+            self._out.warn("Failed pylint: %s" % self._error)
+        elif self._result:
+            if _report(self._result, self._out) and os.environ.get("CONAN_PYLINT_WERR", None):
+                raise ConanException("Package recipe has linter errors. Please fix them.")
+
+
+def _report(result, out):
+    msgs, py3_msgs = result
+    if py3_msgs:
+        out.writeln("Python 3 incompatibilities\n    ERROR: %s"
+                    % "\n    ERROR: ".join(py3_msgs),
+                    front=Color.BRIGHT_MAGENTA)
+    if msgs:
+        out.writeln("Linter warnings\n    WARN: %s" % "\n    WARN: ".join(msgs),
+                    front=Color.MAGENTA)
+    return bool(msgs or py3_msgs)
+
+
+def lint_recipes_batch(conanfile_paths, out, cache_folder=None):
+    """ lints many recipes with a single pylint process, filling the cache, and reports
+    the result of every recipe. Returns the number of recipes with linter messages
+    """
+    if not _linter_enabled(out):
+        return 0
+    results = lint_recipes(conanfile_paths, cache_folder)
+    failed = 0
+    for conanfile_path in conanfile_paths:
+        if any(results[conanfile_path]):
+            failed += 1
+            out.info("%s:" % conanfile_path)
+            _report(results[conanfile_path], out)
+    return failed
+
+
+def _pylintrc():
+    pylintrc = os.environ.get("CONAN_PYLINTRC", None)
+    if pylintrc and not os.path.exists(pylintrc):
+        raise ConanException("File %s defined by PYLINTRC doesn't exist" % pylintrc)
+    return pylintrc
+
+
+def _local_modules(conanfile_path):
+    """ the python modules next to the recipe, that it can import as its folder is in the
+    linter sys.path: {module name: [files]}
+    """
+    folder = os.path.dirname(conanfile_path)
+    modules = {}
     try:
-        py3_msgs = None
-        msgs, py3_msgs = _normal_linter(conanfile_path, hook)
-    except Exception as e:
-        out.warn("Failed pylint: %s" % e)
-    else:
-        if py3_msgs:
-            out.writeln("Python 3 incompatibilities\n    ERROR: %s"
-                        % "\n    ERROR: ".join(py3_msgs),
-                        front=Color.BRIGHT_MAGENTA)
-        if msgs:
-            out.writeln("Linter warnings\n    WARN: %s" % "\n    WARN: ".join(msgs),
-                        front=Color.MAGENTA)
-        pylint_werr = os.environ.get("CONAN_PYLINT_WERR", None)
-        if pylint_werr and (py3_msgs or msgs):
-            raise ConanException("Package recipe has linter errors. Please fix them.")
+        names = sorted(os.listdir(folder))
+    except OSError:
+        return modules
+    for name in names:
+        path = os.path.join(folder, name)
+        if name.endswith(".py") and os.path.isfile(path):
+            if name != os.path.basename(conanfile_path):
+                modules[name[:-3]] = [path]
+        elif os.path.isfile(os.path.join(path, "__init__.py")):
+            files = []
+            for root, dirs, package_files in os.walk(path):
+                dirs[:] = sorted(d for d in dirs
+                                 if os.path.isfile(os.path.join(root, d, "__init__.py")))
+                files.extend(os.path.join(root, f) for f in sorted(package_files)
+                             if f.endswith(".py"))
+            modules[name] = files
+    return modules
+
+
+def _cache_key(conanfile_path, pylintrc):
+    """ the contents of the recipe and its local modules, and everything that changes the
+    linter messages
+    """
+    from conans.client.tools import which
+    sha = hashlib.sha256()
+    sha.update(load(conanfile_path, binary=True))
+    folder = os.path.dirname(conanfile_path)
+    for _, files in sorted(_local_modules(conanfile_path).items()):
+        for module_file in files:
+            sha.update(os.path.relpath(module_file, folder).replace("\\", "/").encode("utf-8"))
+            sha.update(load(module_file, binary=True))
+    if pylintrc:
+        sha.update(load(pylintrc, binary=True))
+    pylint = which("pylint")
+    pylint_stamp = os.path.getmtime(pylint) if pylint else None
+    sha.update(json.dumps([_LINT_ARGS, client_version, sys.version, pylint, pylint_stamp,
+                           os.path.dirname(conanfile_path)]).encode("utf-8"))
+    return sha.hexdigest()
+
+
+def lint_recipes(conanfile_paths, cache_folder=None):
+    """ returns {conanfile_path: (msgs, py3_msgs)}, running a single pylint for all
+    the recipes not in the cache
+    """
+    pylintrc = _pylintrc()
+    results = {}
+    keys = {}
+    for conanfile_path in conanfile_paths:
+        if cache_folder:
+            keys[conanfile_path] = _cache_key(conanfile_path, pylintrc)
+            try:
+                cached = json.loads(load(os.path.join(cache_folder, keys[conanfile_path])))
+                results[conanfile_path] = (cached["msgs"], cached["py3_msgs"])
+                continue
+            except (IOError, OSError, ValueError, KeyError):
+                pass
+        results[conanfile_path] = None
+
+    pending = [path for path in conanfile_paths if results[path] is None]
+    if pending:
+        # The recipes with local modules are linted alone, not to import the modules of
+        # other recipes with the same names, as all the folders are in the linter sys.path
+        batches = [[path] for path in pending if _local_modules(path)]
+        alone = set(path for batch in batches for path in batch)
+        batches.append([path for path in pending if path not in alone])
+        for batch in batches:
+            if batch:
+                results.update(_normal_linter(batch, pylintrc))
+        if cache_folder:
+            for conanfile_path in pending:
+                msgs, py3_msgs = results[conanfile_path]
+                try:
+                    save(os.path.join(cache_folder, keys[conanfile_path]),
+                         json.dumps({"msgs": msgs, "py3_msgs": py3_msgs}))
+                except (IOError, OSError) as e:
+                    logger.warning("Lint cache: couldn't store %s: %s" % (conanfile_path, e))
+    return results
 
 
 def _runner(args):
@@ -49,13 +208,17 @@ def _runner(args):
     return json.loads(stdout.decode("utf-8")) if stdout else {}
 
 
-def _normal_linter(conanfile_path, hook):
-    args = ['--py3k', "--enable=all", "--reports=no", "--disable=no-absolute-import", "--persistent=no",
-            hook, '"%s"' % conanfile_path]
-    pylintrc = os.environ.get("CONAN_PYLINTRC", None)
+def _normal_linter(conanfile_paths, pylintrc):
+    dir_path = os.path.dirname(root_path[0]).replace("\\", "/")
+    dirnames = []
+    for conanfile_path in conanfile_paths:
+        dirname = os.path.dirname(conanfile_path).replace("\\", "/")
+        if dirname not in dirnames:
+            dirnames.append(dirname)
+    hook = '--init-hook="import sys;sys.path.extend([%s])"' % ", ".join("'%s'" % d for d in
+                                                                     dirnames + [dir_path])
+    args = _LINT_ARGS + [hook] + ['"%s"' % path for path in conanfile_paths]
     if pylintrc:
-        if not os.path.exists(pylintrc):
-            raise ConanException("File %s defined by PYLINTRC doesn't exist" % pylintrc)
         args.append('--rcfile="%s"' % pylintrc)
 
     output_json = _runner(args)
@@ -81,10 +244,15 @@ def _normal_linter(conanfile_path, hook):
 
         return True
 
-    result = []
-    py3msgs = []
+    def _path(path):
+        return os.path.normcase(os.path.abspath(path))
+    results = {_path(path): ([], []) for path in conanfile_paths}
     for msg in output_json:
         if msg.get("type") in ("warning", "error"):
+            if len(conanfile_paths) == 1:
+                result, py3msgs = results[_path(conanfile_paths[0])]
+            else:
+                result, py3msgs = results.get(_path(msg.get("path", "")), ([], []))
             message_id = msg.get("symbol")
             if message_id in ("print-statement", "dict-iter-method"):
                 py3msgs.append("Py3 incompatibility. Line %s: %s"
@@ -92,4 +260,4 @@ def _normal_linter(conanfile_path, hook):
             elif _accept_message(msg):
                 result.append("Linter. Line %s: %s" % (msg.get("line"), msg.get("message")))
 
-    return result, py3msgs
+    return {path: results[_path(path)] for path in conanfile_paths}
@@ -20,8 +20,9 @@ class Search(object):
             # Deprecate: 2.0 can remove this check
             if 'all' not in (r.name for r in remotes):
                 references = {}
-                for remote in remotes:
-                    result = self._remote_manager.search_recipes(remote, pattern, ignorecase)
+                for remote, result in self._remote_manager.search_recipes_remotes(remotes,
+                                                                                  pattern,
+                                                                                  ignorecase):
                     if result:
                         references[remote.name] = result
                 return references
@@ -301,6 +301,10 @@ class Command(object):
         parser.add_argument("-j", "--json", default=None, action=OnceArgument,
                             help='Path to a json file where the install information will be '
                             'written')
+        parser.add_argument("--graph-timing", default=None, action=OnceArgument,
+                            help='Path to a json file where the time spent computing the '
+                            'dependency graph, per recipe and phase, will be written. The '
+                            'slowest ones are also printed')
 
         _add_common_install_arguments(parser, build_help=_help_build_policies)
 
@@ -321,7 +325,8 @@ class Command(object):
                                            build=args.build, profile_name=args.profile,
                                            update=args.update, generators=args.generator,
                                            no_imports=args.no_imports,
-                                           install_folder=args.install_folder)
+                                           install_folder=args.install_folder,
+                                           graph_timing=args.graph_timing)
             else:
                 info = self._conan.install_reference(reference, settings=args.settings,
                                                      options=args.options,
@@ -332,7 +337,8 @@ class Command(object):
                                                      build=args.build, profile_name=args.profile,
                                                      update=args.update,
                                                      generators=args.generator,
-                                                     install_folder=args.install_folder)
+                                                     install_folder=args.install_folder,
+                                                     graph_timing=args.graph_timing)
         except ConanException as exc:
             info = exc.info
             raise
@@ -375,6 +381,45 @@ class Command(object):
             verify_ssl = get_bool_from_text(args.verify_ssl)
             return self._conan.config_install(args.item, verify_ssl)
 
+    def cache(self, *args):
+        """Manages the local cache. Rebuilds the index of the local cache, used to speed up
+        searches, removes the least recently used binary packages, build folders and cached
+        sources, or lints
+        many recipes at once to cache the linter results of their next exports.
+        """
+        parser = argparse.ArgumentParser(description=self.cache.__doc__, prog="conan cache")
+        subparsers = parser.add_subparsers(dest='subcommand', help='sub-command help')
+        subparsers.add_parser('rebuild-index', help='Discard the index of the local cache and '
+                                                    'index again all the recipes and packages')
+        gc_subparser = subparsers.add_parser('gc', help='Remove the least recently used binary '
+                                                        'packages, build folders and cached '
+                                                        'sources')
+        gc_subparser.add_argument("--max-size", help="Remove packages, build folders and cached "
+                                  "sources until the cache is smaller than this size, e.g. "
+                                  "500M, 20G")
+        gc_subparser.add_argument("--max-age", help="Remove packages, build folders and cached "
+                                  "sources not used in this time, e.g. 12h, 30d")
+        lint_subparser = subparsers.add_parser('lint', help='Lint many recipes with a single '
+                                                            'linter process, caching the results')
+        lint_subparser.add_argument("paths", nargs="+", help="Paths to the conanfile.py files, "
+                                    "or to the folders containing them")
+        args = parser.parse_args(*args)
+
+        if args.subcommand == "rebuild-index":
+            summary = self._conan.cache_rebuild_index()
+            self._user_io.out.info("Indexed %d recipes and %d packages (%.1f MB)"
+                                   % (summary["recipes"], summary["packages"],
+                                      summary["size"] / (1024.0 * 1024.0)))
+            if summary["outdated"]:
+                self._user_io.out.warn("%d outdated entries were found in the previous index"
+                                       % summary["outdated"])
+        elif args.subcommand == "gc":
+            self._conan.cache_gc(max_size=args.max_size, max_age=args.max_age)
+        elif args.subcommand == "lint":
+            failed = self._conan.cache_lint(args.paths)
+            self._user_io.out.info("Linted %d recipes, %d with linter messages"
+                                   % (len(args.paths), failed))
+
     def info(self, *args):
         """Gets information about the dependency graph of a recipe. It can be used with a recipe
         or a reference for any existing package in your local cache.
@@ -757,13 +802,18 @@ class Command(object):
                             help='Copy all packages from the specified package recipe')
         parser.add_argument("--force", action='store_true', default=False,
                             help='Override destination packages and the package recipe')
+        parser.add_argument("--link", choices=["hardlink", "reflink"],
+                            help='Hardlink or reflink (copy-on-write) the files instead of '
+                                 'copying them, when the file system allows it. Hardlinked '
+                                 'files must not be modified')
         args = parser.parse_args(*args)
 
         if args.all and args.package:
             raise ConanException("Cannot specify both --all and --package")
 
         return self._conan.copy(reference=args.reference, user_channel=args.user_channel,
-                                force=args.force, packages=args.package or args.all)
+                                force=args.force, packages=args.package or args.all,
+                                link=args.link)
 
     def user(self, *parameters):
         """Authenticates against a remote with user/pass, caching the auth token. Useful to avoid
@@ -1082,7 +1132,7 @@ class Command(object):
                 ("Creator commands", ("new", "create", "upload", "export", "export-pkg", "test")),
                 ("Package development commands", ("source", "build", "package")),
                 ("Misc commands", ("profile", "remote", "user", "imports", "copy", "remove",
-                                   "alias", "download", "help"))]
+                                   "alias", "download", "cache", "help"))]
 
         def check_all_commands_listed():
             """Keep updated the main directory, raise if don't"""
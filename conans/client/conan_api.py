@@ -8,6 +8,7 @@ from conans import __version__ as client_version, tools
 from conans.client.cmd.create import create
 from conans.client.recorder.action_recorder import ActionRecorder
 from conans.client.client_cache import ClientCache
+from conans.client.graph.graph_profiler import GraphProfiler
 from conans.client.conf import MIN_SERVER_COMPATIBLE_VERSION, ConanClientConfigParser
 from conans.client.manager import ConanManager, existing_info_files
 from conans.client.migrations import ClientMigrator
@@ -83,10 +84,27 @@ def api_method(f):
             raise
         finally:
             os.chdir(curdir)
+            # The reference->remote associations, the remotes health and the cache folders
+            # usages are written once per command
+            _flush(the_self._user_io.out, "the remotes registry", the_self._registry.flush)
+            _flush(the_self._user_io.out, "the remotes health",
+                   the_self._remote_manager.remotes_health.save)
+            _flush(the_self._user_io.out, "the cache index",
+                   the_self._client_cache.cache_index.flush)
 
     return wrapper
 
 
+def _flush(output, name, flush):
+    """ A failure writing one of them doesn't prevent writing the others, nor hides the
+    exception of the command
+    """
+    try:
+        flush()
+    except Exception as exc:
+        output.warn("Couldn't save %s: %s" % (name, exception_message_safe(exc)))
+
+
 def _make_abs_path(path, cwd=None, default=None):
     """convert 'path' to absolute if necessary (could be already absolute)
     if not defined (empty, or None), will return 'default' one or 'cwd'
@@ -403,7 +421,8 @@ class ConanAPIV1(object):
     def install_reference(self, reference, settings=None, options=None, env=None,
                           remote=None, verify=None, manifests=None,
                           manifests_interactive=None, build=None, profile_name=None,
-                          update=False, generators=None, install_folder=None, cwd=None):
+                          update=False, generators=None, install_folder=None, cwd=None,
+                          graph_timing=None):
 
         try:
             recorder = ActionRecorder()
@@ -421,12 +440,18 @@ class ConanAPIV1(object):
 
             mkdir(install_folder)
             manager = self._init_manager(recorder)
-            manager.install(reference=reference, install_folder=install_folder,
-                            remote_name=remote, profile=profile, build_modes=build,
-                            update=update, manifest_folder=manifest_folder,
-                            manifest_verify=manifest_verify,
-                            manifest_interactive=manifest_interactive,
-                            generators=generators, install_reference=True)
+            graph_profiler = GraphProfiler() if graph_timing else None
+            try:
+                manager.install(reference=reference, install_folder=install_folder,
+                                remote_name=remote, profile=profile, build_modes=build,
+                                update=update, manifest_folder=manifest_folder,
+                                manifest_verify=manifest_verify,
+                                manifest_interactive=manifest_interactive,
+                                generators=generators, install_reference=True,
+                                graph_profiler=graph_profiler)
+            finally:
+                if graph_profiler:
+                    self._save_graph_timing(graph_profiler, graph_timing, cwd)
             return recorder.get_info()
         except ConanException as exc:
             recorder.error = True
@@ -437,7 +462,8 @@ class ConanAPIV1(object):
     def install(self, path="", settings=None, options=None, env=None,
                 remote=None, verify=None, manifests=None,
                 manifests_interactive=None, build=None, profile_name=None,
-                update=False, generators=None, no_imports=False, install_folder=None, cwd=None):
+                update=False, generators=None, no_imports=False, install_folder=None, cwd=None,
+                graph_timing=None):
 
         try:
             recorder = ActionRecorder()
@@ -451,23 +477,42 @@ class ConanAPIV1(object):
             profile = profile_from_args(profile_name, settings, options, env, cwd,
                                         self._client_cache)
             manager = self._init_manager(recorder)
-            manager.install(reference=conanfile_path,
-                            install_folder=install_folder,
-                            remote_name=remote,
-                            profile=profile,
-                            build_modes=build,
-                            update=update,
-                            manifest_folder=manifest_folder,
-                            manifest_verify=manifest_verify,
-                            manifest_interactive=manifest_interactive,
-                            generators=generators,
-                            no_imports=no_imports)
+            graph_profiler = GraphProfiler() if graph_timing else None
+            try:
+                manager.install(reference=conanfile_path,
+                                install_folder=install_folder,
+                                remote_name=remote,
+                                profile=profile,
+                                build_modes=build,
+                                update=update,
+                                manifest_folder=manifest_folder,
+                                manifest_verify=manifest_verify,
+                                manifest_interactive=manifest_interactive,
+                                generators=generators,
+                                no_imports=no_imports,
+                                graph_profiler=graph_profiler)
+            finally:
+                if graph_profiler:
+                    self._save_graph_timing(graph_profiler, graph_timing, cwd)
             return recorder.get_info()
         except ConanException as exc:
             recorder.error = True
             exc.info = recorder.get_info()
             raise
 
+    def _save_graph_timing(self, graph_profiler, graph_timing, cwd):
+        """ Also called when the install fails, a failure saving them doesn't hide its error
+        """
+        graph_profiler.print_summary(self._user_io.out)
+        path = _make_abs_path(graph_timing, cwd)
+        try:
+            graph_profiler.save(path)
+        except Exception as exc:
+            self._user_io.out.warn("Couldn't save the dependency graph timings to %s: %s"
+                                   % (path, exception_message_safe(exc)))
+        else:
+            self._user_io.out.info("Dependency graph timings written to %s" % path)
+
     @api_method
     def config_get(self, item):
         config_parser = ConanClientConfigParser(self._client_cache.conan_conf_path)
@@ -632,14 +677,47 @@ class ConanAPIV1(object):
                        packages_query=query, outdated=outdated)
 
     @api_method
-    def copy(self, reference, user_channel, force=False, packages=None):
+    def copy(self, reference, user_channel, force=False, packages=None, link=None):
         """
         param packages: None=No binaries, True=All binaries, else list of IDs
+        param link: None=copy the files, "hardlink" or "reflink" to link them if possible
         """
         from conans.client.cmd.copy import cmd_copy
         # FIXME: conan copy does not support short-paths in Windows
         cmd_copy(reference, user_channel, packages, self._client_cache,
-                 self._user_io, self._remote_manager, self._registry, force=force)
+                 self._user_io, self._remote_manager, self._registry, force=force, link=link)
+
+    @api_method
+    def cache_rebuild_index(self):
+        """ discards the local cache index and indexes all the store again
+        returns {"recipes": n, "packages": n, "size": bytes, "outdated": n}
+        """
+        return self._client_cache.cache_index.rebuild()
+
+    @api_method
+    def cache_gc(self, max_size=None, max_age=None):
+        """ removes the least recently used binary packages and build folders of the local cache
+        param max_size: maximum size of the cache, as "10G", "500M" or bytes
+        param max_age: remove the ones not used in this time, as "30d", "12h" or seconds
+        returns {"removed": n, "reclaimed": bytes, "size": bytes}
+        """
+        from conans.client.cmd.cache import cmd_cache_gc
+        return cmd_cache_gc(self._client_cache, self._user_io.out, max_size, max_age)
+
+    @api_method
+    def cache_lint(self, paths, cwd=None):
+        """ lints many recipes with a single linter process, storing the results in the lint
+        cache, so exporting them later doesn't run the linter again
+        returns the number of recipes with linter messages
+        """
+        from conans.client.cmd.export_linter import lint_recipes_batch
+        conanfile_paths = [_get_conanfile_path(path, cwd, py=True) for path in paths]
+        failed = lint_recipes_batch(conanfile_paths, self._user_io.out,
+                                    self._client_cache.lint_cache_folder)
+        if failed and get_env("CONAN_PYLINT_WERR", None):
+            raise ConanException("%d package recipes have linter errors. Please fix them."
+                                 % failed)
+        return failed
 
     @api_method
     def authenticate(self, name, password, remote=None):
@@ -813,7 +891,9 @@ def get_conan_runner():
     print_commands_to_output = get_env("CONAN_PRINT_RUN_COMMANDS", False)
     generate_run_log_file = get_env("CONAN_LOG_RUN_TO_FILE", False)
     log_run_to_output = get_env("CONAN_LOG_RUN_TO_OUTPUT", True)
-    runner = ConanRunner(print_commands_to_output, generate_run_log_file, log_run_to_output)
+    output_tail = get_env("CONAN_LOG_RUN_OUTPUT_TAIL", 0)
+    runner = ConanRunner(print_commands_to_output, generate_run_log_file, log_run_to_output,
+                         output_tail)
     return runner
 
 
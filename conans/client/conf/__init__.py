@@ -80,20 +80,30 @@ run_to_file = False         # environment CONAN_LOG_RUN_TO_FILE
 level = 50                  # environment CONAN_LOGGING_LEVEL
 # trace_file =              # environment CONAN_TRACE_FILE
 print_run_commands = False  # environment CONAN_PRINT_RUN_COMMANDS
+# run_output_tail = 200     # environment CONAN_LOG_RUN_OUTPUT_TAIL (only print to the console the last lines of the commands output)
 
 [general]
 default_profile = %s
 compression_level = 9                 # environment CONAN_COMPRESSION_LEVEL
 sysrequires_sudo = True               # environment CONAN_SYSREQUIRES_SUDO
 request_timeout = 60                  # environment CONAN_REQUEST_TIMEOUT (seconds)
+# remote_timeouts = https://myremote.com/*=10, http://localhost:9300/*=5  # environment CONAN_REMOTE_TIMEOUTS (seconds)
 # sysrequires_mode = enabled            # environment CONAN_SYSREQUIRES_MODE (allowed modes enabled/verify/disabled)
 # vs_installation_preference = Enterprise, Professional, Community, BuildTools # environment CONAN_VS_INSTALLATION_PREFERENCE
 # verbose_traceback = False           # environment CONAN_VERBOSE_TRACEBACK
 # bash_path = ""                      # environment CONAN_BASH_PATH (only windows)
 # recipe_linter = False               # environment CONAN_RECIPE_LINTER
+# recipe_linter_async = False         # environment CONAN_RECIPE_LINTER_ASYNC (lint while exporting, the results are printed at the end)
 # read_only_cache = True              # environment CONAN_READ_ONLY_CACHE
+# cache_dedup = False                 # environment CONAN_CACHE_DEDUP (needs read_only_cache, the deduplicated files are read-only)
+# build_folder_link = reflink         # environment CONAN_BUILD_FOLDER_LINK (reflink the sources into the build folders instead of copying them, copied if the file system doesn't support it)
+# imports_link = hardlink             # environment CONAN_IMPORTS_LINK (hardlink or reflink the imported files instead of copying them)
+# source_cache = False                # environment CONAN_SOURCE_CACHE (reuse the source() results of the same recipe and version, evicted by "conan cache gc")
+# download_cache = ~/.conan/download_cache # environment CONAN_DOWNLOAD_CACHE (tools.get/download files, can be shared by the users of the machine)
+# download_cache_max_size = 10G       # environment CONAN_DOWNLOAD_CACHE_MAX_SIZE (least recently used files evicted)
 # pylintrc = path/to/pylintrc_file    # environment CONAN_PYLINTRC
 # cache_no_locks = True
+# cache_lock_backend = fcntl          # "counter" (default) or "fcntl" (not Windows). All the clients sharing a cache must use the same
 # user_home_short = your_path         # environment CONAN_USER_HOME_SHORT
 # skip_vs_projects_upgrade = False    # environment CONAN_SKIP_VS_PROJECTS_UPGRADE
 # non_interactive = False             # environment CONAN_NON_INTERACTIVE
@@ -101,6 +111,7 @@ request_timeout = 60                  # environment CONAN_REQUEST_TIMEOUT (secon
 # conan_make_program = make           # environment CONAN_MAKE_PROGRAM (overrides the make program used in AutoToolsBuildEnvironment.make)
 
 # cmake_generator                     # environment CONAN_CMAKE_GENERATOR
+# compiler_launcher = ccache          # environment CONAN_COMPILER_LAUNCHER (ccache/sccache for CMake and AutoToolsBuildEnvironment, also in profiles [env])
 # http://www.vtk.org/Wiki/CMake_Cross_Compiling
 # cmake_toolchain_file                # environment CONAN_CMAKE_TOOLCHAIN_FILE
 # cmake_system_name                   # environment CONAN_CMAKE_SYSTEM_NAME
@@ -112,6 +123,8 @@ request_timeout = 60                  # environment CONAN_REQUEST_TIMEOUT (secon
 # cmake_find_root_path_mode_include   # environment CONAN_CMAKE_FIND_ROOT_PATH_MODE_INCLUDE
 
 # cpu_count = 1             # environment CONAN_CPU_COUNT
+# job_slots = 8             # environment CONAN_JOB_SLOTS (total build jobs of the concurrent builds of the machine)
+# job_slots_folder = /var/tmp/conan_job_slots # environment CONAN_JOB_SLOTS_FOLDER (same folder for all the conan homes sharing the slots)
 
 # Change the default location for building test packages to a temporary folder
 # which is deleted after the test.
@@ -122,6 +135,9 @@ request_timeout = 60                  # environment CONAN_REQUEST_TIMEOUT (secon
 # path beginning with "~" (if the environment var CONAN_USER_HOME is specified, this directory, even
 # with "~/", will be relative to the conan user home, not to the system user home)
 path = ~/.conan/data
+# Optional read-only store, pre-populated and shared by several users. The recipes and packages
+# not found in "path" are used from it, without copying them. Environment CONAN_SHARED_STORAGE_PATH
+# shared_path = /mnt/conan/data
 
 [proxies]
 # Empty section will try to use system proxies.
@@ -157,6 +173,7 @@ class ConanClientConfigParser(ConfigParser, object):
                "CONAN_LOGGING_LEVEL": self._env_c("log.level", "CONAN_LOGGING_LEVEL", "50"),
                "CONAN_TRACE_FILE": self._env_c("log.trace_file", "CONAN_TRACE_FILE", None),
                "CONAN_PRINT_RUN_COMMANDS": self._env_c("log.print_run_commands", "CONAN_PRINT_RUN_COMMANDS", "False"),
+               "CONAN_LOG_RUN_OUTPUT_TAIL": self._env_c("log.run_output_tail", "CONAN_LOG_RUN_OUTPUT_TAIL", None),
                "CONAN_COMPRESSION_LEVEL": self._env_c("general.compression_level", "CONAN_COMPRESSION_LEVEL", "9"),
                "CONAN_NON_INTERACTIVE": self._env_c("general.non_interactive", "CONAN_NON_INTERACTIVE", "False"),
                "CONAN_PYLINTRC": self._env_c("general.pylintrc", "CONAN_PYLINTRC", None),
@@ -164,14 +181,26 @@ class ConanClientConfigParser(ConfigParser, object):
                "CONAN_SYSREQUIRES_SUDO": self._env_c("general.sysrequires_sudo", "CONAN_SYSREQUIRES_SUDO", "False"),
                "CONAN_SYSREQUIRES_MODE": self._env_c("general.sysrequires_mode", "CONAN_SYSREQUIRES_MODE", "enabled"),
                "CONAN_REQUEST_TIMEOUT": self._env_c("general.request_timeout", "CONAN_REQUEST_TIMEOUT", None),
+               "CONAN_REMOTE_TIMEOUTS": self._env_c("general.remote_timeouts", "CONAN_REMOTE_TIMEOUTS", None),
                "CONAN_VS_INSTALLATION_PREFERENCE": self._env_c("general.vs_installation_preference", "CONAN_VS_INSTALLATION_PREFERENCE", None),
                "CONAN_RECIPE_LINTER": self._env_c("general.recipe_linter", "CONAN_RECIPE_LINTER", "True"),
+               "CONAN_RECIPE_LINTER_ASYNC": self._env_c("general.recipe_linter_async", "CONAN_RECIPE_LINTER_ASYNC", "False"),
                "CONAN_CPU_COUNT": self._env_c("general.cpu_count", "CONAN_CPU_COUNT", None),
+               "CONAN_JOB_SLOTS": self._env_c("general.job_slots", "CONAN_JOB_SLOTS", None),
+               "CONAN_JOB_SLOTS_FOLDER": self._env_c("general.job_slots_folder", "CONAN_JOB_SLOTS_FOLDER", None),
                "CONAN_READ_ONLY_CACHE": self._env_c("general.read_only_cache", "CONAN_READ_ONLY_CACHE", None),
+               "CONAN_CACHE_DEDUP": self._env_c("general.cache_dedup", "CONAN_CACHE_DEDUP", None),
+               "CONAN_BUILD_FOLDER_LINK": self._env_c("general.build_folder_link", "CONAN_BUILD_FOLDER_LINK", None),
+               "CONAN_IMPORTS_LINK": self._env_c("general.imports_link", "CONAN_IMPORTS_LINK", None),
+               "CONAN_SOURCE_CACHE": self._env_c("general.source_cache", "CONAN_SOURCE_CACHE", None),
+               "CONAN_DOWNLOAD_CACHE": self._env_c("general.download_cache", "CONAN_DOWNLOAD_CACHE", None),
+               "CONAN_DOWNLOAD_CACHE_MAX_SIZE": self._env_c("general.download_cache_max_size",
+                                                            "CONAN_DOWNLOAD_CACHE_MAX_SIZE", None),
                "CONAN_USER_HOME_SHORT": self._env_c("general.user_home_short", "CONAN_USER_HOME_SHORT", None),
                "CONAN_VERBOSE_TRACEBACK": self._env_c("general.verbose_traceback", "CONAN_VERBOSE_TRACEBACK", None),
                # http://www.vtk.org/Wiki/CMake_Cross_Compiling
                "CONAN_CMAKE_GENERATOR": self._env_c("general.cmake_generator", "CONAN_CMAKE_GENERATOR", None),
+               "CONAN_COMPILER_LAUNCHER": self._env_c("general.compiler_launcher", "CONAN_COMPILER_LAUNCHER", None),
                "CONAN_CMAKE_TOOLCHAIN_FILE": self._env_c("general.cmake_toolchain_file", "CONAN_CMAKE_TOOLCHAIN_FILE", None),
                "CONAN_CMAKE_SYSTEM_NAME": self._env_c("general.cmake_system_name", "CONAN_CMAKE_SYSTEM_NAME", None),
                "CONAN_CMAKE_SYSTEM_VERSION": self._env_c("general.cmake_system_version", "CONAN_CMAKE_SYSTEM_VERSION", None),
@@ -287,6 +316,13 @@ class ConanClientConfigParser(ConfigParser, object):
         except ConanException:
             return False
 
+    @property
+    def cache_lock_backend(self):
+        try:
+            return self.get_item("general.cache_lock_backend")
+        except ConanException:
+            return "counter"
+
     @property
     def storage(self):
         return dict(self.get_conf("storage"))
@@ -326,6 +362,17 @@ class ConanClientConfigParser(ConfigParser, object):
                 raise ConanException("Conan storage path has to be an absolute path")
         return result
 
+    @property
+    def shared_storage_path(self):
+        result = get_env('CONAN_SHARED_STORAGE_PATH', None)
+        if not result:
+            result = self.storage.get("shared_path")
+        if result:
+            result = conan_expand_user(result)
+            if not os.path.isabs(result):
+                raise ConanException("Conan shared storage path has to be an absolute path")
+        return result
+
     @property
     def proxies(self):
         """ optional field, might not exist
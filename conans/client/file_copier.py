@@ -1,9 +1,11 @@
 import os
 import fnmatch
 import shutil
-from collections import defaultdict
+import time
+from collections import defaultdict, OrderedDict
 
 from conans import tools
+from conans.util.concurrency import parallel_map
 
 
 def report_copied_files(copied, output):
@@ -43,6 +45,7 @@ class FileCopier(object):
         self._base_src = root_source_folder
         self._base_dst = root_destination_folder
         self._copied = []
+        self._walks = {}  # {(src, links): _Walk}, reused by the following calls
         self._excluded = [root_destination_folder]
         if excluded:
             self._excluded.append(excluded)
@@ -89,15 +92,51 @@ class FileCopier(object):
         """ return a list of the files matching the patterns
         The list will be relative path names wrt to the root src folder
         """
-        filenames = []
-        linked_folders = []
+        filenames, linked_folders = self._walk_files(src, links)
+
+        if ignore_case:
+            filenames = {f.lower(): f for f in filenames}
+            pattern = pattern.lower()
+
+        files_to_copy = fnmatch.filter(filenames, pattern)
+        if excludes:
+            if not isinstance(excludes, (tuple, list)):
+                excludes = (excludes, )
+            if ignore_case:
+                excludes = [e.lower() for e in excludes]
+            for exclude in excludes:
+                files_to_copy = [f for f in files_to_copy if not fnmatch.fnmatch(f, exclude)]
+
+        if ignore_case:
+            files_to_copy = [filenames[f] for f in files_to_copy]
+
+        return files_to_copy, linked_folders
+
+    def _walk_files(self, src, links):
+        """ the files and the linked folders (if links) of the src folder, relative to it.
+        The walks are kept, to answer the calls for the same folder or its subfolders without
+        walking it again, unless any of its directories was modified
+        """
+        src_path = os.path.normpath(src)
+        for (walk_src, walk_links), walk in list(self._walks.items()):
+            if walk_links == links and (src_path == walk_src or
+                                        src_path.startswith(os.path.join(walk_src, ""))):
+                if walk.modified():
+                    del self._walks[(walk_src, walk_links)]
+                    continue
+                result = walk.subfolder(src_path)
+                if result is not None:
+                    return result
+
+        walk = _Walk()
         for root, subfolders, files in os.walk(src, followlinks=True):
+            names = files + subfolders
             if root in self._excluded:
                 subfolders[:] = []
                 continue
 
             if links and os.path.islink(root):
-                linked_folders.append(os.path.relpath(root, src))
+                walk.add(root, None)
                 subfolders[:] = []
                 continue
             basename = os.path.basename(root)
@@ -110,29 +149,10 @@ class FileCopier(object):
                     subfolders.remove("build")
                 except:
                     pass
+            walk.add(root, files, names)
 
-            relative_path = os.path.relpath(root, src)
-            for f in files:
-                relative_name = os.path.normpath(os.path.join(relative_path, f))
-                filenames.append(relative_name)
-
-        if ignore_case:
-            filenames = {f.lower(): f for f in filenames}
-            pattern = pattern.lower()
-
-        files_to_copy = fnmatch.filter(filenames, pattern)
-        if excludes:
-            if not isinstance(excludes, (tuple, list)):
-                excludes = (excludes, )
-            if ignore_case:
-                excludes = [e.lower() for e in excludes]
-            for exclude in excludes:
-                files_to_copy = [f for f in files_to_copy if not fnmatch.fnmatch(f, exclude)]
-
-        if ignore_case:
-            files_to_copy = [filenames[f] for f in files_to_copy]
-
-        return files_to_copy, linked_folders
+        self._walks[(src_path, links)] = walk
+        return walk.subfolder(src_path) or ([], [])
 
     @staticmethod
     def _link_folders(src, dst, linked_folders):
@@ -154,12 +174,12 @@ class FileCopier(object):
             if not os.path.exists(abs_path):
                 os.remove(dst_link)
 
-    @staticmethod
-    def _copy_files(files, src, dst, keep_path, symlinks):
+    def _copy_files(self, files, src, dst, keep_path, symlinks):
         """ executes a multiple file copy from [(src_file, dst_file), (..)]
         managing symlinks if necessary
         """
         copied_files = []
+        regular_files = OrderedDict()  # {abs_dst_name: abs_src_name}
         for filename in files:
             abs_src_name = os.path.join(src, filename)
             filename = filename if keep_path else os.path.basename(filename)
@@ -175,7 +195,78 @@ class FileCopier(object):
                 except OSError:
                     pass
                 os.symlink(linkto, abs_dst_name)  # @UndefinedVariable
+                regular_files.pop(abs_dst_name, None)
             else:
-                shutil.copy2(abs_src_name, abs_dst_name)
+                # Without keep_path several files can go to the same destination, the last
+                # one wins, and it can't be copied concurrently with the others
+                regular_files.pop(abs_dst_name, None)
+                regular_files[abs_dst_name] = abs_src_name
             copied_files.append(abs_dst_name)
+        self._copy_regular_files([(abs_src_name, abs_dst_name)
+                                  for abs_dst_name, abs_src_name in regular_files.items()])
         return copied_files
+
+    def _copy_regular_files(self, files):
+        """ copies the [(abs_src_name, abs_dst_name), ...] regular files
+        """
+        parallel_map(lambda item: shutil.copy2(*item), files)
+
+
+class _Walk(object):
+    """ result of a FileCopier walk of a folder: the files of every directory, and the
+    modification times of the directories to know if it is still valid
+    """
+    def __init__(self):
+        self._folders = []  # [(root, files or None for the linked folders)]
+        self._mtimes = {}
+        self._recent = {}  # {root: names} of the directories modified right before the walk
+        self._subfolders = {}  # {src: (files, linked folders)}
+
+    def add(self, root, files, names=None):
+        root = os.path.normpath(root)
+        self._folders.append((root, files))
+        if files is not None:
+            mtime = os.stat(root).st_mtime
+            self._mtimes[root] = mtime
+            # Modified right now, it could change again without changing its mtime (resolution)
+            if time.time() - mtime < 2:
+                self._recent[root] = sorted(names or [])
+
+    def modified(self):
+        now = time.time()
+        for root, mtime in self._mtimes.items():
+            try:
+                if os.stat(root).st_mtime != mtime:
+                    return True
+                names = self._recent.get(root)
+                if names is not None:
+                    if sorted(os.listdir(root)) != names:
+                        return True
+                    if now - mtime >= 2:  # Following changes will change its mtime
+                        del self._recent[root]
+            except OSError:
+                return True
+        return False
+
+    def subfolder(self, src):
+        """ the (files, linked folders) of the src folder, or None if the walk didn't visit it
+        """
+        if src in self._subfolders:
+            return self._subfolders[src]
+        if not any(root == src for root, _ in self._folders):
+            return None
+        prefix = os.path.join(src, "")
+        filenames = []
+        linked_folders = []
+        for root, files in self._folders:
+            if root != src and not root.startswith(prefix):
+                continue
+            relative_path = os.path.relpath(root, src)
+            if files is None:
+                linked_folders.append(relative_path)
+                continue
+            for f in files:
+                relative_name = os.path.normpath(os.path.join(relative_path, f))
+                filenames.append(relative_name)
+        self._subfolders[src] = filenames, linked_folders
+        return filenames, linked_folders
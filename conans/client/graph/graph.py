@@ -1,3 +1,5 @@
+import time
+
 from conans.model.ref import PackageReference
 from conans.model.info import ConanInfo
 from conans.errors import conanfile_exception_formatter
@@ -101,7 +103,7 @@ class DepsGraph(object):
         src.add_edge(edge)
         dst.add_edge(edge)
 
-    def compute_package_ids(self):
+    def compute_package_ids(self, profiler=None):
         """ takes the exports from upper level and updates the imports
         right now also the imports are propagated, but should be checked
         E.g. Conan A, depends on B.  A=>B
@@ -110,11 +112,13 @@ class DepsGraph(object):
         A.imports.include_dirs = B.export.include_paths.
         Note the difference, include_paths used to compute full paths as the user
         defines export relative to its folder
+        @param profiler: optional GraphProfiler, to time the computation for every node
         """
         ordered = self.by_levels()
         for level in ordered:
             for node in level:
                 conanfile = node.conanfile
+                t1 = time.time()
                 neighbors = node.neighbors()
                 direct_reqs = []  # of PackageReference
                 indirect_reqs = set()   # of PackageReference, avoid duplicates
@@ -143,6 +147,8 @@ class DepsGraph(object):
                 # Once we are done, call package_id() to narrow and change possible values
                 with conanfile_exception_formatter(str(conanfile), "package_id"):
                     conanfile.package_id()
+                if profiler is not None:
+                    profiler.add(conanfile, "package_id", time.time() - t1)
         return ordered
 
     def direct_requires(self):
@@ -5,6 +5,7 @@ from conans.model.requires import Requirements
 from conans.model.ref import ConanFileReference
 from conans.errors import ConanException, conanfile_exception_formatter, ConanExceptionInUserConanfileMethod
 from conans.client.output import ScopedOutput
+from conans.client.tools.env import no_op
 from conans.util.log import logger
 from conans.client.graph.graph import DepsGraph, Node
 
@@ -12,11 +13,17 @@ from conans.client.graph.graph import DepsGraph, Node
 class DepsGraphBuilder(object):
     """ Responsible for computing the dependencies graph DepsGraph
     """
-    def __init__(self, proxy, output, loader, resolver):
+    def __init__(self, proxy, output, loader, resolver, profiler=None):
         self._proxy = proxy
         self._output = output
         self._loader = loader
         self._resolver = resolver
+        self._profiler = profiler  # Optional GraphProfiler, to time every node phase
+
+    def _phase(self, node, phase):
+        if self._profiler is None:
+            return no_op()
+        return self._profiler.phase(node, phase)
 
     def get_graph_updates_info(self, deps_graph):
         """
@@ -27,6 +34,8 @@ class DepsGraphBuilder(object):
                 for node in deps_graph.nodes}
 
     def load_graph(self, conanfile, check_updates, update):
+        if self._profiler is not None:
+            self._profiler.start()
         check_updates = check_updates or update
         dep_graph = DepsGraph()
         # compute the conanfile entry point for this dependency graph
@@ -41,8 +50,10 @@ class DepsGraphBuilder(object):
                         loop_ancestors, aliased, check_updates, update)
         logger.debug("Deps-builder: Time to load deps %s" % (time.time() - t1))
         t1 = time.time()
-        dep_graph.compute_package_ids()
+        dep_graph.compute_package_ids(self._profiler)
         logger.debug("Deps-builder: Propagate info %s" % (time.time() - t1))
+        if self._profiler is not None:
+            self._profiler.stop()
         return dep_graph
 
     def _resolve_deps(self, node, aliased, update):
@@ -50,6 +61,7 @@ class DepsGraphBuilder(object):
         # new_reqs is a shallow copy of what is propagated upstream, so changes done by the
         # RangeResolver are also done in new_reqs, and then propagated!
         conanfile, conanref = node.conanfile, node.conan_ref
+        self._resolver.prefetch(conanfile.requires.values(), update)
         for _, require in conanfile.requires.items():
             self._resolver.resolve(require, conanref, update)
 
@@ -83,7 +95,8 @@ class DepsGraphBuilder(object):
         # basic node configuration
         new_reqs, new_options = self._config_node(node, down_reqs, down_ref, down_options)
 
-        self._resolve_deps(node, aliased, update)
+        with self._phase(node.conanfile, "resolve_deps"):
+            self._resolve_deps(node, aliased, update)
 
         # Expand each one of the current requirements
         for name, require in node.conanfile.requires.items():
@@ -159,18 +172,20 @@ class DepsGraphBuilder(object):
                                     " Use config_options and configure")
                     with conanfile_exception_formatter(str(conanfile), "config"):
                         conanfile.config()
-                with conanfile_exception_formatter(str(conanfile), "config_options"):
-                    conanfile.config_options()
+                with self._phase(conanfile, "config_options"):
+                    with conanfile_exception_formatter(str(conanfile), "config_options"):
+                        conanfile.config_options()
                 conanfile.options.propagate_upstream(down_options, down_ref, conanref)
-                if hasattr(conanfile, "config"):
-                    with conanfile_exception_formatter(str(conanfile), "config"):
-                        conanfile.config()
+                with self._phase(conanfile, "configure"):
+                    if hasattr(conanfile, "config"):
+                        with conanfile_exception_formatter(str(conanfile), "config"):
+                            conanfile.config()
 
-                with conanfile_exception_formatter(str(conanfile), "configure"):
-                    conanfile.configure()
+                    with conanfile_exception_formatter(str(conanfile), "configure"):
+                        conanfile.configure()
 
-                conanfile.settings.validate()  # All has to be ok!
-                conanfile.options.validate()
+                    conanfile.settings.validate()  # All has to be ok!
+                    conanfile.options.validate()
 
                 # Update requirements (overwrites), computing new upstream
                 if hasattr(conanfile, "requirements"):
@@ -186,8 +201,9 @@ class DepsGraphBuilder(object):
                     else:
                         conanfile.requires = conanfile._original_requires.copy()
 
-                    with conanfile_exception_formatter(str(conanfile), "requirements"):
-                        conanfile.requirements()
+                    with self._phase(conanfile, "requirements"):
+                        with conanfile_exception_formatter(str(conanfile), "requirements"):
+                            conanfile.requirements()
 
                 new_options = conanfile.options.deps_package_values
                 new_down_reqs = conanfile.requires.update(down_reqs, self._output, conanref, down_ref)
@@ -204,12 +220,14 @@ class DepsGraphBuilder(object):
                          check_updates, update, alias_ref=None):
         """ creates and adds a new node to the dependency graph
         """
-        result = self._proxy.get_recipe(requirement.conan_reference,
-                                        check_updates, update)
+        with self._phase(requirement.conan_reference, "get_recipe"):
+            result = self._proxy.get_recipe(requirement.conan_reference,
+                                            check_updates, update)
         conanfile_path, remote = result
         output = ScopedOutput(str(requirement.conan_reference), self._output)
-        dep_conanfile = self._loader.load_conan(conanfile_path, output,
-                                                reference=requirement.conan_reference)
+        with self._phase(requirement.conan_reference, "load_conan"):
+            dep_conanfile = self._loader.load_conan(conanfile_path, output,
+                                                    reference=requirement.conan_reference)
 
         if getattr(dep_conanfile, "alias", None):
             alias_reference = alias_ref or requirement.conan_reference
@@ -0,0 +1,73 @@
+import json
+import time
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+
+from conans.util.files import save
+
+
+class GraphProfiler(object):
+    """ Opt-in instrumentation of the dependency graph computation. Records the accumulated wall
+    time spent by every node (recipe) in every phase: recipe retrieval and loading, the recipe
+    methods called to configure it, the version ranges resolution and the package_id computation.
+    A node can be evaluated several times (diamonds), so the times and calls are accumulated
+    """
+    def __init__(self):
+        self._times = defaultdict(lambda: defaultdict(float))  # {node: {phase: seconds}}
+        self._calls = defaultdict(lambda: defaultdict(int))  # {node: {phase: calls}}
+        self._start = time.time()
+        self._end = None
+
+    def start(self):
+        self._start = time.time()
+        self._end = None
+
+    def stop(self):
+        """ the graph is computed, the total time doesn't include what comes next (builds...)
+        """
+        self._end = time.time()
+
+    @contextmanager
+    def phase(self, node, phase):
+        t1 = time.time()
+        try:
+            yield
+        finally:
+            self.add(node, phase, time.time() - t1)
+
+    def add(self, node, phase, seconds):
+        node = str(node)
+        self._times[node][phase] += seconds
+        self._calls[node][phase] += 1
+
+    def top(self, number=10):
+        """ returns the [(seconds, node, phase, calls)] slowest measures, slowest first
+        """
+        result = [(seconds, node, phase, self._calls[node][phase])
+                  for node, phases in self._times.items()
+                  for phase, seconds in phases.items()]
+        result.sort(key=lambda measure: measure[0], reverse=True)
+        return result[:number]
+
+    def report(self):
+        nodes = OrderedDict()
+        phases = defaultdict(float)
+        for node in sorted(self._times):
+            node_phases = OrderedDict()
+            for phase, seconds in sorted(self._times[node].items()):
+                node_phases[phase] = {"time": seconds, "calls": self._calls[node][phase]}
+                phases[phase] += seconds
+            nodes[node] = {"time": sum(self._times[node].values()), "phases": node_phases}
+        end = self._end if self._end is not None else time.time()
+        return {"total_time": end - self._start,
+                "phases": OrderedDict(sorted(phases.items())),
+                "nodes": nodes}
+
+    def save(self, path):
+        save(path, json.dumps(self.report(), indent=4))
+
+    def print_summary(self, output, number=10):
+        top = self.top(number)
+        output.info("Dependency graph timings, %d slowest:" % len(top))
+        for seconds, node, phase, calls in top:
+            output.info("    %.3fs %s %s (%d calls)" % (seconds, node, phase, calls))
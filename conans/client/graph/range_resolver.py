@@ -1,15 +1,17 @@
+from collections import defaultdict
+
 from conans.model.ref import ConanFileReference
 from conans.errors import ConanException
 from conans.search.search import search_recipes
+from conans.util.concurrency import parallel_map
+from conans.util.log import logger
 
 
-def satisfying(list_versions, versionexpr, output):
-    """ returns the maximum version that satisfies the expression
-    if some version cannot be converted to loose SemVer, it is discarded with a msg
-    This provides some woraround for failing comparisons like "2.1" not matching "<=2.1"
+def _parse_versions(list_versions, output):
+    """ returns {SemVer: version} of the versions that can be converted to loose SemVer, the
+    other ones are discarded with a msg
     """
-    from semver import SemVer, max_satisfying
-    version_range = versionexpr.replace(",", " ")
+    from semver import SemVer
     candidates = {}
     for v in list_versions:
         try:
@@ -17,16 +19,100 @@ def satisfying(list_versions, versionexpr, output):
             candidates[ver] = v
         except (ValueError, AttributeError):
             output.warn("Version '%s' is not semver, cannot be compared with a range" % str(v))
+    return candidates
+
+
+def _max_satisfying(candidates, versionexpr):
+    from semver import max_satisfying
+    version_range = versionexpr.replace(",", " ")
     result = max_satisfying(candidates, version_range, loose=True)
     return candidates.get(result)
 
 
-class RangeResolver(object):
+def satisfying(list_versions, versionexpr, output):
+    """ returns the maximum version that satisfies the expression
+    if some version cannot be converted to loose SemVer, it is discarded with a msg
+    This provides some woraround for failing comparisons like "2.1" not matching "<=2.1"
+    """
+    return _max_satisfying(_parse_versions(list_versions, output), versionexpr)
+
+
+class _Candidates(object):
+    """ The references found for a search pattern, with their versions parsed to SemVer only
+    once, and the resolution of every range also computed once
+    """
+    def __init__(self, refs_found, output):
+        self._refs = {ref.version: ref for ref in refs_found or []}
+        self._output = output
+        self._semvers = None
+        self._resolved = {}  # {version_range: ref}
+
+    def __len__(self):
+        return len(self._refs)
 
+    def add(self, ref):
+        if ref.version not in self._refs:
+            self._refs[ref.version] = ref
+            self._semvers = None
+            self._resolved = {}
+
+    def resolve(self, version_range):
+        try:
+            return self._resolved[version_range]
+        except KeyError:
+            if self._semvers is None:
+                self._semvers = _parse_versions(self._refs, self._output)
+            result = self._refs.get(_max_satisfying(self._semvers, version_range))
+            self._resolved[version_range] = result
+            return result
+
+
+class RangeResolver(object):
+    """ The local and remote references found for every (name, user, channel) are cached, so they
+    are searched just once per command, no matter how many times they are required
+    """
     def __init__(self, output, client_cache, remote_search):
         self._output = output
         self._client_cache = client_cache
         self._remote_search = remote_search
+        self._local_refs = None  # {search_ref.lower(): [refs]} of the whole local store
+        self._local_found = {}  # {search_ref: _Candidates}
+        self._remote_found = {}  # {search_ref: _Candidates}
+
+    @staticmethod
+    def _search_ref(ref):
+        # The search pattern must be a string
+        return str(ConanFileReference(ref.name, "*", ref.user, ref.channel, validate=False))
+
+    def prefetch(self, requires, update):
+        """ concurrently searches in the remotes the references of the version ranges of the
+        given requirements that will need it, i.e. all of them if update, otherwise the ones that
+        cannot be resolved locally
+        """
+        search_refs = set()
+        for require in requires:
+            if require.version_range is None or require.is_resolved:
+                continue
+            search_ref = self._search_ref(require.conan_reference)
+            if search_ref in self._remote_found:
+                continue
+            if update or not self._resolve_local(search_ref, require.version_range):
+                search_refs.add(search_ref)
+        if len(search_refs) < 2:
+            return
+
+        def _search(search_ref):
+            try:
+                return search_ref, self._remote_search.search_remotes(search_ref, ignorecase=False,
+                                                                      concurrent=True)
+            except Exception as e:
+                # It will be searched again when resolved, raising there
+                logger.debug("Range resolver: prefetch of %s failed: %s" % (search_ref, str(e)))
+                return search_ref, None
+
+        for search_ref, remote_found in parallel_map(_search, sorted(search_refs)):
+            if remote_found is not None:
+                self._remote_found[search_ref] = _Candidates(remote_found, self._output)
 
     def resolve(self, require, base_conanref, update):
         version_range = require.version_range
@@ -35,7 +121,7 @@ class RangeResolver(object):
 
         if require.is_resolved:
             ref = require.conan_reference
-            resolved = self._resolve_version(version_range, [ref])
+            resolved = _Candidates([ref], self._output).resolve(version_range)
             if not resolved:
                 raise ConanException("Version range '%s' required by '%s' not valid for "
                                      "downstream requirement '%s'"
@@ -46,9 +132,7 @@ class RangeResolver(object):
                                      % (version_range, base_conanref, str(ref)))
             return
 
-        ref = require.conan_reference
-        # The search pattern must be a string
-        search_ref = str(ConanFileReference(ref.name, "*", ref.user, ref.channel))
+        search_ref = self._search_ref(require.conan_reference)
 
         if update:
             searches = (self._resolve_remote, self._resolve_local)
@@ -69,19 +153,31 @@ class RangeResolver(object):
                                  % (version_range, require))
 
     def _resolve_local(self, search_ref, version_range):
-        local_found = search_recipes(self._client_cache, search_ref)
+        local_found = self._local_found.get(search_ref)
+        if local_found is None:
+            if self._local_refs is None:
+                # A single walk of the store for all the ranges, searches are case insensitive
+                self._local_refs = defaultdict(list)
+                for ref in search_recipes(self._client_cache):
+                    self._local_refs[self._search_ref(ref).lower()].append(ref)
+            local_found = _Candidates(self._local_refs.get(search_ref.lower()), self._output)
+            self._local_found[search_ref] = local_found
         if local_found:
-            resolved_version = self._resolve_version(version_range, local_found)
+            resolved_version = local_found.resolve(version_range)
             if resolved_version:
                 return resolved_version
 
     def _resolve_remote(self, search_ref, version_range):
-        # We should use ignorecase=False, we want the exact case!
-        remote_found = self._remote_search.search_remotes(search_ref, ignorecase=False)
+        remote_found = self._remote_found.get(search_ref)
+        if remote_found is None:
+            # We should use ignorecase=False, we want the exact case!
+            remote_found = self._remote_search.search_remotes(search_ref, ignorecase=False)
+            remote_found = _Candidates(remote_found, self._output)
+            self._remote_found[search_ref] = remote_found
         if remote_found:
-            return self._resolve_version(version_range, remote_found)
-
-    def _resolve_version(self, version_range, refs_found):
-        versions = {ref.version: ref for ref in refs_found}
-        result = satisfying(versions, version_range, self._output)
-        return versions.get(result)
+            resolved = remote_found.resolve(version_range)
+            local_found = self._local_found.get(search_ref)
+            if resolved and local_found is not None:
+                # It will be retrieved, so it will be found locally from now on
+                local_found.add(resolved)
+            return resolved
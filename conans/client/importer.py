@@ -3,6 +3,7 @@ import fnmatch
 import os
 import stat
 import time
+from collections import OrderedDict
 
 from conans import tools
 from conans.client.file_copier import FileCopier, report_copied_files
@@ -10,8 +11,10 @@ from conans.client.output import ScopedOutput
 from conans.errors import ConanException
 from conans.model.conan_file import get_env_context_manager
 from conans.model.manifest import FileTreeManifest
+from conans.util.concurrency import parallel_map
 from conans.util.env_reader import get_env
-from conans.util.files import md5sum, load
+from conans.util.files import md5sum, load, link_or_copy
+from conans.util.log import logger
 
 IMPORTS_MANIFESTS = "conan_imports_manifest.txt"
 
@@ -51,14 +54,18 @@ def undo_imports(current_path, output):
         raise ConanException("Cannot remove manifest file (open or busy): %s" % manifest_path)
 
 
-def _report_save_manifest(copied_files, output, dest_folder, manifest_name):
+def _report_save_manifest(copied_files, output, dest_folder, manifest_name, file_sums=None):
     report_copied_files(copied_files, output)
     if copied_files:
         date = calendar.timegm(time.gmtime())
         file_dict = {}
+        file_sums = file_sums or {}
         for f in copied_files:
-            abs_path = os.path.join(dest_folder, f)
-            file_dict[f] = md5sum(abs_path)
+            file_md5 = file_sums.get(f)
+            if file_md5 is None:
+                abs_path = os.path.join(dest_folder, f)
+                file_md5 = md5sum(abs_path)
+            file_dict[f] = file_md5
         manifest = FileTreeManifest(date, file_dict)
         manifest.save(dest_folder, manifest_name)
 
@@ -71,10 +78,33 @@ def _make_files_writable(file_names):
         os.chmod(file_name, os.stat(file_name).st_mode | stat.S_IWRITE)
 
 
+def _load_imports_manifest(dest_folder):
+    manifest_path = os.path.join(dest_folder, IMPORTS_MANIFESTS)
+    if not os.path.exists(manifest_path):
+        return None
+    try:
+        return FileTreeManifest.loads(load(manifest_path))
+    except Exception as e:
+        logger.debug("Cannot load the previous imports manifest %s: %s" % (manifest_path, str(e)))
+        return None
+
+
+def _imports_link():
+    link = get_env("CONAN_IMPORTS_LINK", None)
+    if link and link not in ("hardlink", "reflink"):
+        raise ConanException("Invalid imports_link '%s', use 'hardlink' or 'reflink'" % link)
+    if link == "hardlink" and get_env("CONAN_READ_ONLY_CACHE", False):
+        # The imported files are made writable, that would change the cache files too
+        return None
+    return link
+
+
 def run_imports(conanfile, dest_folder, output):
     if not hasattr(conanfile, "imports"):
         return []
-    file_importer = _FileImporter(conanfile, dest_folder)
+    file_importer = _FileImporter(conanfile, dest_folder,
+                                  previous=_load_imports_manifest(dest_folder),
+                                  link=_imports_link())
     conanfile.copy = file_importer
     conanfile.imports_folder = dest_folder
     with get_env_context_manager(conanfile):
@@ -83,7 +113,10 @@ def run_imports(conanfile, dest_folder, output):
     copied_files = file_importer.copied_files
     _make_files_writable(copied_files)
     import_output = ScopedOutput("%s imports()" % output.scope, output)
-    _report_save_manifest(copied_files, import_output, dest_folder, IMPORTS_MANIFESTS)
+    if file_importer.unchanged:
+        import_output.info("Skipped %d unchanged imported files" % file_importer.unchanged)
+    _report_save_manifest(copied_files, import_output, dest_folder, IMPORTS_MANIFESTS,
+                          file_importer.file_sums)
     return copied_files
 
 
@@ -118,7 +151,8 @@ def run_deploy(conanfile, install_folder, output):
 
     copied_files = file_importer.copied_files
     copied_files.update(package_copied)
-    _report_save_manifest(copied_files, deploy_output, install_folder, "deploy_manifest.txt")
+    _report_save_manifest(copied_files, deploy_output, install_folder, "deploy_manifest.txt",
+                          file_importer.file_sums)
 
 
 class _FileImporter(object):
@@ -131,10 +165,17 @@ class _FileImporter(object):
     It can be also used for Golang projects, in which the packages are always
     source based and need to be copied to the user folder to be built
     """
-    def __init__(self, conanfile, dst_folder):
+    def __init__(self, conanfile, dst_folder, previous=None, link=None):
+        """ previous: manifest of the previous imports in dst_folder, its files are not copied
+        again if their source didn't change. link: "hardlink" or "reflink" the imported files
+        """
         self._conanfile = conanfile
         self._dst_folder = dst_folder
+        self._previous = previous.file_sums if previous else {}
+        self._link = link
         self.copied_files = set()
+        self.file_sums = {}  # md5 of the copied files, known without reading them again
+        self.unchanged = 0
 
     def __call__(self, pattern, dst="", src="", root_package=None, folder=False,
                  ignore_case=False, excludes=None, keep_path=True):
@@ -155,11 +196,39 @@ class _FileImporter(object):
         matching_paths = self._get_folders(root_package)
         for name, matching_path in matching_paths.items():
             final_dst_path = os.path.join(real_dst_folder, name) if folder else real_dst_folder
-            file_copier = FileCopier(matching_path, final_dst_path)
+            file_copier = _IncrementalCopier(matching_path, final_dst_path, self._copy_files)
             files = file_copier(pattern, src=src, links=True, ignore_case=ignore_case,
                                 excludes=excludes, keep_path=keep_path)
             self.copied_files.update(files)
 
+    def _copy_files(self, files):
+        """ copies (or links) in parallel the [(src, dst), ..] files, except the ones of the
+        previous imports whose source didn't change
+        """
+        # The last source wins for the same destination, it can't be written concurrently
+        files = OrderedDict((abs_dst_name, abs_src_name) for abs_src_name, abs_dst_name in files)
+        to_copy = []
+        for abs_dst_name, abs_src_name in files.items():
+            previous_md5 = self._previous.get(abs_dst_name)
+            if previous_md5 and _unchanged(abs_src_name, abs_dst_name):
+                self.file_sums[abs_dst_name] = previous_md5
+                self.unchanged += 1
+            else:
+                to_copy.append((abs_src_name, abs_dst_name))
+
+        def _copy(item):
+            abs_src_name, abs_dst_name = item
+            if os.path.lexists(abs_dst_name):
+                dst_stat = os.lstat(abs_dst_name)
+                # Don't write through a previous link to the cache
+                if self._link or dst_stat.st_nlink > 1 or stat.S_ISLNK(dst_stat.st_mode):
+                    os.remove(abs_dst_name)
+            link_or_copy(abs_src_name, abs_dst_name, self._link)
+            return md5sum(abs_dst_name)
+
+        for (_, abs_dst_name), file_md5 in zip(to_copy, parallel_map(_copy, to_copy)):
+            self.file_sums[abs_dst_name] = file_md5
+
     def _get_folders(self, pattern):
         """ given the current deps graph, compute a dict {name: store-path} of
         each dependency
@@ -168,3 +237,27 @@ class _FileImporter(object):
             return {pkg: cpp_info.rootpath for pkg, cpp_info in self._conanfile.deps_cpp_info.dependencies}
         return {pkg: cpp_info.rootpath for pkg, cpp_info in self._conanfile.deps_cpp_info.dependencies
                 if fnmatch.fnmatch(pkg, pattern)}
+
+
+def _unchanged(src, dst):
+    """ the dst file is the same as src, or a copy of it with its size and modification time
+    """
+    try:
+        if os.path.samefile(src, dst):
+            return True
+        src_stat, dst_stat = os.stat(src), os.stat(dst)
+    except OSError:
+        return False
+    return (src_stat.st_size == dst_stat.st_size and
+            abs(src_stat.st_mtime - dst_stat.st_mtime) < 1e-3)
+
+
+class _IncrementalCopier(FileCopier):
+    """ FileCopier that delegates the copy of the regular files to copy_files([(src, dst), ..])
+    """
+    def __init__(self, root_source_folder, root_destination_folder, copy_files):
+        super(_IncrementalCopier, self).__init__(root_source_folder, root_destination_folder)
+        self._copy_files_function = copy_files
+
+    def _copy_regular_files(self, files):
+        self._copy_files_function(files)
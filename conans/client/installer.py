@@ -11,7 +11,7 @@ from conans.model.env_info import EnvInfo
 from conans.model.user_info import UserInfo
 from conans.paths import CONANINFO, BUILD_INFO, RUN_LOG_NAME
 from conans.util.files import save, rmdir, mkdir, make_read_only, is_dirty,\
-    set_dirty, clean_dirty
+    set_dirty, clean_dirty, copy_tree_linking
 from conans.model.ref import PackageReference
 from conans.util.log import logger
 from conans.errors import (ConanException, conanfile_exception_formatter,
@@ -24,7 +24,7 @@ from conans.client.source import config_source, complete_recipe_sources
 from conans.util.env_reader import get_env
 from conans.client.importer import remove_imports
 
-from conans.util.tracer import log_package_built
+from conans.util.tracer import log_package_built, log_package_got_from_local_cache
 from conans.client.tools.env import pythonpath
 from conans.client.package_installer import get_package
 
@@ -71,9 +71,10 @@ class _ConanPackageBuilder(object):
         _handle_system_requirements(self._conan_file, self._package_reference,
                                     self._client_cache, self._out)
 
-        export_folder = self._client_cache.export(self._conan_ref)
+        export_folder = self._client_cache.export(self._conan_ref, layered=True)
         export_source_folder = self._client_cache.export_sources(self._conan_ref,
-                                                                 self._conan_file.short_paths)
+                                                                 self._conan_file.short_paths,
+                                                                 layered=True)
 
         try:
             rmdir(self.build_folder)
@@ -84,7 +85,8 @@ class _ConanPackageBuilder(object):
 
         self._out.info('Building your package in %s' % self.build_folder)
         config_source(export_folder, export_source_folder, self.source_folder,
-                      self._conan_file, self._out)
+                      self._conan_file, self._out,
+                      source_cache=self._client_cache.source_cache)
         self._out.info('Copying sources to build folder')
 
         if getattr(self._conan_file, 'no_copy_source', False):
@@ -97,9 +99,18 @@ class _ConanPackageBuilder(object):
             else:
                 ignore = None
 
-            shutil.copytree(self.source_folder, self.build_folder, symlinks=True, ignore=ignore)
-            logger.debug("Copied to %s", self.build_folder)
-            logger.debug("Files copied %s", os.listdir(self.build_folder))
+            link = get_env("CONAN_BUILD_FOLDER_LINK", None)
+            if link and ignore is None:
+                # Not hardlinks, a build writing a source file in place would modify it for
+                # every other build, the clones are copy-on-write
+                if link != "reflink":
+                    raise ConanException("Invalid build_folder_link '%s', use 'reflink'" % link)
+                linked = copy_tree_linking(self.source_folder, self.build_folder, link)
+                logger.debug("Linked %d files (%s) to %s", linked, link, self.build_folder)
+            else:
+                shutil.copytree(self.source_folder, self.build_folder, symlinks=True,
+                                ignore=ignore)
+                logger.debug("Copied to %s", self.build_folder)
             self._conan_file.source_folder = self.build_folder
 
     def build(self):
@@ -107,7 +118,16 @@ class _ConanPackageBuilder(object):
         if self._skip_build:
             return
         with get_env_context_manager(self._conan_file):
-            self._build_package()
+            with tools.environment_append(self._compiler_cache_env()):
+                self._build_package()
+
+    def _compiler_cache_env(self):
+        """ a compiler cache folder per package id, if the build uses a compiler launcher
+        """
+        if not get_env("CONAN_COMPILER_LAUNCHER") or get_env("CONAN_COMPILER_CACHE_DIR"):
+            return {}
+        folder = self._client_cache.compiler_cache(self._package_reference)
+        return {"CONAN_COMPILER_CACHE_DIR": folder}
 
     def package(self):
         """Generate the info txt files and calls the conanfile package method.
@@ -289,7 +309,8 @@ class ConanInstaller(object):
                 check_outdated = self._build_mode.outdated
 
                 package_folder = self._client_cache.package(package_reference,
-                                                            short_paths=conanfile.short_paths)
+                                                            short_paths=conanfile.short_paths,
+                                                            layered=True)
                 if self._remote_proxy.package_available(package_reference,
                                                         package_folder,
                                                         check_outdated):
@@ -326,6 +347,17 @@ class ConanInstaller(object):
             package_ref = PackageReference(conan_ref, package_id)
             package_folder = self._client_cache.package(package_ref,
                                                         conan_file.short_paths)
+            if not build_needed:
+                shared_folder = self._client_cache.package(package_ref, conan_file.short_paths,
+                                                           layered=True)
+                if shared_folder != package_folder:
+                    # In the read-only shared store, used from there, never updated
+                    output.success('Already installed!')
+                    log_package_got_from_local_cache(package_ref)
+                    self._recorder.package_fetched_from_cache(package_ref)
+                    self._propagate_info(node, inverse_levels, deps_graph)
+                    self._call_package_info(conan_file, shared_folder)
+                    continue
 
             with self._client_cache.package_lock(package_ref):
                 set_dirty(package_folder)
@@ -339,6 +371,8 @@ class ConanInstaller(object):
                 # Call the info method
                 self._call_package_info(conan_file, package_folder)
                 clean_dirty(package_folder)
+                # Last usage of the package, for the LRU "conan cache gc"
+                self._client_cache.cache_index.touch(self._client_cache.package(package_ref))
 
         # Finally, propagate information to root node (conan_ref=None)
         self._propagate_info(root_node, inverse_levels, deps_graph)
@@ -394,6 +428,10 @@ class ConanInstaller(object):
             else:
                 # Log build
                 self._log_built_package(builder.build_folder, package_ref, time.time() - t1)
+                self._client_cache.cache_index.touch(
+                    self._client_cache.build(builder.build_reference))
+                self._client_cache.cache_index.touch(self._client_cache.source(conan_ref))
+                self._client_cache.cache_index.package_added(package_ref)
                 self._built_packages.add((conan_ref, package_id))
 
     def _get_existing_package(self, conan_file, package_reference, output, package_folder, update):
@@ -487,6 +525,9 @@ class ConanInstaller(object):
                     if self._build_mode.forced(conan_file, conan_ref):
                         build_node = True
                     else:
+                        package_folder = self._client_cache.package(package_reference,
+                                                                    conan_file.short_paths,
+                                                                    layered=True)
                         available = self._remote_proxy.package_available(package_reference, package_folder,
                                                                          check_outdated)
                         build_node = not available
@@ -136,6 +136,10 @@ class ConanManager(object):
         else:
             packager.create_package(conanfile, pkg_id, source_folder, build_folder,
                                     dest_package_folder, install_folder, package_output, local=True)
+        blob_store = self._client_cache.blob_store
+        if blob_store:
+            blob_store.dedup(dest_package_folder).report(package_output)
+        self._client_cache.cache_index.package_added(pkg_reference)
 
     def download(self, reference, package_ids, remote_name, recipe):
         """ Download conanfile and specified packages to local repository
@@ -191,9 +195,10 @@ class ConanManager(object):
         conanfile._user = inject_require.user
         conanfile._channel = inject_require.channel
 
-    def _get_graph_builder(self, loader, remote_proxy):
+    def _get_graph_builder(self, loader, remote_proxy, graph_profiler=None):
         resolver = RangeResolver(self._user_io.out, self._client_cache, remote_proxy)
-        graph_builder = DepsGraphBuilder(remote_proxy, self._user_io.out, loader, resolver)
+        graph_builder = DepsGraphBuilder(remote_proxy, self._user_io.out, loader, resolver,
+                                         graph_profiler)
         return graph_builder
 
     def _get_deps_graph(self, reference, profile, remote_proxy, check_updates, update):
@@ -249,7 +254,7 @@ class ConanManager(object):
     def install(self, reference, install_folder, profile, remote_name=None, build_modes=None,
                 update=False, manifest_folder=None, manifest_verify=False,
                 manifest_interactive=False, generators=None, no_imports=False, inject_require=None,
-                install_reference=False, keep_build=False):
+                install_reference=False, keep_build=False, graph_profiler=None):
         """ Fetch and build all dependencies for the given reference
         @param reference: ConanFileReference or path to user space conanfile
         @param install_folder: where the output files will be saved
@@ -265,6 +270,7 @@ class ConanManager(object):
         written
         @param no_imports: Install specified packages but avoid running imports
         @param inject_require: Reference to add as a requirement to the conanfile
+        @param graph_profiler: Optional GraphProfiler to time the dependency graph computation
         """
 
         if generators is not False:
@@ -282,7 +288,7 @@ class ConanManager(object):
         conanfile = self._load_install_conanfile(loader, reference)
         if inject_require:
             self._inject_require(conanfile, inject_require)
-        graph_builder = self._get_graph_builder(loader, remote_proxy)
+        graph_builder = self._get_graph_builder(loader, remote_proxy, graph_profiler)
         deps_graph = graph_builder.load_graph(conanfile, False, update)
 
         if not isinstance(reference, ConanFileReference):
@@ -5,7 +5,8 @@ from requests.exceptions import RequestException
 from conans.client.output import ScopedOutput
 from conans.client.remover import DiskRemover
 from conans.client.recorder.action_recorder import INSTALL_ERROR_MISSING, INSTALL_ERROR_NETWORK
-from conans.errors import (ConanException, NotFoundException, NoRemoteAvailable)
+from conans.errors import (ConanException, NotFoundException, NoRemoteAvailable,
+                           ConanConnectionError)
 from conans.util.log import logger
 from conans.util.tracer import log_recipe_got_from_local_cache
 from conans.model.info import ConanInfo
@@ -99,6 +100,8 @@ class ConanProxy(object):
                             self._remote_manager.get_recipe(conan_reference, remote)
                             self._registry.set_ref(conan_reference, remote)
                             output.info("Updated!")
+                            # It might have been used from the shared store until now
+                            conanfile_path = self._client_cache.conanfile(conan_reference)
                     elif ret == -1:
                         if not update:
                             output.info("Current conanfile is newer than %s's one" % remote.name)
@@ -121,7 +124,8 @@ class ConanProxy(object):
         the local is newer than the remote"""
         if not conan_reference:
             return 0
-        read_manifest = FileTreeManifest.load(self._client_cache.export(conan_reference))
+        read_manifest = FileTreeManifest.load(self._client_cache.export(conan_reference,
+                                                                         layered=True))
         if read_manifest:
             try:  # get_conan_manifest can fail, not in server
                 remote, _ = self._get_remote(conan_reference)
@@ -169,8 +173,15 @@ class ConanProxy(object):
         remotes = self._registry.remotes
         if not remotes:
             raise ConanException("No remote defined")
-        for remote in remotes:
+        # The remotes are checked concurrently, but retrieved from the first one having it
+        for remote, found in self._remote_manager.find_recipe(conan_reference, remotes):
             logger.debug("Trying with remote %s" % remote.name)
+            if found is False:
+                output.info("Trying with '%s'..." % remote.name)
+                continue
+            if isinstance(found, ConanConnectionError):
+                output.info("Trying with '%s'..." % remote.name)
+                raise found
             try:
                 _retrieve_from_remote(remote)
                 return remote
@@ -211,13 +222,22 @@ class ConanProxy(object):
             self._registry.set_ref(package_ref.conan, remote)
         return result
 
-    def search_remotes(self, pattern=None, ignorecase=True):
+    def search_remotes(self, pattern=None, ignorecase=True, concurrent=False):
+        """ concurrent: called from several threads, the remotes are searched through their own
+        remote managers, that never ask the user for credentials
+        """
         if self._remote_name:
             remote = self._registry.remote(self._remote_name)
+            if concurrent:
+                searches = self._remote_manager.search_recipes_remotes([remote], pattern,
+                                                                       ignorecase, concurrent)
+                return next(iter(searches))[1]
             search_result = self._remote_manager.search_recipes(remote, pattern, ignorecase)
             return search_result
 
-        for remote in self._registry.remotes:
-            search_result = self._remote_manager.search_recipes(remote, pattern, ignorecase)
+        remotes = self._remote_manager.remotes_health.sort(self._registry.remotes)
+        for _, search_result in self._remote_manager.search_recipes_remotes(remotes, pattern,
+                                                                            ignorecase,
+                                                                            concurrent):
             if search_result:
                 return search_result
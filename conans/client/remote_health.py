@@ -0,0 +1,78 @@
+import json
+import threading
+import time
+
+import fasteners
+
+from conans.util.files import load, save
+from conans.util.log import logger
+
+
+class RemotesHealth(object):
+    """ Scoreboard of the remotes latency and consecutive failures (connection errors, timeouts),
+    persisted in the conan folder, so it is shared by consecutive commands. The remotes that
+    keep failing are demoted: they are tried after the healthy ones, until some time has passed
+    since their last failure
+    """
+    max_failures = 3  # Consecutive failures to demote a remote
+    demotion_time = 600  # seconds
+
+    def __init__(self, filename):
+        self._filename = filename
+        self._scores = None  # {remote_name: {"latency": seconds, "failures": n, "last_failure": t}}
+        self._changed = False
+        self._lock = threading.Lock()  # Updated from the threads calling the remotes
+
+    @property
+    def scores(self):
+        if self._scores is None:
+            try:
+                self._scores = json.loads(load(self._filename))
+            except IOError:
+                self._scores = {}
+            except ValueError:
+                logger.debug("Remotes health: corrupted file %s, discarding it" % self._filename)
+                self._scores = {}
+        return self._scores
+
+    def _score(self, remote_name):
+        return self.scores.setdefault(remote_name, {"latency": None, "failures": 0,
+                                                    "last_failure": None})
+
+    def success(self, remote_name, seconds):
+        with self._lock:
+            score = self._score(remote_name)
+            latency = score["latency"]
+            # Exponential moving average, so the latency follows the recent behavior
+            score["latency"] = seconds if latency is None else 0.8 * latency + 0.2 * seconds
+            score["failures"] = 0
+            self._changed = True
+
+    def failure(self, remote_name):
+        with self._lock:
+            score = self._score(remote_name)
+            score["failures"] += 1
+            score["last_failure"] = time.time()
+            self._changed = True
+
+    def demoted(self, remote_name):
+        score = self.scores.get(remote_name)
+        if not score or score["failures"] < self.max_failures:
+            return False
+        return time.time() - score["last_failure"] < self.demotion_time
+
+    def sort(self, remotes):
+        """ returns the remotes with the demoted ones at the end, keeping the order otherwise
+        """
+        healthy = [r for r in remotes if not self.demoted(r.name)]
+        if len(healthy) == len(remotes):
+            return list(remotes)
+        return healthy + [r for r in remotes if self.demoted(r.name)]
+
+    def save(self):
+        if not self._changed:
+            return
+        with self._lock:
+            with fasteners.InterProcessLock(self._filename + ".lock", logger=logger):
+                save(self._filename, json.dumps(self.scores, indent=4, sort_keys=True))
+            self._changed = False
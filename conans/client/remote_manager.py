@@ -5,7 +5,7 @@ import time
 import traceback
 import stat
 
-from requests.exceptions import ConnectionError
+from requests.exceptions import ConnectionError, RequestException
 
 from conans.errors import ConanException, ConanConnectionError, NotFoundException
 from conans.model.manifest import gather_files
@@ -22,16 +22,26 @@ from conans.util.tracer import (log_package_upload, log_recipe_upload,
                                 log_uncompressed_file, log_compressed_files, log_recipe_download,
                                 log_package_download)
 from conans.client.source import merge_directories
+from conans.client.remote_health import RemotesHealth
+from conans.util.concurrency import parallel_imap
 from conans.util.env_reader import get_env
 
 
 class RemoteManager(object):
     """ Will handle the remotes to get conans, packages etc """
 
-    def __init__(self, client_cache, auth_manager, output):
+    def __init__(self, client_cache, auth_manager, output, remotes_health=None):
         self._client_cache = client_cache
         self._output = output
         self._auth_manager = auth_manager
+        self.remotes_health = remotes_health or RemotesHealth(client_cache.remotes_health)
+
+    def _thread_copy(self):
+        """ The authentication manager keeps the state of the remote being called, so every
+        thread calling remotes concurrently needs its own RemoteManager
+        """
+        return RemoteManager(self._client_cache, self._auth_manager.non_interactive_copy(),
+                             self._output, self.remotes_health)
 
     def upload_recipe(self, conan_reference, remote, retry, retry_wait, ignore_deleted_file,
                       skip_upload=False, no_overwrite=None):
@@ -183,6 +193,7 @@ class RemoteManager(object):
         # Make sure that the source dir is deleted
         rm_conandir(self._client_cache.source(conan_reference))
         touch_folder(dest_folder)
+        self._client_cache.cache_index.recipe_changed(conan_reference)
 
     def get_recipe_sources(self, conan_reference, export_folder, export_sources_folder, remote):
         t1 = time.time()
@@ -229,8 +240,12 @@ class RemoteManager(object):
             unzip_and_get_files(zipped_files, dest_folder, PACKAGE_TGZ_NAME)
             # Issue #214 https://github.com/conan-io/conan/issues/214
             touch_folder(dest_folder)
+            blob_store = self._client_cache.blob_store
+            if blob_store:
+                blob_store.dedup(dest_folder).report(output)
             if get_env("CONAN_READ_ONLY_CACHE", False):
                 make_read_only(dest_folder)
+            self._client_cache.cache_index.package_added(package_reference)
             recorder.package_downloaded(package_reference, remote.url)
             output.success('Package installed %s' % package_id)
         except NotFoundException:
@@ -253,6 +268,58 @@ class RemoteManager(object):
         returns (dict str(conan_ref): {packages_info}"""
         return self._call_remote(remote, "search", pattern, ignorecase)
 
+    def search_recipes_remotes(self, remotes, pattern=None, ignorecase=True, concurrent=False):
+        """ Searches concurrently in the remotes, if there are several. Yields (remote, result) in
+        the given order, so the caller can stop at the first result, not waiting for the
+        remaining remotes. The ones that couldn't be searched from another thread (e.g. the user
+        has to enter the credentials) are searched again from this one.
+        concurrent: called from several threads, the remotes are only searched through their own
+        remote managers, that never ask the user for credentials
+        """
+        if not concurrent and len(remotes) < 2:
+            for remote in remotes:
+                yield remote, self.search_recipes(remote, pattern, ignorecase)
+            return
+
+        def _search(remote):
+            try:
+                return remote, self._thread_copy().search_recipes(remote, pattern, ignorecase)
+            except ConanConnectionError:
+                raise
+            except Exception as exc:
+                if concurrent:
+                    raise
+                logger.debug("Can't search in %s from a thread: %s" % (remote.name, str(exc)))
+                return remote, exc
+
+        for remote, result in parallel_imap(_search, remotes):
+            if isinstance(result, Exception):
+                result = self.search_recipes(remote, pattern, ignorecase)
+            yield remote, result
+
+    def find_recipe(self, conan_reference, remotes):
+        """ Checks concurrently if the remotes have the recipe. Yields (remote, found) with the
+        healthy remotes first, otherwise in the given order, where found is True, False
+        (not found), the ConanConnectionError if the remote couldn't be reached, or None if it
+        couldn't be checked (e.g. authentication is needed) and has to be retrieved to know
+        """
+        def _find(remote):
+            try:
+                self._thread_copy().get_conan_manifest(conan_reference, remote)
+                return remote, True
+            except NotFoundException:
+                return remote, False
+            except ConanConnectionError as exc:
+                return remote, exc
+            except Exception as exc:
+                logger.debug("Can't check %s in %s: %s" % (conan_reference, remote.name, str(exc)))
+                return remote, None
+
+        remotes = self.remotes_health.sort(remotes)
+        if len(remotes) < 2:  # Nothing to do concurrently, it will be directly retrieved
+            return [(remote, None) for remote in remotes]
+        return parallel_imap(_find, remotes)
+
     def search_packages(self, remote, reference, query):
         return self._call_remote(remote, "search_packages", reference, query)
 
@@ -276,16 +343,23 @@ class RemoteManager(object):
 
     def _call_remote(self, remote, method, *argc, **argv):
         self._auth_manager.remote = remote
+        t1 = time.time()
         try:
-            return getattr(self._auth_manager, method)(*argc, **argv)
+            result = getattr(self._auth_manager, method)(*argc, **argv)
         except ConnectionError as exc:
+            self.remotes_health.failure(remote.name)
             raise ConanConnectionError("%s\n\nUnable to connect to %s=%s"
                                        % (str(exc), remote.name, remote.url))
         except ConanException as exc:
+            self.remotes_health.success(remote.name, time.time() - t1)
             raise exc.__class__("%s. [Remote: %s]" % (exception_message_safe(exc), remote.name))
         except Exception as exc:
+            if isinstance(exc, RequestException):  # Timeouts
+                self.remotes_health.failure(remote.name)
             logger.error(traceback.format_exc())
             raise ConanException(exc)
+        self.remotes_health.success(remote.name, time.time() - t1)
+        return result
 
 
 def _compress_recipe_files(files, symlinks, src_files, src_symlinks, dest_folder, output):
@@ -17,11 +17,27 @@ Remote = namedtuple("Remote", "name url verify_ssl")
 class RemoteRegistry(object):
     """ conan_ref: remote
     remote is (name, url)
+    The file is parsed once and kept in memory, it is only read again if its modification time or
+    size change. The reference->remote associations done by set_ref() are kept in memory and
+    written with flush(), once per command, instead of rewriting the whole file for each one
     """
     def __init__(self, filename, output):
         self._filename = filename
         self._output = output
         self._remotes = None
+        self._loaded = None  # (remotes, refs) as in the file, must not be modified
+        self._loaded_signature = None
+        self._pending_refs = {}  # {reference: remote_name} not yet written
+
+    def _lock(self):
+        return fasteners.InterProcessLock(self._filename + ".lock", logger=logger)
+
+    def _signature(self):
+        try:
+            st = os.stat(self._filename)
+        except OSError:
+            return None
+        return st.st_mtime, st.st_size
 
     def _parse(self, contents):
         remotes = OrderedDict()
@@ -62,17 +78,57 @@ class RemoteRegistry(object):
         return text
 
     def _load(self):
-        try:
-            contents = load(self._filename)
-        except:
-            self._output.warn("Remotes registry file missing, creating default one in %s"
-                              % self._filename)
-            contents = default_remotes
-            save(self._filename, contents)
-        return self._parse(contents)
+        """ must be called with the lock acquired. Returns the file (remotes, refs), that must
+        not be modified, parsing it only if it changed since last read or written
+        """
+        signature = self._signature()
+        if self._loaded is None or signature is None or signature != self._loaded_signature:
+            try:
+                contents = load(self._filename)
+            except:
+                self._output.warn("Remotes registry file missing, creating default one in %s"
+                                  % self._filename)
+                contents = default_remotes
+                save(self._filename, contents)
+                signature = self._signature()
+            self._loaded = self._parse(contents)
+            self._loaded_signature = signature
+            self._remotes = None
+        return self._loaded
+
+    def _load_copy(self):
+        """ must be called with the lock acquired. Returns a copy of (remotes, refs) that can be
+        modified and saved, including the pending references to still existing remotes
+        """
+        remotes, refs = self._load()
+        refs = dict(refs)
+        refs.update({ref: remote for ref, remote in self._pending_refs.items()
+                     if remote in remotes})
+        return OrderedDict(remotes), refs
+
+    def _cached(self):
+        """ same as _load(), but without locking if the file didn't change
+        """
+        if self._loaded is None or self._signature() != self._loaded_signature:
+            with self._lock():
+                return self._load()
+        return self._loaded
 
     def _save(self, remotes, refs):
         save(self._filename, self._to_string(remotes, refs))
+        self._loaded = remotes, refs
+        self._loaded_signature = self._signature()
+        self._remotes = None
+        self._pending_refs = {}
+
+    def flush(self):
+        """ writes the pending reference->remote associations to the file
+        """
+        if not self._pending_refs:
+            return
+        with self._lock():
+            remotes, refs = self._load_copy()
+            self._save(remotes, refs)
 
     @property
     def default_remote(self):
@@ -94,32 +150,37 @@ class RemoteRegistry(object):
 
     @property
     def _remote_dict(self):
+        remotes, _ = self._cached()
         if self._remotes is None:
-            with fasteners.InterProcessLock(self._filename + ".lock", logger=logger):
-                remotes, _ = self._load()
-                self._remotes = OrderedDict([(ref, Remote(ref, remote, verify_ssl))
-                                             for ref, (remote, verify_ssl) in remotes.items()])
+            self._remotes = OrderedDict([(ref, Remote(ref, remote, verify_ssl))
+                                         for ref, (remote, verify_ssl) in remotes.items()])
         return self._remotes
 
     @property
     def refs(self):
-        with fasteners.InterProcessLock(self._filename + ".lock", logger=logger):
-            _, refs = self._load()
-            return refs
+        _, refs = self._cached()
+        refs = dict(refs)
+        refs.update(self._pending_refs)
+        return refs
+
+    def _ref_remote_name(self, conan_reference):
+        try:
+            return self._pending_refs[conan_reference]
+        except KeyError:
+            _, refs = self._cached()
+            return refs.get(conan_reference)
 
     def get_ref(self, conan_reference):
-        with fasteners.InterProcessLock(self._filename + ".lock", logger=logger):
-            remotes, refs = self._load()
-            remote_name = refs.get(str(conan_reference))
-            try:
-                return Remote(remote_name, remotes[remote_name][0], remotes[remote_name][1])
-            except:
-                return None
+        remote_name = self._ref_remote_name(str(conan_reference))
+        try:
+            return self._remote_dict[remote_name]
+        except KeyError:
+            return None
 
     def remove_ref(self, conan_reference, quiet=False):
-        with fasteners.InterProcessLock(self._filename + ".lock", logger=logger):
+        with self._lock():
             conan_reference = str(conan_reference)
-            remotes, refs = self._load()
+            remotes, refs = self._load_copy()
             try:
                 del refs[conan_reference]
                 self._save(remotes, refs)
@@ -129,16 +190,16 @@ class RemoteRegistry(object):
                                       % conan_reference)
 
     def set_ref(self, conan_reference, remote):
-        with fasteners.InterProcessLock(self._filename + ".lock", logger=logger):
-            conan_reference = str(conan_reference)
-            remotes, refs = self._load()
-            refs[conan_reference] = remote.name
-            self._save(remotes, refs)
+        """ The association is written by flush()
+        """
+        conan_reference = str(conan_reference)
+        if self._ref_remote_name(conan_reference) != remote.name:
+            self._pending_refs[conan_reference] = remote.name
 
     def add_ref(self, conan_reference, remote):
-        with fasteners.InterProcessLock(self._filename + ".lock", logger=logger):
+        with self._lock():
             conan_reference = str(conan_reference)
-            remotes, refs = self._load()
+            remotes, refs = self._load_copy()
             if conan_reference in refs:
                 raise ConanException("%s already exists. Use update" % conan_reference)
             if remote not in remotes:
@@ -147,9 +208,9 @@ class RemoteRegistry(object):
             self._save(remotes, refs)
 
     def update_ref(self, conan_reference, remote):
-        with fasteners.InterProcessLock(self._filename + ".lock", logger=logger):
+        with self._lock():
             conan_reference = str(conan_reference)
-            remotes, refs = self._load()
+            remotes, refs = self._load_copy()
             if conan_reference not in refs:
                 raise ConanException("%s does not exist. Use add" % conan_reference)
             if remote not in remotes:
@@ -158,9 +219,8 @@ class RemoteRegistry(object):
             self._save(remotes, refs)
 
     def _upsert(self, remote_name, url, verify_ssl, insert):
-        self._remotes = None  # invalidate cached remotes
-        with fasteners.InterProcessLock(self._filename + ".lock", logger=logger):
-            remotes, refs = self._load()
+        with self._lock():
+            remotes, refs = self._load_copy()
             # Remove duplicates
             remotes.pop(remote_name, None)
             remotes_list = []
@@ -199,9 +259,8 @@ class RemoteRegistry(object):
         self._add_update(remote_name, url, verify_ssl, exists_function, insert)
 
     def remove(self, remote_name):
-        self._remotes = None  # invalidate cached remotes
-        with fasteners.InterProcessLock(self._filename + ".lock", logger=logger):
-            remotes, refs = self._load()
+        with self._lock():
+            remotes, refs = self._load_copy()
             if remote_name not in remotes:
                 raise ConanException("Remote '%s' not found in remotes" % remote_name)
             del remotes[remote_name]
@@ -215,9 +274,8 @@ class RemoteRegistry(object):
         self._add_update(remote_name, url, verify_ssl, exists_function, insert)
 
     def rename(self, remote_name, new_remote_name):
-        self._remotes = None  # invalidate cached remotes
-        with fasteners.InterProcessLock(self._filename + ".lock", logger=logger):
-            remotes, refs = self._load()
+        with self._lock():
+            remotes, refs = self._load_copy()
             if remote_name not in remotes:
                 raise ConanException("Remote '%s' not found in remotes" % remote_name)
             new_remotes = OrderedDict()
@@ -231,9 +289,8 @@ class RemoteRegistry(object):
             self._save(remotes, refs)
 
     def define_remotes(self, remotes):
-        self._remotes = None  # invalidate cached remotes
-        with fasteners.InterProcessLock(self._filename + ".lock", logger=logger):
-            _, refs = self._load()
+        with self._lock():
+            _, refs = self._load_copy()
             new_remotes = OrderedDict()
             for remote in remotes:
                 new_remotes[remote.name] = (remote.url, remote.verify_ssl)
@@ -241,9 +298,8 @@ class RemoteRegistry(object):
             self._save(new_remotes, refs)
 
     def _add_update(self, remote_name, url, verify_ssl, exists_function, insert=None):
-        self._remotes = None  # invalidate cached remotes
-        with fasteners.InterProcessLock(self._filename + ".lock", logger=logger):
-            remotes, refs = self._load()
+        with self._lock():
+            remotes, refs = self._load_copy()
             exists_function(remotes)
             urls = {r[0]: name for name, r in remotes.items() if name != remote_name}
             if url in urls:
@@ -12,6 +12,7 @@ from conans.search.search import filter_outdated, search_recipes,\
 class DiskRemover(object):
     def __init__(self, paths):
         self._paths = paths
+        self._cache_index = getattr(paths, "cache_index", None)
 
     def _remove(self, path, conan_ref, msg=""):
         try:
@@ -44,6 +45,8 @@ class DiskRemover(object):
                 os.remove(f)
             except OSError:
                 pass
+        if self._cache_index is not None:
+            self._cache_index.recipe_changed(conan_ref)
 
     def remove_src(self, conan_ref):
         self._remove(self._paths.source(conan_ref), conan_ref, "src folder")
@@ -68,6 +71,8 @@ class DiskRemover(object):
                 self._remove(os.path.join(path, package), conan_ref, "package folder:%s" % package)
             self._remove(path, conan_ref, "packages")
             self._remove_file(self._paths.system_reqs(conan_ref), conan_ref, SYSTEM_REQS)
+            if self._cache_index is not None:
+                self._cache_index.packages_removed(conan_ref)
         else:
             for id_ in ids_filter:  # remove just the specified packages
                 package_ref = PackageReference(conan_ref, id_)
@@ -76,6 +81,8 @@ class DiskRemover(object):
                 self._remove_file(pkg_folder + ".dirty", conan_ref, "dirty flag")
                 self._remove_file(self._paths.system_reqs_package(package_ref),
                                   conan_ref, "%s/%s" % (id_, SYSTEM_REQS))
+            if self._cache_index is not None:
+                self._cache_index.packages_removed(conan_ref, ids_filter)
 
 
 class ConanRemover(object):
@@ -17,6 +17,8 @@ from uuid import getnode as get_mac
 import hashlib
 from conans.util.log import logger
 from conans.client.cmd.user import update_localdb
+from conans.client.store.localdb import LocalDB
+from conans.client.userio import UserIO
 
 
 def input_credentials_if_unauthorized(func):
@@ -101,6 +103,14 @@ class ConanApiAuthManager(object):
         self._rest_client.verify_ssl = remote.verify_ssl
         self.user, self._rest_client.token = self._localdb.get_login(remote.url)
 
+    def non_interactive_copy(self):
+        """ an equivalent manager to call remotes from other threads: it has its own rest client
+        and local database connection, and it never asks the user for credentials
+        """
+        user_io = UserIO(out=self._user_io.out)
+        user_io.disable_input()
+        return ConanApiAuthManager(self._rest_client.copy(), user_io, LocalDB(self._localdb.dbfile))
+
     def _store_login(self, login):
         try:
             self._localdb.set_login(login, self._remote.url)
@@ -1,6 +1,7 @@
 import fnmatch
 import os
 
+from conans.errors import ConanException
 from conans.util.files import save
 
 
@@ -53,10 +54,29 @@ class ConanRequester(object):
         if self.proxies:
             if not self._should_skip_proxy(url):
                 kwargs["proxies"] = self.proxies
-        if self._timeout_seconds:
-            kwargs["timeout"] = self._timeout_seconds
+        timeout = self._remote_timeout(url) or self._timeout_seconds
+        if timeout:
+            kwargs["timeout"] = timeout
         return kwargs
 
+    @staticmethod
+    def _remote_timeout(url):
+        """ CONAN_REMOTE_TIMEOUTS="url_pattern=seconds, ..." overrides the request timeout for
+        the matching remotes, so a slow or unreachable one doesn't delay the others for too long
+        """
+        remote_timeouts = os.getenv("CONAN_REMOTE_TIMEOUTS")
+        if not remote_timeouts:
+            return None
+        for entry in remote_timeouts.split(","):
+            pattern, _, seconds = entry.strip().rpartition("=")
+            if pattern and fnmatch.fnmatch(url, pattern):
+                try:
+                    return float(seconds)
+                except ValueError:
+                    raise ConanException("Specify a numeric timeout for '%s' in "
+                                         "'remote_timeouts'" % pattern)
+        return None
+
     def get(self, url, **kwargs):
         return self._requester.get(url, **self._add_kwargs(url, kwargs))
 
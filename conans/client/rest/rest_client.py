@@ -84,6 +84,13 @@ class RestApiClient(object):
     def auth(self):
         return JWTAuth(self.token)
 
+    def copy(self):
+        """ a new client with the same configuration, but independent remote and token state
+        """
+        result = RestApiClient(self._output, self.requester, self._put_headers)
+        result.custom_headers = dict(self.custom_headers)
+        return result
+
     def get_conan_manifest(self, conan_reference):
         """Gets a FileTreeManifest from conans"""
 
@@ -271,7 +278,8 @@ class RestApiClient(object):
 
         url = "%s/conans/search%s" % (self._remote_api_url, query)
         response = self._get_json(url)["results"]
-        return [ConanFileReference.loads(ref) for ref in response]
+        # The server only lists references that were validated when uploaded
+        return [ConanFileReference.loads(ref, validate=False) for ref in response]
 
     def search_packages(self, reference, query):
 
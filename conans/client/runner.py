@@ -1,19 +1,49 @@
+import codecs
 import io
 import os
 import sys
+import threading
+from collections import deque
 from subprocess import Popen, PIPE, STDOUT
+from six.moves.queue import Queue, Empty
+from conans.client.output import ConanOutput, ScopedOutput
 from conans.util.files import decode_text
 from conans.errors import ConanException
 import six
 from conans.unicode import get_cwd
 
 
+_CHUNK_SIZE = 64 * 1024
+
+
+class _OutputDecoder(object):
+    """ Incremental utf-8 decoding of the output chunks, a character can be split between
+    two chunks. Chunks that are not utf-8 are decoded as decode_text() does
+    """
+    def __init__(self):
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+
+    def decode(self, data, final=False):
+        pending = self._utf8.getstate()[0]
+        try:
+            return self._utf8.decode(data, final)
+        except UnicodeDecodeError:
+            self._utf8.reset()
+            return decode_text(pending + data)
+
+
 class ConanRunner(object):
 
-    def __init__(self, print_commands_to_output=False, generate_run_log_file=False, log_run_to_output=True):
+    def __init__(self, print_commands_to_output=False, generate_run_log_file=False,
+                 log_run_to_output=True, output_tail=None):
+        """
+        @param output_tail: Only print the last output_tail lines of the output of the commands
+        when they finish, the full output is still logged to the log file
+        """
         self._print_commands_to_output = print_commands_to_output
         self._generate_run_log_file = generate_run_log_file
         self._log_run_to_output = log_run_to_output
+        self._output_tail = output_tail
 
     def __call__(self, command, output, log_filepath=None, cwd=None, subprocess=False):
         """
@@ -28,6 +58,9 @@ class ConanRunner(object):
                   "use six.StringIO() instead ***")
 
         stream_output = output if output and hasattr(output, "write") else sys.stdout
+        # Only the console output is tailed, never a stream given to capture the output
+        console = output is True or output is sys.stdout or isinstance(output, ConanOutput)
+        output_tail = self._output_tail if console else None
 
         if not self._generate_run_log_file:
             log_filepath = None
@@ -38,7 +71,8 @@ class ConanRunner(object):
             stream_output.write(call_message)
 
         # No output has to be redirected to logs or buffer or omitted
-        if output is True and not log_filepath and self._log_run_to_output and not subprocess:
+        if output is True and not log_filepath and self._log_run_to_output and not subprocess \
+                and not output_tail:
             return self._simple_os_call(command, cwd)
         elif log_filepath:
             if stream_output:
@@ -46,46 +80,97 @@ class ConanRunner(object):
             with open(log_filepath, "a+") as log_handler:
                 if self._print_commands_to_output:
                     log_handler.write(call_message)
-                return self._pipe_os_call(command, stream_output, log_handler, cwd)
+                return self._pipe_os_call(command, stream_output, log_handler, cwd, output_tail)
         else:
-            return self._pipe_os_call(command, stream_output, None, cwd)
+            return self._pipe_os_call(command, stream_output, None, cwd, output_tail)
 
-    def _pipe_os_call(self, command, stream_output, log_handler, cwd):
+    def _pipe_os_call(self, command, stream_output, log_handler, cwd, output_tail=None):
 
         try:
             # piping both stdout, stderr and then later only reading one will hang the process
             # if the other fills the pip. So piping stdout, and redirecting stderr to stdour,
-            # so both are merged and use just a single get_stream_lines() call
+            # so both are merged and read by a single thread
             proc = Popen(command, shell=True, stdout=PIPE, stderr=STDOUT, cwd=cwd)
         except Exception as e:
             raise ConanException("Error while executing '%s'\n\t%s" % (command, str(e)))
 
-        def get_stream_lines(the_stream):
+        # A thread reads the output in chunks, so the command is not slowed down waiting for
+        # the output to be decoded and written
+        chunks = Queue()
+
+        def read_chunks():
+            fd = proc.stdout.fileno()
             while True:
-                line = the_stream.readline()
-                if not line:
+                chunk = os.read(fd, _CHUNK_SIZE)
+                chunks.put(chunk)
+                if not chunk:
                     break
-                decoded_line = decode_text(line)
-                if stream_output and self._log_run_to_output:
-                    try:
-                        stream_output.write(decoded_line)
-                    except UnicodeEncodeError:  # be agressive on text encoding
-                        decoded_line = decoded_line.encode("latin-1", "ignore").decode("latin-1",
-                                                                                       "ignore")
-                        stream_output.write(decoded_line)
-
-                if log_handler:
-                    # Write decoded in PY2 causes some ASCII encoding problems
-                    # tried to open the log_handler binary but same result.
-                    log_handler.write(line if six.PY2 else decoded_line)
-
-        get_stream_lines(proc.stdout)
-        # get_stream_lines(proc.stderr)
 
+        reader = threading.Thread(target=read_chunks)
+        reader.daemon = True
+        reader.start()
+
+        write_output = stream_output and self._log_run_to_output
+        # The scoped outputs print the scope in every write, so they get whole lines
+        by_lines = isinstance(stream_output, ScopedOutput)
+        decoder = _OutputDecoder()
+        tail = deque(maxlen=output_tail) if output_tail else None
+        tail_lines = 0
+        partial_line = ""
+        finished = False
+        while not finished:
+            batch = [chunks.get()]
+            while batch[-1]:  # Everything read meanwhile is written at once
+                try:
+                    batch.append(chunks.get_nowait())
+                except Empty:
+                    break
+            finished = not batch[-1]
+            data = b"".join(batch)
+            text = decoder.decode(data, final=finished)
+
+            if log_handler:
+                # Write decoded in PY2 causes some ASCII encoding problems
+                # tried to open the log_handler binary but same result.
+                log_handler.write(data if six.PY2 else text)
+
+            if tail is not None or by_lines:
+                lines = (partial_line + text).splitlines(True)
+                partial_line = ""
+                if lines and not finished and not lines[-1].endswith(("\n", "\r")):
+                    partial_line = lines.pop()
+                if tail is not None:
+                    tail_lines += len(lines)
+                    tail.extend(lines)
+                elif write_output:
+                    for line in lines:
+                        self._write(stream_output, line)
+            elif write_output and text:
+                self._write(stream_output, text)
+
+        if tail is not None and write_output:
+            if tail_lines > len(tail):
+                log_file = getattr(log_handler, "name", None)
+                self._write(stream_output, "[Last %d of %d output lines%s]\n"
+                            % (len(tail), tail_lines,
+                               ", full output in '%s'" % log_file if log_file else ""))
+            text = "".join(tail)
+            if text:
+                self._write(stream_output, text if text.endswith("\n") else text + "\n")
+
+        reader.join()
         proc.communicate()
         ret = proc.returncode
         return ret
 
+    @staticmethod
+    def _write(stream_output, text):
+        try:
+            stream_output.write(text)
+        except UnicodeEncodeError:  # be agressive on text encoding
+            text = text.encode("latin-1", "ignore").decode("latin-1", "ignore")
+            stream_output.write(text)
+
     def _simple_os_call(self, command, cwd):
         if not cwd:
             return os.system(command)
@@ -15,6 +15,9 @@ def complete_recipe_sources(remote_manager, client_cache, registry, conanfile, c
     sources_folder = client_cache.export_sources(conan_reference, conanfile.short_paths)
     if os.path.exists(sources_folder):
         return None
+    if os.path.exists(client_cache.export_sources(conan_reference, conanfile.short_paths,
+                                                  layered=True)):
+        return None  # In the read-only shared store
 
     if not hasattr(conanfile, "exports_sources"):
         mkdir(sources_folder)
@@ -44,9 +47,10 @@ def merge_directories(src, dst):
 
 
 def config_source(export_folder, export_source_folder, src_folder,
-                  conan_file, output, force=False):
+                  conan_file, output, force=False, source_cache=None):
     """ creates src folder and retrieve, calling source() from conanfile
     the necessary source code
+    source_cache: SourceCache to reuse the source() result of the same recipe, if any
     """
 
     def remove_source(raise_error=True):
@@ -73,6 +77,15 @@ def config_source(export_folder, export_source_folder, src_folder,
         output.warn("Detected build_policy 'always', trying to remove source folder")
         remove_source()
 
+    if force or conan_file.build_policy_always:
+        source_cache = None
+
+    if not os.path.exists(src_folder) and source_cache:
+        set_dirty(src_folder)
+        if source_cache.restore(export_folder, conan_file, src_folder):
+            output.info('Restored sources from the source cache in %s' % src_folder)
+        clean_dirty(src_folder)
+
     if not os.path.exists(src_folder):
         output.info('Configuring sources in %s' % src_folder)
         shutil.copytree(export_folder, src_folder, symlinks=True)
@@ -99,6 +112,8 @@ def config_source(export_folder, export_source_folder, src_folder,
                     conan_file.package_folder = None
                     conan_file.source()
             clean_dirty(src_folder)  # Everything went well, remove DIRTY flag
+            if source_cache:
+                source_cache.store(export_folder, conan_file, src_folder)
         except Exception as e:
             os.chdir(export_folder)
             # in case source() fails (user error, typically), remove the src_folder
@@ -0,0 +1,174 @@
+import errno
+import os
+import shutil
+import stat
+
+from conans.model.manifest import FileTreeManifest
+from conans.paths import CONAN_MANIFEST, CONANINFO
+from conans.util.files import mkdir, md5sum
+from conans.util.log import logger
+
+
+class DedupStats(object):
+    """ How many files, and bytes, of a package are shared with other packages
+    """
+    def __init__(self):
+        self.files = 0
+        self.shared_files = 0
+        self.bytes = 0
+        self.shared_bytes = 0
+
+    def add(self, size, shared):
+        self.files += 1
+        self.bytes += size
+        if shared:
+            self.shared_files += 1
+            self.shared_bytes += size
+
+    @property
+    def ratio(self):
+        return float(self.shared_bytes) / self.bytes if self.bytes else 0.0
+
+    def report(self, output):
+        if self.files:
+            output.info("Deduplicated %d of %d files (%.1f of %.1f MB, %d%%)"
+                        % (self.shared_files, self.files, self.shared_bytes / (1024.0 * 1024.0),
+                           self.bytes / (1024.0 * 1024.0), int(self.ratio * 100)))
+
+
+# Written by conan in place, they would modify the blob for all the packages
+_NOT_SHARED = (CONAN_MANIFEST, CONANINFO)
+
+
+def _replace(src, dst):
+    """ Makes dst a hardlink to src, atomically where possible
+    """
+    tmp = dst + ".conan_link_tmp"
+    os.link(src, tmp)
+    try:
+        os.rename(tmp, dst)
+    except OSError:  # Windows doesn't replace existing files
+        os.remove(dst)
+        os.rename(tmp, dst)
+
+
+def _make_read_only(path, mode):
+    """ the blob and all the package files linked to it share the permissions
+    """
+    if mode & stat.S_IWRITE:
+        os.chmod(path, mode & ~stat.S_IWRITE)
+
+
+class BlobStore(object):
+    """ Content addressed store of the files of the packages, in the store folder, keyed by
+    the md5 of their conanmanifest.txt. The package files are hardlinks to the blobs, so the
+    identical files of different packages are stored only once, and are read-only, so writing
+    one of them cannot modify the other packages. A blob without other links is not used by
+    any package anymore.
+    """
+
+    def __init__(self, folder):
+        self._folder = folder
+
+    def _blob_path(self, file_md5, mode):
+        # Hardlinks share the permissions too, executables cannot be shared with other files
+        suffix = "x" if mode & stat.S_IXUSR else ""
+        return os.path.join(self._folder, file_md5[:2], file_md5 + suffix)
+
+    def dedup(self, package_folder, manifest=None):
+        """ replaces the files of the package folder with hardlinks to the identical blobs,
+        adding as new blobs the ones not stored yet. Returns the DedupStats
+        """
+        manifest = manifest or FileTreeManifest.load(package_folder)
+        stats = DedupStats()
+        for rel_path, file_md5 in sorted(manifest.file_sums.items()):
+            if rel_path in _NOT_SHARED:
+                continue
+            path = os.path.join(package_folder, rel_path)
+            try:
+                st = os.lstat(path)
+            except OSError:
+                continue
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            blob = self._blob_path(file_md5, st.st_mode)
+            try:
+                try:
+                    blob_st = os.stat(blob)
+                except OSError:
+                    blob_st = None
+                if blob_st is not None and (blob_st.st_dev, blob_st.st_ino) == (st.st_dev,
+                                                                                st.st_ino):
+                    _make_read_only(path, st.st_mode)
+                    stats.add(st.st_size, shared=blob_st.st_nlink > 2)
+                    continue
+                # The manifest could be wrong, the file is only replaced by an identical blob
+                if md5sum(path) != file_md5:
+                    logger.debug("Blob store: %s doesn't match its manifest" % path)
+                    continue
+                if (blob_st is not None and blob_st.st_size == st.st_size and
+                        md5sum(blob) == file_md5):
+                    _replace(blob, path)
+                    _make_read_only(path, blob_st.st_mode)
+                    stats.add(st.st_size, shared=True)
+                else:
+                    mkdir(os.path.dirname(blob))
+                    if blob_st is not None:  # Modified through some package, discarded
+                        logger.debug("Blob store: %s was modified, discarded" % blob)
+                        os.remove(blob)
+                    os.link(path, blob)
+                    _make_read_only(path, st.st_mode)
+                    stats.add(st.st_size, shared=False)
+            except OSError as e:
+                logger.debug("Blob store: cannot deduplicate %s: %s" % (path, str(e)))
+                if e.errno == errno.EXDEV:  # Other device (short_paths), none of them can be
+                    break
+        return stats
+
+    def copy_package(self, src_folder, dst_folder):
+        """ copies the package folder, the files in its manifest are deduplicated and
+        hardlinked. Returns the DedupStats
+        """
+        manifest = FileTreeManifest.load(src_folder)
+        self.dedup(src_folder, manifest)
+        linked = set()
+        for rel_path in manifest.files():
+            src = os.path.join(src_folder, rel_path)
+            if rel_path not in _NOT_SHARED and os.path.isfile(src) and not os.path.islink(src):
+                linked.add(os.path.normpath(rel_path))
+
+        def ignore(folder, names):
+            rel_folder = os.path.relpath(folder, src_folder)
+            return [name for name in names
+                    if os.path.normpath(os.path.join(rel_folder, name)) in linked]
+        shutil.copytree(src_folder, dst_folder, symlinks=True, ignore=ignore)
+
+        stats = DedupStats()
+        for rel_path in sorted(linked):
+            src, dst = os.path.join(src_folder, rel_path), os.path.join(dst_folder, rel_path)
+            mkdir(os.path.dirname(dst))
+            try:
+                os.link(src, dst)
+                stats.add(os.path.getsize(dst), shared=True)
+            except OSError:  # Other device (short_paths), or file system without hardlinks
+                shutil.copy2(src, dst)
+                stats.add(os.path.getsize(dst), shared=False)
+        return stats
+
+    def purge(self):
+        """ removes the blobs that are no longer used by any package. Returns the freed bytes
+        """
+        freed = 0
+        if not os.path.isdir(self._folder):
+            return freed
+        for root, _, files in os.walk(self._folder):
+            for f in files:
+                blob = os.path.join(root, f)
+                try:
+                    st = os.stat(blob)
+                    if st.st_nlink == 1:
+                        os.remove(blob)
+                        freed += st.st_size
+                except OSError:
+                    pass
+        return freed
@@ -0,0 +1,305 @@
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+
+from conans.model.info import ConanInfo
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.paths import CONANINFO
+from conans.util.files import list_folder_subdirs, load, file_signature
+from conans.util.log import logger
+
+
+FOLDERS_TABLE = "folders"
+PACKAGES_TABLE = "packages"
+META_TABLE = "meta"
+ACCESS_TABLE = "access"
+
+
+def folder_size(folder, exclusive=False):
+    """ size of the files of the folder, the hardlinked ones are counted once.
+    exclusive: only the files not hardlinked from other folders (the blob store link is ignored)
+    """
+    result = 0
+    inodes = set()
+    for root, _, files in os.walk(folder):
+        for f in files:
+            try:
+                st = os.lstat(os.path.join(root, f))
+            except OSError:
+                continue
+            if st.st_nlink > 1:
+                if exclusive and st.st_nlink > 2:
+                    continue
+                if (st.st_dev, st.st_ino) in inodes:
+                    continue
+                inodes.add((st.st_dev, st.st_ino))
+            result += st.st_size
+    return result
+
+
+class CacheIndex(object):
+    """ sqlite index of the local cache store, to avoid walking it and parsing every conaninfo.txt
+    in searches. The commands modifying the store (export, install, remove, copy) update it. Also
+    the listing of the store folders is validated with their modification times, and the
+    information of the packages with the signature of their conaninfo.txt, so it is never
+    outdated, even if the store is modified by other clients or manually. If it cannot be used
+    (e.g. read-only conan folder), the store is just walked.
+    """
+
+    def __init__(self, dbfile, paths):
+        self._dbfile = dbfile
+        self._paths = paths
+        self._initialized = False
+        self._disabled = False
+        self._accessed = {}  # {store relative path: time}, pending to be flushed
+
+    @contextmanager
+    def _cursor(self):
+        connection = sqlite3.connect(self._dbfile, timeout=10)
+        connection.text_factory = str
+        try:
+            cursor = connection.cursor()
+            if not self._initialized:
+                cursor.execute("create table if not exists %s (path TEXT PRIMARY KEY, "
+                               "mtime REAL, subdirs TEXT)" % FOLDERS_TABLE)
+                cursor.execute("create table if not exists %s (reference TEXT, "
+                               "package_id TEXT, signature TEXT, info TEXT, recipe_hash TEXT, "
+                               "size INTEGER, PRIMARY KEY (reference, package_id))"
+                               % PACKAGES_TABLE)
+                cursor.execute("create table if not exists %s (path TEXT PRIMARY KEY, "
+                               "last_access REAL)" % ACCESS_TABLE)
+                cursor.execute("create table if not exists %s (key TEXT PRIMARY KEY, value TEXT)"
+                               % META_TABLE)
+                # The relative paths are only valid for the store they were indexed from
+                cursor.execute("select value from %s where key='store'" % META_TABLE)
+                row = cursor.fetchone()
+                if row is None or row[0] != self._paths.store:
+                    cursor.execute("delete from %s" % FOLDERS_TABLE)
+                    cursor.execute("delete from %s" % PACKAGES_TABLE)
+                    cursor.execute("delete from %s" % ACCESS_TABLE)
+                    cursor.execute("insert or replace into %s (key, value) values ('store', ?)"
+                                   % META_TABLE, (self._paths.store, ))
+                self._initialized = True
+            yield cursor
+            connection.commit()
+        finally:
+            connection.close()
+
+    def _disable(self, exc):
+        logger.debug("Cache index: disabled, %s: %s" % (self._dbfile, str(exc)))
+        self._disabled = True
+
+    def recipe_folders(self):
+        """ returns the relative folders of the recipes in the store: "name/version/user/channel"
+        """
+        if self._disabled:
+            return list_folder_subdirs(self._paths.store, level=4)
+        try:
+            with self._cursor() as cursor:
+                cursor.execute("select path, mtime, subdirs from %s" % FOLDERS_TABLE)
+                listings = {path: (mtime, json.loads(subdirs))
+                            for path, mtime, subdirs in cursor.fetchall()}
+                previous = dict(listings)
+                result = list_folder_subdirs(self._paths.store, level=4, listings=listings)
+                removed = [(path, ) for path in previous if path not in listings]
+                updated = [(path, mtime, json.dumps(subdirs))
+                           for path, (mtime, subdirs) in listings.items()
+                           if previous.get(path) != (mtime, subdirs)]
+                if removed:
+                    cursor.executemany("delete from %s where path=?" % FOLDERS_TABLE, removed)
+                if updated:
+                    cursor.executemany("insert or replace into %s (path, mtime, subdirs) "
+                                       "values (?, ?, ?)" % FOLDERS_TABLE, updated)
+                return result
+        except (sqlite3.Error, ValueError) as e:
+            self._disable(e)
+            return list_folder_subdirs(self._paths.store, level=4)
+
+    def package_infos(self, reference):
+        """ returns {package_id: (conaninfo signature, conaninfo serialize_min())}
+        """
+        if self._disabled:
+            return {}
+        try:
+            with self._cursor() as cursor:
+                cursor.execute("select package_id, signature, info from %s where reference=?"
+                               % PACKAGES_TABLE, (str(reference), ))
+                return {package_id: (signature, json.loads(info))
+                        for package_id, signature, info in cursor.fetchall()}
+        except (sqlite3.Error, ValueError) as e:
+            self._disable(e)
+            return {}
+
+    def update_package_infos(self, reference, updated, removed, sizes=None):
+        """ updated: {package_id: (conaninfo signature, conaninfo serialize_min())}
+        removed: package_ids that no longer exist
+        """
+        if self._disabled or not (updated or removed):
+            return
+        reference = str(reference)
+        sizes = sizes or {}
+        try:
+            with self._cursor() as cursor:
+                if removed:
+                    cursor.executemany("delete from %s where reference=? and package_id=?"
+                                       % PACKAGES_TABLE,
+                                       [(reference, package_id) for package_id in removed])
+                # The size is kept if not given, it is computed when the package is added
+                rows = [(reference, package_id, signature, json.dumps(info),
+                         info.get("recipe_hash"), sizes.get(package_id), reference, package_id)
+                        for package_id, (signature, info) in (updated or {}).items()]
+                cursor.executemany("insert or replace into %s (reference, package_id, signature, "
+                                   "info, recipe_hash, size) values (?, ?, ?, ?, ?, coalesce(?, "
+                                   "(select size from %s where reference=? and package_id=?)))"
+                                   % (PACKAGES_TABLE, PACKAGES_TABLE), rows)
+        except sqlite3.Error as e:
+            self._disable(e)
+
+    def recipe_changed(self, reference):
+        """ the recipe was added to or removed from the store: the listings of its parent folders
+        are discarded, so only they are listed again, and the packages of a removed one too
+        """
+        if self._disabled:
+            return
+        parts = [reference.name, reference.version, reference.user]
+        parents = [("/".join(parts[:i]), ) for i in range(len(parts) + 1)]
+        try:
+            with self._cursor() as cursor:
+                cursor.executemany("delete from %s where path=?" % FOLDERS_TABLE, parents)
+                if not os.path.exists(self._paths.conan(reference)):
+                    cursor.execute("delete from %s where reference=?" % PACKAGES_TABLE,
+                                   (str(reference), ))
+        except sqlite3.Error as e:
+            self._disable(e)
+
+    def package_added(self, package_ref):
+        """ indexes the information and size of a package just created by conan in the store
+        """
+        if self._disabled:
+            return
+        package_folder = self._paths.package(package_ref, short_paths=None)
+        info_path = os.path.join(package_folder, CONANINFO)
+        try:
+            # Just written by conan, it's not modified again, even in the same mtime tick
+            st = os.stat(info_path)
+            signature = "%r-%d" % (st.st_mtime, st.st_size)
+            info = ConanInfo.loads(load(info_path)).serialize_min()
+        except Exception as e:
+            logger.debug("Cache index: cannot index %s: %s" % (str(package_ref), str(e)))
+            return
+        self.update_package_infos(package_ref.conan, {package_ref.package_id: (signature, info)},
+                                  None, {package_ref.package_id: folder_size(package_folder)})
+
+    def packages_removed(self, reference, package_ids=None):
+        """ package_ids: the removed ones, None for all the packages of the reference
+        """
+        if package_ids is not None:
+            self.update_package_infos(reference, None, package_ids)
+            return
+        if self._disabled:
+            return
+        try:
+            with self._cursor() as cursor:
+                cursor.execute("delete from %s where reference=?" % PACKAGES_TABLE,
+                               (str(reference), ))
+        except sqlite3.Error as e:
+            self._disable(e)
+
+    def _relative(self, folder):
+        return os.path.relpath(folder, self._paths.store).replace("\\", "/")
+
+    def touch(self, folder):
+        """ records that a package, build or source folder of the store has been used now.
+        It is written in the database by flush()
+        """
+        self._accessed[self._relative(folder)] = time.time()
+
+    def flush(self):
+        accessed, self._accessed = self._accessed, {}
+        if self._disabled or not accessed:
+            return
+        try:
+            with self._cursor() as cursor:
+                cursor.executemany("insert or replace into %s (path, last_access) values (?, ?)"
+                                   % ACCESS_TABLE, list(accessed.items()))
+        except sqlite3.Error as e:
+            self._disable(e)
+
+    def last_accesses(self):
+        """ returns {store relative path: time} of all the recorded folder usages
+        """
+        self.flush()
+        if self._disabled:
+            return {}
+        try:
+            with self._cursor() as cursor:
+                cursor.execute("select path, last_access from %s" % ACCESS_TABLE)
+                return dict(cursor.fetchall())
+        except sqlite3.Error as e:
+            self._disable(e)
+            return {}
+
+    def forget(self, folders):
+        """ discards the recorded usages of the given (removed) store folders
+        """
+        rel_paths = [(self._relative(folder), ) for folder in folders]
+        if self._disabled or not rel_paths:
+            return
+        try:
+            with self._cursor() as cursor:
+                cursor.executemany("delete from %s where path=?" % ACCESS_TABLE, rel_paths)
+        except sqlite3.Error as e:
+            self._disable(e)
+
+    def rebuild(self):
+        """ discards the index and creates it again from scratch, walking the whole store,
+        parsing all the conaninfo.txt and computing the packages sizes. The recorded usages of
+        the folders are kept. Returns a summary with the inconsistencies found in the previous index
+        """
+        indexed_recipes = set(self.recipe_folders())
+        indexed_packages = {}
+        try:
+            with self._cursor() as cursor:
+                cursor.execute("select reference, package_id, signature from %s" % PACKAGES_TABLE)
+                indexed_packages = {(ref, package_id): signature
+                                    for ref, package_id, signature in cursor.fetchall()}
+                cursor.execute("delete from %s" % FOLDERS_TABLE)
+                cursor.execute("delete from %s" % PACKAGES_TABLE)
+        except sqlite3.Error as e:
+            self._disable(e)
+            raise
+
+        # Without the previous listings, all the store is listed again
+        recipe_folders = self.recipe_folders()
+        summary = {"recipes": len(recipe_folders), "packages": 0, "size": 0,
+                   "outdated": len(indexed_recipes.symmetric_difference(recipe_folders))}
+        packages = set()
+        for folder in recipe_folders:
+            reference = ConanFileReference(*folder.split("/"), validate=False)
+            updated, sizes = {}, {}
+            for package_id in list_folder_subdirs(self._paths.packages(reference), level=1):
+                package_folder = self._paths.package(PackageReference(reference, package_id),
+                                                     short_paths=None)
+                info_path = os.path.join(package_folder, CONANINFO)
+                try:
+                    signature = file_signature(info_path)
+                    info = ConanInfo.loads(load(info_path)).serialize_min()
+                except Exception as e:
+                    logger.error("Package %s:%s has no valid ConanInfo file: %s"
+                                 % (folder, package_id, str(e)))
+                    continue
+                key = (str(reference), package_id)
+                packages.add(key)
+                if key in indexed_packages and indexed_packages[key] != signature:
+                    summary["outdated"] += 1
+                size = folder_size(package_folder)
+                summary["size"] += size
+                if signature is not None:
+                    updated[package_id] = (signature, info)
+                    sizes[package_id] = size
+            self.update_package_infos(reference, updated, None, sizes)
+        summary["packages"] = len(packages)
+        summary["outdated"] += len(set(indexed_packages).difference(packages))
+        return summary
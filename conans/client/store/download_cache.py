@@ -0,0 +1,120 @@
+import hashlib
+import json
+import os
+import shutil
+
+import fasteners
+
+from conans.util.files import mkdir, load, save, sha256sum, sha1sum, md5sum
+from conans.util.log import logger
+
+
+_META_EXTENSION = ".json"
+_LOCK_FILE = ".lock"
+
+
+class DownloadCache(object):
+    """ Machine wide cache of the files downloaded by the recipes with tools.get/download, so
+    the source archives are not downloaded again after removing a source folder, or by other
+    recipes or users of the machine. The files are keyed by the checksum if given, so the same
+    archive from different mirrors is stored once, and otherwise by the URL.
+    The least recently used files are evicted when the cache is bigger than max_size bytes.
+    """
+    def __init__(self, folder, max_size=None):
+        self._folder = folder
+        self._max_size = max_size
+
+    @property
+    def folder(self):
+        return self._folder
+
+    @staticmethod
+    def _key(url, md5=None, sha1=None, sha256=None):
+        for name, checksum in (("sha256", sha256), ("sha1", sha1), ("md5", md5)):
+            if checksum:
+                return "%s-%s" % (name, checksum.lower())
+        return "url-%s" % hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _lock(self):
+        mkdir(self._folder)
+        return fasteners.InterProcessLock(os.path.join(self._folder, _LOCK_FILE), logger=logger)
+
+    @staticmethod
+    def _valid(path, md5=None, sha1=None, sha256=None, meta=None):
+        checks = [(sha256sum, sha256), (sha1sum, sha1), (md5sum, md5)]
+        if meta and not any(checksum for _, checksum in checks):
+            checks = [(sha256sum, meta.get("sha256"))]  # Not corrupted since stored
+        return all(algorithm(path) == checksum.lower()
+                   for algorithm, checksum in checks if checksum)
+
+    def get(self, url, filename, md5=None, sha1=None, sha256=None):
+        """ copies the cached file of url, if any and valid, to filename, returns True if so
+        """
+        path = os.path.join(self._folder, self._key(url, md5, sha1, sha256))
+        try:
+            meta = json.loads(load(path + _META_EXTENSION))
+            if not self._valid(path, md5, sha1, sha256, meta):
+                logger.warning("Download cache: removing invalid %s (%s)" % (path, url))
+                with self._lock():
+                    self._remove(path)
+                return False
+            os.utime(path, None)  # For the LRU eviction
+        except (IOError, OSError, ValueError):  # Not cached, or evicted meanwhile
+            return False
+        try:
+            shutil.copyfile(path, filename)
+        except (IOError, OSError) as exc:
+            logger.warning("Download cache: couldn't copy %s: %s" % (path, str(exc)))
+            try:  # Not to leave a partial file, it will be downloaded
+                os.remove(filename)
+            except OSError:
+                pass
+            return False
+        return True
+
+    def put(self, url, filename, md5=None, sha1=None, sha256=None):
+        """ stores the downloaded filename, if it matches the given checksums
+        """
+        if not self._valid(filename, md5, sha1, sha256):
+            return  # The recipe checks will fail, not worth caching it
+        path = os.path.join(self._folder, self._key(url, md5, sha1, sha256))
+        with self._lock():
+            tmp = path + ".tmp"
+            try:
+                shutil.copyfile(filename, tmp)
+                # Written before the file, an entry without it is just a miss
+                save(path + _META_EXTENSION, json.dumps({"url": url,
+                                                         "sha256": sha256 or sha256sum(tmp)}))
+                if os.path.exists(path):  # Stored meanwhile by another process
+                    os.remove(tmp)
+                else:
+                    os.rename(tmp, path)
+            except (IOError, OSError) as exc:
+                logger.warning("Download cache: couldn't store %s: %s" % (url, str(exc)))
+                return
+            self._evict()
+
+    def _remove(self, path):
+        for f in (path, path + _META_EXTENSION):
+            try:
+                os.remove(f)
+            except OSError:
+                pass
+
+    def _evict(self):
+        if self._max_size is None:
+            return
+        entries = []
+        for name in os.listdir(self._folder):
+            if name == _LOCK_FILE or name.endswith(_META_EXTENSION) or name.endswith(".tmp"):
+                continue
+            path = os.path.join(self._folder, name)
+            stat = os.stat(path)
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self._max_size:
+                break
+            logger.debug("Download cache: evicting %s" % path)
+            self._remove(path)
+            total -= size
@@ -0,0 +1,83 @@
+import os
+
+from conans.model.manifest import FileTreeManifest
+from conans.util.files import copy_tree_linking, rmdir
+from conans.util.log import logger
+from conans.util.sha import sha1
+
+
+class SourceCache(object):
+    """ Results of the recipes source() methods, so the sources of a recipe are not retrieved
+    again for other user/channels of the same recipe, or after removing its source folder.
+    The entries are keyed by the export manifest, that already covers the exports_sources
+    files, and the name and version, as source() typically uses them to get the sources.
+    The user and channel are not part of the key, recipes whose source() depends on them
+    shouldn't use this cache.
+    The entries are never modified once stored, and they are restored as copy-on-write clones
+    where the file system supports them, otherwise copies, so editing a source folder never
+    changes the cached entry. Their modification time is the time they were last used, and
+    "conan cache gc" removes them as the packages and build folders.
+    """
+    def __init__(self, folder):
+        self._folder = folder
+
+    @property
+    def folder(self):
+        return self._folder
+
+    def _entry(self, export_folder, conan_file):
+        try:
+            manifest = FileTreeManifest.load(export_folder)
+        except (IOError, OSError):
+            return None
+        key = "%s\n%s\n%s" % (manifest.summary_hash, conan_file.name, conan_file.version)
+        return os.path.join(self._folder, sha1(key.encode("utf-8")))
+
+    def restore(self, export_folder, conan_file, src_folder):
+        """ populates src_folder with the cached source() result, returns True if so
+        """
+        entry = self._entry(export_folder, conan_file)
+        if not entry or not os.path.isdir(entry):
+            return False
+        try:
+            copy_tree_linking(entry, src_folder, "reflink")
+            os.utime(entry, None)
+        except (IOError, OSError) as exc:  # Removed meanwhile, or the source folder is busy
+            logger.warning("Source cache: couldn't restore %s: %s" % (entry, str(exc)))
+            rmdir(src_folder)
+            return False
+        return True
+
+    def entries(self):
+        """ folders of the stored entries
+        """
+        if not os.path.isdir(self._folder):
+            return []
+        return [os.path.join(self._folder, name) for name in os.listdir(self._folder)
+                if not name.endswith(".tmp")]
+
+    def remove(self, entry):
+        """ Renamed aside first, so a concurrent restore never sees a partial entry
+        """
+        tmp = "%s.%d.tmp" % (entry, os.getpid())
+        try:
+            os.rename(entry, tmp)
+        except OSError as exc:  # Removed meanwhile by another process
+            logger.debug("Source cache: didn't remove %s: %s" % (entry, str(exc)))
+            return False
+        rmdir(tmp)
+        return True
+
+    def store(self, export_folder, conan_file, src_folder):
+        entry = self._entry(export_folder, conan_file)
+        if not entry or os.path.isdir(entry):
+            return
+        # Copied aside and renamed, so a concurrent restore never sees a partial entry
+        tmp = "%s.%d.tmp" % (entry, os.getpid())
+        try:
+            copy_tree_linking(src_folder, tmp, "reflink")
+            os.rename(tmp, entry)
+        except (IOError, OSError) as exc:  # Stored meanwhile by another process
+            logger.debug("Source cache: didn't store %s: %s" % (entry, str(exc)))
+        finally:
+            rmdir(tmp)
@@ -1,14 +1,21 @@
 import platform
 import logging
 import os
+import shutil
+import stat
 import sys
+import threading
 
 from contextlib import contextmanager
+
+import six
 from patch import fromfile, fromstring
 
 from conans.client.output import ConanOutput
 from conans.errors import ConanException
-from conans.util.files import (load, save, _generic_algorithm_sum)
+from conans.util.concurrency import parallel_imap
+from conans.util.files import (load, save, mkdir, decode_text, _generic_algorithm_sum,
+                               break_hardlink)
 from conans.unicode import get_cwd
 
 
@@ -79,35 +86,122 @@ def unzip(filename, destination=".", keep_permissions=False):
             pass
 
     with zipfile.ZipFile(filename, "r") as z:
-        uncompress_size = sum((file_.file_size for file_ in z.infolist()))
+        members = z.infolist()
+        uncompress_size = sum((file_.file_size for file_ in members))
         if uncompress_size > 100000:
             _global_output.info("Unzipping %s, this can take a while" % human_size(uncompress_size))
         else:
             _global_output.info("Unzipping %s" % human_size(uncompress_size))
-        extracted_size = 0
 
+        # The folders are created beforehand, not to race for them in the extraction threads
+        targets = [_zip_member_path(full_path, file_) for file_ in members]
+        folders = set(target if file_.filename.endswith("/") else os.path.dirname(target)
+                      for file_, target in zip(members, targets))
+        for folder in sorted(folders):
+            try:
+                mkdir(folder)
+            except OSError as e:
+                _global_output.error("Error extract %s\n%s" % (folder, str(e)))
+
+        from conans.client.tools.oss import cpu_count
+        workers = min(cpu_count(), 8)
+        # Extracted in parallel (zlib releases the GIL), the progress updated per batch
+        batch = max(1, min(500, len(members) // (workers * 4)))
+        items = list(zip(members, targets))
+        batches = [items[i:i + batch] for i in range(0, len(items), batch)]
+        extracted_size = 0
         print_progress.last_size = -1
-        if platform.system() == "Windows":
-            for file_ in z.infolist():
-                extracted_size += file_.file_size
+        with _ZipExtractor(z, filename, full_path, keep_permissions) as extractor:
+            for size in parallel_imap(extractor.extract, batches, max_workers=workers):
+                extracted_size += size
                 print_progress(extracted_size, uncompress_size)
-                try:
-                    z.extract(file_, full_path)
-                except Exception as e:
-                    _global_output.error("Error extract %s\n%s" % (file_.filename, str(e)))
-        else:  # duplicated for, to avoid a platform check for each zipped file
-            for file_ in z.infolist():
-                extracted_size += file_.file_size
-                print_progress(extracted_size, uncompress_size)
-                try:
-                    z.extract(file_, full_path)
-                    if keep_permissions:
-                        # Could be dangerous if the ZIP has been created in a non nix system
-                        # https://bugs.python.org/issue15795
-                        perm = file_.external_attr >> 16 & 0xFFF
-                        os.chmod(os.path.join(full_path, file_.filename), perm)
-                except Exception as e:
-                    _global_output.error("Error extract %s\n%s" % (file_.filename, str(e)))
+
+
+def _zip_member_path(full_path, file_):
+    """ the path the member is extracted to, sanitized as ZipFile.extract() does: without
+    drive, absolute or relative parts, always inside full_path
+    """
+    arcname = file_.filename.replace("/", os.path.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    invalid = ("", os.path.curdir, os.path.pardir)
+    parts = [x for x in arcname.split(os.path.sep) if x not in invalid]
+    if os.path.sep == "\\":
+        illegal = ':<>|"?*'
+        parts = ["".join("_" if c in illegal else c for c in x).rstrip(".") for x in parts]
+        parts = [x for x in parts if x]
+    return os.path.join(full_path, *parts)
+
+
+class _ZipExtractor(object):
+    """ Extracts batches of [(member, target path)] of a zip file, from several threads
+    """
+    def __init__(self, zip_file, filename, full_path, keep_permissions):
+        self._zip_file = zip_file
+        self._filename = filename
+        self._full_path = full_path
+        self._windows = platform.system() == "Windows"
+        self._keep_permissions = keep_permissions and not self._windows
+        self._local = threading.local()
+        self._zipfiles = []
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        for z in self._zipfiles:
+            z.close()
+
+    def _zipfile(self):
+        if six.PY3:  # The members can be read concurrently from the same ZipFile
+            return self._zip_file
+        z = getattr(self._local, "zipfile", None)
+        if z is None:
+            import zipfile
+            z = zipfile.ZipFile(self._filename, "r")
+            self._local.zipfile = z
+            with self._lock:
+                self._zipfiles.append(z)
+        return z
+
+    def extract(self, items):
+        """ returns the uncompressed size of the extracted members
+        """
+        z = self._zipfile()
+        for file_, target in items:
+            try:
+                if file_.filename.endswith("/"):
+                    continue  # Already created
+                if not self._windows and _extract_symlink(z, file_, target, self._full_path):
+                    continue
+                with z.open(file_) as source, open(target, "wb") as dest:
+                    shutil.copyfileobj(source, dest)
+                if self._keep_permissions:
+                    # Could be dangerous if the ZIP has been created in a non nix system
+                    # https://bugs.python.org/issue15795
+                    perm = file_.external_attr >> 16 & 0xFFF
+                    os.chmod(target, perm)
+            except Exception as e:
+                _global_output.error("Error extract %s\n%s" % (file_.filename, str(e)))
+        return sum(file_.file_size for file_, _ in items)
+
+
+def _extract_symlink(z, file_, link, full_path):
+    """ the symlinks are stored as files with the target as contents. Created as symlinks
+    only if pointing inside the destination, returns True if created
+    """
+    if not stat.S_ISLNK(file_.external_attr >> 16):
+        return False
+    target = decode_text(z.read(file_))
+    resolved = os.path.normpath(os.path.join(os.path.dirname(link), target))
+    if not resolved.startswith(full_path + os.sep):
+        return False
+    if os.path.lexists(link):
+        os.remove(link)
+    os.symlink(target, link)
+    return True
 
 
 def untargz(filename, destination="."):
@@ -208,6 +302,7 @@ def replace_in_file(file_path, search, replace, strict=True):
             _global_output.warn(message)
     content = content.replace(search, replace)
     content = content.encode("utf-8")
+    break_hardlink(file_path)
     with open(file_path, "wb") as handle:
         handle.write(content)
 
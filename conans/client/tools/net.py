@@ -3,8 +3,12 @@ import sys
 import os
 from conans.client.output import ConanOutput
 from conans.client.rest.uploader_downloader import Downloader
+from conans.client.store.download_cache import DownloadCache
 from conans.client.tools.files import unzip, check_md5, check_sha1, check_sha256
 from conans.errors import ConanException
+from conans.paths import conan_expand_user
+from conans.util.config_parser import parse_size
+from conans.util.env_reader import get_env
 
 _global_requester = None
 
@@ -13,7 +17,7 @@ def get(url, md5='', sha1='', sha256='', destination="."):
     """ high level downloader + unzipper + (optional hash checker) + delete temporary zip
     """
     filename = os.path.basename(url)
-    download(url, filename)
+    download(url, filename, md5=md5, sha1=sha1, sha256=sha256)
 
     if md5:
         check_md5(filename, md5)
@@ -45,10 +49,39 @@ def ftp_download(ip, filename, login='', password=''):
             pass
 
 
+def _download_cache():
+    """ The DownloadCache if CONAN_DOWNLOAD_CACHE is defined, None otherwise
+    """
+    folder = get_env("CONAN_DOWNLOAD_CACHE", None)
+    if not folder:
+        return None
+    folder = conan_expand_user(folder)
+    if not os.path.isabs(folder):
+        raise ConanException("The download cache folder has to be an absolute path")
+    max_size = get_env("CONAN_DOWNLOAD_CACHE_MAX_SIZE", None)
+    if max_size:
+        max_size = parse_size(max_size)
+    return DownloadCache(folder, max_size)
+
+
 def download(url, filename, verify=True, out=None, retry=2, retry_wait=5, overwrite=False,
-             auth=None, headers=None):
+             auth=None, headers=None, md5='', sha1='', sha256=''):
+    """ md5, sha1, sha256: the expected checksums of the file, if known. Used as the key of
+    the download cache (if enabled), they are not checked here
+    """
     out = out or ConanOutput(sys.stdout, True)
+    # Not for authenticated downloads (auth or Authorization headers), the files could be private
+    download_cache = _download_cache() if not auth and not headers else None
+    if download_cache:
+        if os.path.exists(filename) and not overwrite:
+            raise ConanException("Error, the file to download already exists: '%s'" % filename)
+        if download_cache.get(url, filename, md5, sha1, sha256):
+            out.info("Got %s from the download cache" % url)
+            return
+
     downloader = Downloader(_global_requester, out, verify=verify)
     downloader.download(url, filename, retry=retry, retry_wait=retry_wait, overwrite=overwrite,
                         auth=auth, headers=headers)
     out.writeln("")
+    if download_cache:
+        download_cache.put(url, filename, md5, sha1, sha256)
@@ -2,12 +2,16 @@ import multiprocessing
 import platform
 import subprocess
 import sys
+from contextlib import contextmanager
 
 import os
 
 from conans.client.tools.env import environment_append
 from conans.errors import ConanException
 from conans.model.version import Version
+from conans.paths import get_conan_user_home
+from conans.util.env_reader import get_env
+from conans.util.locks import JobSlots
 from conans.util.log import logger
 from conans.client.tools import which
 
@@ -32,6 +36,26 @@ def cpu_count():
     return 1  # Safe guess
 
 
+@contextmanager
+def job_slots(output=None):
+    """ takes the build job slots of the machine wide pool, if CONAN_JOB_SLOTS is defined,
+    cpu_count() returns the number of slots taken until exiting, so the build helpers use it
+    """
+    slots = get_env("CONAN_JOB_SLOTS", 0)
+    if not slots:
+        yield cpu_count()
+        return
+    folder = get_env("CONAN_JOB_SLOTS_FOLDER", "") or os.path.join(get_conan_user_home(),
+                                                                     ".conan", "job_slots")
+    pool = JobSlots(folder, slots)
+    jobs = pool.acquire(cpu_count(), output)
+    try:
+        with environment_append({"CONAN_CPU_COUNT": str(jobs)}):
+            yield jobs
+    finally:
+        pool.release()
+
+
 def detected_architecture():
     # FIXME: Very weak check but not very common to run conan in other architectures
     machine = platform.machine()
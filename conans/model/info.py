@@ -12,8 +12,12 @@ from conans.util.sha import sha1
 class RequirementInfo(object):
     def __init__(self, value_str, indirect=False):
         """ parse the input into fields name, version...
+        An already parsed PackageReference is also accepted, avoiding to parse it again
         """
-        ref = PackageReference.loads(value_str)
+        if isinstance(value_str, PackageReference):
+            ref = value_str
+        else:
+            ref = PackageReference.loads(value_str)
         self.package = ref
         self.full_name = ref.conan.name
         self.full_version = ref.conan.version
@@ -103,24 +107,29 @@ class RequirementInfo(object):
 class RequirementsInfo(object):
     def __init__(self, requires):
         # {PackageReference: RequirementInfo}
-        self._data = {r: RequirementInfo(str(r)) for r in requires}
+        self._data = {r: RequirementInfo(r) for r in requires}
+        # Cached, invalidated every time a RequirementInfo is modified or handed out
+        self._sha = None
 
     def copy(self):
         return RequirementsInfo(self._data.keys())
 
     def clear(self):
         self._data = {}
+        self._sha = None
 
     def remove(self, *args):
         for name in args:
             del self._data[self._get_key(name)]
+        self._sha = None
 
     def add(self, indirect_reqs):
         """ necessary to propagate from upstream the real
         package requirements
         """
         for r in indirect_reqs:
-            self._data[r] = RequirementInfo(str(r), indirect=True)
+            self._data[r] = RequirementInfo(r, indirect=True)
+        self._sha = None
 
     def refs(self):
         """ used for updating downstream requirements with this
@@ -138,6 +147,7 @@ class RequirementsInfo(object):
         Necessary to access from conaninfo
         self.requires["Boost"].version = "2.X"
         """
+        self._sha = None
         return self._data[self._get_key(item)]
 
     @property
@@ -146,12 +156,14 @@ class RequirementsInfo(object):
 
     @property
     def sha(self):
-        result = []
-        # Remove requirements without a name, i.e. indirect transitive requirements
-        data = {k: v for k, v in self._data.items() if v.name}
-        for key in sorted(data):
-            result.append(data[key].sha)
-        return sha1('\n'.join(result).encode())
+        if self._sha is None:
+            result = []
+            # Remove requirements without a name, i.e. indirect transitive requirements
+            data = {k: v for k, v in self._data.items() if v.name}
+            for key in sorted(data):
+                result.append(data[key].sha)
+            self._sha = sha1('\n'.join(result).encode())
+        return self._sha
 
     def dumps(self):
         result = []
@@ -176,34 +188,42 @@ class RequirementsInfo(object):
         self.clear()
 
     def semver_mode(self):
+        self._sha = None
         for r in self._data.values():
             r.semver_mode()
 
     def patch_mode(self):
+        self._sha = None
         for r in self._data.values():
             r.patch_mode()
 
     def minor_mode(self):
+        self._sha = None
         for r in self._data.values():
             r.minor_mode()
 
     def major_mode(self):
+        self._sha = None
         for r in self._data.values():
             r.major_mode()
 
     def base_mode(self):
+        self._sha = None
         for r in self._data.values():
             r.base_mode()
 
     def full_version_mode(self):
+        self._sha = None
         for r in self._data.values():
             r.full_version_mode()
 
     def full_recipe_mode(self):
+        self._sha = None
         for r in self._data.values():
             r.full_recipe_mode()
 
     def full_package_mode(self):
+        self._sha = None
         for r in self._data.values():
             r.full_package_mode()
 
@@ -319,7 +339,8 @@ class ConanInfo(object):
 
     def package_id(self):
         """ The package_id of a conans is the sha1 of its specific requirements,
-        options and settings
+        options and settings. The settings, options and requires shas are cached by
+        themselves too, so computing it for copies (build_id) or rebuilt infos is cheap
         """
         computed_id = getattr(self, "_package_id", None)
         if computed_id:
@@ -57,6 +57,19 @@ class PackageOptionValues(object):
     def __init__(self):
         self._dict = {}  # {option_name: PackageOptionValue}
         self._modified = {}
+        self._shared = False  # True if _dict might be referenced by other copies
+        self._sha = None  # cached, computing it for every package_id() call is expensive
+
+    def _writable_dict(self):
+        """ copy-on-write: the values are immutable strings, so a shallow copy of the dict
+        is enough to make it private to this object before modifying it. It also invalidates
+        the cached sha
+        """
+        self._sha = None
+        if self._shared:
+            self._dict = self._dict.copy()
+            self._shared = False
+        return self._dict
 
     def __bool__(self):
         return bool(self._dict)
@@ -72,20 +85,25 @@ class PackageOptionValues(object):
     def __delattr__(self, attr):
         if attr not in self._dict:
             return
-        del self._dict[attr]
+        del self._writable_dict()[attr]
 
     def clear(self):
-        self._dict.clear()
+        self._dict = {}
+        self._shared = False
+        self._sha = None
 
     def __setattr__(self, attr, value):
         if attr[0] == "_":
             return super(PackageOptionValues, self).__setattr__(attr, value)
-        self._dict[attr] = PackageOptionValue(value)
+        self._writable_dict()[attr] = PackageOptionValue(value)
 
     def copy(self):
+        """ lazy copy, the values are shared until modified by any of the copies
+        """
         result = PackageOptionValues()
-        for k, v in self._dict.items():
-            result._dict[k] = v
+        result._dict = self._dict
+        result._shared = self._shared = True
+        result._sha = self._sha
         return result
 
     @property
@@ -101,17 +119,18 @@ class PackageOptionValues(object):
     def add(self, option_text):
         assert isinstance(option_text, six.string_types)
         name, value = option_text.split("=")
-        self._dict[name.strip()] = PackageOptionValue(value.strip())
+        self._writable_dict()[name.strip()] = PackageOptionValue(value.strip())
 
     def add_option(self, option_name, option_value):
-        self._dict[option_name] = PackageOptionValue(option_value)
+        self._writable_dict()[option_name] = PackageOptionValue(option_value)
 
     def update(self, other):
         assert isinstance(other, PackageOptionValues)
-        self._dict.update(other._dict)
+        if other._dict:
+            self._writable_dict().update(other._dict)
 
     def remove(self, option_name):
-        del self._dict[option_name]
+        del self._writable_dict()[option_name]
 
     def propagate_upstream(self, down_package_values, down_ref, own_ref, package_name):
         if not down_package_values:
@@ -132,21 +151,23 @@ class PackageOptionValues(object):
                                         modified_value, modified_ref))
             else:
                 self._modified[name] = (value, down_ref)
-                self._dict[name] = value
+                self._writable_dict()[name] = value
 
     def serialize(self):
         return self.items()
 
     @property
     def sha(self):
-        result = []
-        for name, value in self.items():
-            # It is important to discard None values, so migrations in settings can be done
-            # without breaking all existing packages SHAs, by adding a first "None" option
-            # that doesn't change the final sha
-            if value:
-                result.append("%s=%s" % (name, value))
-        return sha1('\n'.join(result).encode())
+        if self._sha is None:
+            result = []
+            for name, value in self.items():
+                # It is important to discard None values, so migrations in settings can be done
+                # without breaking all existing packages SHAs, by adding a first "None" option
+                # that doesn't change the final sha
+                if value:
+                    result.append("%s=%s" % (name, value))
+            self._sha = sha1('\n'.join(result).encode())
+        return self._sha
 
 
 class OptionsValues(object):
@@ -157,6 +178,7 @@ class OptionsValues(object):
     def __init__(self, values=None):
         self._package_values = PackageOptionValues()
         self._reqs_options = {}  # {name("Boost": PackageOptionValues}
+        self._shared = False  # True if _reqs_options might be referenced by other copies
         if not values:
             return
 
@@ -179,19 +201,32 @@ class OptionsValues(object):
             else:
                 self._package_values.add_option(k, v)
 
+    def _writable_reqs_options(self):
+        """ copy-on-write: makes the packages values private to this object before modifying
+        them or returning any of them, as they are mutable
+        """
+        if self._shared:
+            self._reqs_options = {k: v.copy() for k, v in self._reqs_options.items()}
+            self._shared = False
+        return self._reqs_options
+
     def update(self, other):
         self._package_values.update(other._package_values)
+        if not other._reqs_options:
+            return
+        reqs_options = self._writable_reqs_options()
         for package_name, package_values in other._reqs_options.items():
-            pkg_values = self._reqs_options.setdefault(package_name, PackageOptionValues())
+            pkg_values = reqs_options.setdefault(package_name, PackageOptionValues())
             pkg_values.update(package_values)
 
     def scope_options(self, name):
         if self._package_values:
-            self._reqs_options.setdefault(name, PackageOptionValues()).update(self._package_values)
+            reqs_options = self._writable_reqs_options()
+            reqs_options.setdefault(name, PackageOptionValues()).update(self._package_values)
             self._package_values = PackageOptionValues()
 
     def descope_options(self, name):
-        package_values = self._reqs_options.pop(name, None)
+        package_values = self._writable_reqs_options().pop(name, None)
         if package_values:
             self._package_values.update(package_values)
 
@@ -199,17 +234,17 @@ class OptionsValues(object):
         self._package_values.clear()
 
     def __getitem__(self, item):
-        return self._reqs_options.setdefault(item, PackageOptionValues())
+        return self._writable_reqs_options().setdefault(item, PackageOptionValues())
 
     def __setitem__(self, item, value):
-        self._reqs_options[item] = value
+        self._writable_reqs_options()[item] = value
 
     def pop(self, item):
-        return self._reqs_options.pop(item, None)
+        return self._writable_reqs_options().pop(item, None)
 
     def remove(self, name, package=None):
         if package:
-            self._reqs_options[package].remove(name)
+            self._writable_reqs_options()[package].remove(name)
         else:
             self._package_values.remove(name)
 
@@ -220,10 +255,12 @@ class OptionsValues(object):
         return getattr(self._package_values, attr)
 
     def copy(self):
+        """ lazy deepcopy, the packages values are shared until modified by any of the copies
+        """
         result = OptionsValues()
         result._package_values = self._package_values.copy()
-        for k, v in self._reqs_options.items():
-            result._reqs_options[k] = v.copy()
+        result._reqs_options = self._reqs_options
+        result._shared = self._shared = True
         return result
 
     def __setattr__(self, attr, value):
@@ -235,10 +272,14 @@ class OptionsValues(object):
         delattr(self._package_values, attr)
 
     def clear_indirect(self):
-        for v in self._reqs_options.values():
+        for v in self._writable_reqs_options().values():
             v.clear()
 
     def filter_used(self, used_pkg_names):
+        used_pkg_names = set(used_pkg_names)
+        if all(k in used_pkg_names for k in self._reqs_options):
+            return
+        # The filtered values are still shared with other copies, if that was the case
         self._reqs_options = {k: v for k, v in self._reqs_options.items() if k in used_pkg_names}
 
     def as_list(self):
@@ -291,7 +332,8 @@ class OptionsValues(object):
 
     def clear(self):
         self._package_values.clear()
-        self._reqs_options.clear()
+        self._reqs_options = {}
+        self._shared = False
 
 
 class PackageOption(object):
@@ -44,24 +44,45 @@ class ConanName(object):
 class ConanFileReference(namedtuple("ConanFileReference", "name version user channel")):
     """ Full reference of a package recipes, e.g.:
     opencv/2.4.10@lasote/testing
+
+    Instances are interned: building the same reference again returns the already existing
+    object, without validating it again, so they are cheap to create, hash and compare
     """
     whitespace_pattern = re.compile(r"\s+")
     sep_pattern = re.compile("@|/")
+    # {(name, version, user, channel): (ConanFileReference, validated)}
+    _interned = {}
+    _max_interned = 100000  # Long living processes (conan_server) shouldn't grow forever
+    _str = None  # cached __repr__
+    _hash = None  # cached __hash__
 
-    def __new__(cls, name, version, user, channel):
+    def __new__(cls, name, version, user, channel, validate=True):
         """Simple name creation.
         @param name:        string containing the desired name
-        @param validate:    checks for valid complex name. default True
+        @param validate:    checks for valid complex name. default True. Use False only for
+                            trusted references, like the ones read from the local store
         """
-        ConanName.validate_name(name)
-        ConanName.validate_name(version, True)
-        ConanName.validate_name(user)
-        ConanName.validate_name(channel)
-        version = Version(version)
-        return super(cls, ConanFileReference).__new__(cls, name, version, user, channel)
+        key = (name, version, user, channel)
+        interned = ConanFileReference._interned.get(key)
+        if interned is not None and (interned[1] or not validate):
+            return interned[0]
+
+        if validate:
+            ConanName.validate_name(name)
+            ConanName.validate_name(version, True)
+            ConanName.validate_name(user)
+            ConanName.validate_name(channel)
+        if interned is not None:
+            ref = interned[0]
+        else:
+            ref = tuple.__new__(cls, (name, Version(version), user, channel))
+            if len(ConanFileReference._interned) >= ConanFileReference._max_interned:
+                ConanFileReference._interned.clear()
+        ConanFileReference._interned[key] = (ref, validate)
+        return ref
 
     @staticmethod
-    def loads(text):
+    def loads(text, validate=True):
         """ Parses a text string to generate a ConanFileReference object
         """
         text = ConanFileReference.whitespace_pattern.sub("", text)
@@ -71,10 +92,27 @@ class ConanFileReference(namedtuple("ConanFileReference", "name version user cha
         except ValueError:
             raise ConanException("Wrong package recipe reference %s\nWrite something like "
                                  "OpenCV/1.0.6@user/stable" % text)
-        return ConanFileReference(name, version, user, channel)
+        return ConanFileReference(name, version, user, channel, validate)
 
     def __repr__(self):
-        return "%s/%s@%s/%s" % (self.name, self.version, self.user, self.channel)
+        if self._str is None:
+            self._str = "%s/%s@%s/%s" % (self.name, self.version, self.user, self.channel)
+        return self._str
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = super(ConanFileReference, self).__hash__()
+        return self._hash
+
+    def __eq__(self, other):
+        return self is other or super(ConanFileReference, self).__eq__(other)
+
+    def __getstate__(self):
+        # The cached hash is only valid in this process, unpickle using just __new__ args
+        return None
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
 
 
 class PackageReference(namedtuple("PackageReference", "conan package_id")):
@@ -83,11 +121,11 @@ class PackageReference(namedtuple("PackageReference", "conan package_id")):
     """
 
     @staticmethod
-    def loads(text):
+    def loads(text, validate=True):
         text = text.strip()
         tmp = text.split(":")
         try:
-            conan = ConanFileReference.loads(tmp[0].strip())
+            conan = ConanFileReference.loads(tmp[0].strip(), validate)
             package_id = tmp[1].strip()
         except IndexError:
             raise ConanException("Wrong package reference  %s" % text)
@@ -29,10 +29,14 @@ class SettingsItem(object):
     - A range of valid values: [Debug, Release] (for settings.compiler.runtime of VS)
     - "ANY", as string to accept any value
     - A dict {subsetting: definition}, e.g. {version: [], runtime: []} for VS
+
+    The definition is shared between copies (copy-on-write), it is only duplicated, one
+    level at a time, when a copy needs to modify it or to access its children
     """
     def __init__(self, definition, name):
         self._name = name  # settings.compiler
         self._value = None  # gcc
+        self._shared = False  # True if _definition might be referenced by other copies
         if isinstance(definition, dict):
             self._definition = {}
             # recursive
@@ -49,14 +53,12 @@ class SettingsItem(object):
         return value in (self._value or "")
 
     def copy(self):
-        """ deepcopy, recursive
+        """ lazy deepcopy, the definition is shared until modified by any of the copies
         """
         result = SettingsItem({}, name=self._name)
         result._value = self._value
-        if self.is_final:
-            result._definition = self._definition[:]
-        else:
-            result._definition = {k: v.copy() for k, v in self._definition.items()}
+        result._definition = self._definition
+        result._shared = self._shared = True
         return result
 
     def copy_values(self):
@@ -66,11 +68,24 @@ class SettingsItem(object):
         result = SettingsItem({}, name=self._name)
         result._value = self._value
         if self.is_final:
-            result._definition = self._definition[:]
+            result._definition = self._definition
+            result._shared = self._shared = True
         else:
             result._definition = {k: v.copy_values() for k, v in self._definition.items()}
         return result
 
+    def _writable_definition(self):
+        """ copy-on-write: makes the definition private to this item before modifying it
+        or returning any of its children, which are mutable
+        """
+        if self._shared:
+            if isinstance(self._definition, dict):
+                self._definition = {k: v.copy() for k, v in self._definition.items()}
+            elif self._definition != "ANY":
+                self._definition = self._definition[:]
+            self._shared = False
+        return self._definition
+
     @property
     def is_final(self):
         return not isinstance(self._definition, dict)
@@ -109,13 +124,14 @@ class SettingsItem(object):
     def remove(self, values):
         if not isinstance(values, (list, tuple, set)):
             values = [values]
+        definition = self._writable_definition()
         for v in values:
             v = str(v)
-            if isinstance(self._definition, dict):
-                self._definition.pop(v, None)
-            elif self._definition != "ANY":
-                if v in self._definition:
-                    self._definition.remove(v)
+            if isinstance(definition, dict):
+                definition.pop(v, None)
+            elif definition != "ANY":
+                if v in definition:
+                    definition.remove(v)
         if self._value is not None and self._value not in self._definition:
             raise ConanException(bad_value_msg(self._name, self._value, self.values_range))
 
@@ -124,7 +140,7 @@ class SettingsItem(object):
             raise undefined_field(self._name, item, None, self._value)
         if self._value is None:
             raise undefined_value(self._name)
-        return self._definition[self._value]
+        return self._writable_definition()[self._value]
 
     def __getattr__(self, item):
         item = str(item)
@@ -142,7 +158,7 @@ class SettingsItem(object):
     def __getitem__(self, value):
         value = str(value)
         try:
-            return self._definition[value]
+            return self._writable_definition()[value]
         except:
             raise ConanException(bad_value_msg(self._name, value, self.values_range))
 
@@ -186,7 +202,7 @@ class SettingsItem(object):
 
     def remove_undefined(self):
         if isinstance(self._definition, dict):
-            self._definition[self._value].remove_undefined()
+            self._writable_definition()[self._value].remove_undefined()
 
 
 class Settings(object):
@@ -211,7 +227,8 @@ class Settings(object):
         return None
 
     def copy(self):
-        """ deepcopy, recursive
+        """ deepcopy, recursive. The items share their definitions (copy-on-write), so this
+        is cheap even for the full settings.yml tree
         """
         result = Settings({}, name=self._name, parent_value=self._parent_value)
         for k, v in self._data.items():
@@ -230,7 +247,13 @@ class Settings(object):
 
     @staticmethod
     def loads(text):
-        return Settings(yaml.load(text) or {})
+        return Settings(Settings.loads_definition(text))
+
+    @staticmethod
+    def loads_definition(text):
+        """ the parsed settings.yml, a plain {setting: definition} dict
+        """
+        return yaml.load(text) or {}
 
     def validate(self):
         for field in self.fields:
@@ -7,33 +7,49 @@ class Values(object):
         self._value = str(value)
         self._dict = {}  # {key: Values()}
         self._modified = {}  # {"compiler.version.arch": (old_value, old_reference)}
+        self._shared = False  # True if _dict might be referenced by other copies
+        self._sha = None  # cached, computing it for every package_id() call is expensive
+
+    def _writable_dict(self):
+        """ copy-on-write: makes the children private to this object before modifying them
+        or returning any of them, as they are mutable. For the same reason it invalidates
+        the cached sha
+        """
+        self._sha = None
+        if self._shared:
+            self._dict = {k: v.copy() for k, v in self._dict.items()}
+            self._shared = False
+        return self._dict
 
     def __getattr__(self, attr):
         if attr not in self._dict:
             return None
-        return self._dict[attr]
+        return self._writable_dict()[attr]
 
     def __delattr__(self, attr):
         if attr not in self._dict:
             return
-        del self._dict[attr]
+        del self._writable_dict()[attr]
 
     def clear(self):
         # TODO: Test. DO not delete, might be used by package_id() to clear settings values
-        self._dict.clear()
+        self._dict = {}
+        self._shared = False
+        self._sha = None
         self._value = ""
 
     def __setattr__(self, attr, value):
         if attr[0] == "_":
             return super(Values, self).__setattr__(attr, value)
-        self._dict[attr] = Values(value)
+        self._writable_dict()[attr] = Values(value)
 
     def copy(self):
-        """ deepcopy, recursive
+        """ lazy deepcopy, the children are shared until modified by any of the copies
         """
         result = Values(self._value)
-        for k, v in self._dict.items():
-            result._dict[k] = v.copy()
+        result._dict = self._dict
+        result._shared = self._shared = True
+        result._sha = self._sha
         return result
 
     @property
@@ -70,7 +86,7 @@ class Values(object):
     def as_list(self, list_all=True):
         result = []
         for field in self.fields:
-            value = getattr(self, field)
+            value = self._dict[field]
             if value or list_all:
                 result.append((field, str(value)))
                 child_lines = value.as_list()
@@ -106,11 +122,13 @@ class Values(object):
 
     @property
     def sha(self):
-        result = []
-        for (name, value) in self.as_list(list_all=False):
-            # It is important to discard None values, so migrations in settings can be done
-            # without breaking all existing packages SHAs, by adding a first "None" option
-            # that doesn't change the final sha
-            if value != "None":
-                result.append("%s=%s" % (name, value))
-        return sha1('\n'.join(result).encode())
+        if self._sha is None:
+            result = []
+            for (name, value) in self.as_list(list_all=False):
+                # It is important to discard None values, so migrations in settings can be done
+                # without breaking all existing packages SHAs, by adding a first "None" option
+                # that doesn't change the final sha
+                if value != "None":
+                    result.append("%s=%s" % (name, value))
+            self._sha = sha1('\n'.join(result).encode())
+        return self._sha
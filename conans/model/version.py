@@ -6,13 +6,14 @@ class Version(str):
     It is just a helper to parse .-, and compare taking into account integers when possible
     """
     version_pattern = re.compile('[.-]')
+    _cached_list = None
 
     def __new__(cls, content):
         return str.__new__(cls, content.strip())
 
     @property
     def as_list(self):
-        if not hasattr(self, "_cached_list"):
+        if self._cached_list is None:
             tokens = self.rsplit('+', 1)
             self._base = tokens[0]
             if len(tokens) == 2:
@@ -98,20 +99,17 @@ class Version(str):
         if not isinstance(other, Version):
             other = Version(other)
 
-        # Check equals
-        def get_el(a_list, index):
-            if len(a_list) - 1 < index:
-                return 0  # out of range, 4 == 4.0 == 4.0.0
-            return a_list[index]
+        self_list = self.as_list
+        other_list = other.as_list
 
-        equals = all(get_el(other.as_list, ind) == get_el(self.as_list, ind)
-                     for ind in range(0, max(len(other.as_list), len(self.as_list))))
-        if equals:
+        # Check equals, out of range is 0: 4 == 4.0 == 4.0.0
+        length = max(len(self_list), len(other_list))
+        if (self_list + [0] * (length - len(self_list)) ==
+                other_list + [0] * (length - len(other_list))):
             return 0
 
         # Check greater than or less than
-        other_list = other.as_list
-        for ind, el in enumerate(self.as_list):
+        for ind, el in enumerate(self_list):
             if ind + 1 > len(other_list):
                 if isinstance(el, int):
                     return 1
@@ -127,7 +125,7 @@ class Version(str):
                 return 1
             else:
                 return -1
-        if len(other_list) > len(self.as_list):
+        if len(other_list) > len(self_list):
             return -1
 
     def __gt__(self, other):
@@ -10,7 +10,7 @@ from conans.model.ref import PackageReference, ConanFileReference
 from conans.paths import CONANINFO
 from conans.util.log import logger
 from conans.search.query_parse import infix_to_postfix, evaluate_postfix
-from conans.util.files import list_folder_subdirs, load
+from conans.util.files import list_folder_subdirs, load, file_signature
 
 
 def filter_outdated(packages_infos, recipe_hash):
@@ -82,13 +82,19 @@ def search_recipes(paths, pattern=None, ignorecase=True):
         pattern = translate(pattern)
         pattern = re.compile(pattern, re.IGNORECASE) if ignorecase else re.compile(pattern)
 
-    subdirs = list_folder_subdirs(basedir=paths.store, level=4)
+    cache_index = getattr(paths, "cache_index", None)
+    if cache_index is not None:
+        subdirs = cache_index.recipe_folders()
+    else:
+        subdirs = list_folder_subdirs(basedir=paths.store, level=4)
+    # The store folders were created from already validated references
     if not pattern:
-        return sorted([ConanFileReference(*folder.split("/")) for folder in subdirs])
+        return sorted([ConanFileReference(*folder.split("/"), validate=False)
+                       for folder in subdirs])
     else:
         ret = []
         for subdir in subdirs:
-            conan_ref = ConanFileReference(*subdir.split("/"))
+            conan_ref = ConanFileReference(*subdir.split("/"), validate=False)
             if pattern:
                 if pattern.match(str(conan_ref)):
                     ret.append(conan_ref)
@@ -108,6 +114,9 @@ def search_packages(paths, reference, query):
 
 
 def _get_local_infos_min(paths, reference):
+    cache_index = getattr(paths, "cache_index", None)
+    indexed = cache_index.package_infos(reference) if cache_index is not None else {}
+    updated = {}
     result = {}
     packages_path = paths.packages(reference)
     subdirs = list_folder_subdirs(packages_path, level=1)
@@ -119,13 +128,24 @@ def _get_local_infos_min(paths, reference):
                                                    short_paths=None), CONANINFO)
             if not os.path.exists(info_path):
                 raise NotFoundException("")
+            if cache_index is not None:
+                signature = file_signature(info_path)
+                cached = indexed.get(package_id)
+                if signature is not None and cached is not None and cached[0] == signature:
+                    result[package_id] = cached[1]
+                    continue
             conan_info_content = load(info_path)
             conan_vars_info = ConanInfo.loads(conan_info_content).serialize_min()
             result[package_id] = conan_vars_info
+            if cache_index is not None and signature is not None:
+                updated[package_id] = (signature, conan_vars_info)
 
         except Exception as exc:
             logger.error("Package %s has no ConanInfo file" % str(package_reference))
             if str(exc):
                 logger.error(str(exc))
 
+    if cache_index is not None:
+        removed = [package_id for package_id in indexed if package_id not in result]
+        cache_index.update_package_infos(reference, updated, removed)
     return result
@@ -1,6 +1,7 @@
 """
 Server's configuration variables
 """
+import requests
 import six
 
 from conans import tools
@@ -15,6 +16,7 @@ from six.moves.configparser import ConfigParser, NoSectionError
 from conans.paths import SimplePaths, conan_expand_user
 from conans.server.store.disk_adapter import ServerDiskAdapter
 from conans.server.store.file_manager import FileManager
+from conans.server.store.upstream import Upstream, UpstreamFileManager
 from conans.util.log import logger
 from conans.server.conf.default_server_conf import default_server_conf
 
@@ -45,6 +47,12 @@ class ConanServerConfigParser(ConfigParser):
                            "public_port": get_env("CONAN_SERVER_PUBLIC_PORT", None, environment),
                            "host_name": get_env("CONAN_HOST_NAME", None, environment),
                            "custom_authenticator": get_env("CONAN_CUSTOM_AUTHENTICATOR", None, environment),
+                           "upstream_url": get_env("CONAN_SERVER_UPSTREAM_URL", None, environment),
+                           "upstream_user": get_env("CONAN_SERVER_UPSTREAM_USER", None, environment),
+                           "upstream_password": get_env("CONAN_SERVER_UPSTREAM_PASSWORD", None,
+                                                        environment),
+                           "upstream_revalidate": get_env("CONAN_SERVER_UPSTREAM_REVALIDATE", None,
+                                                          environment),
                            # "user:pass,user2:pass2"
                            "users": get_env("CONAN_SERVER_USERS", None, environment)}
 
@@ -156,6 +164,38 @@ class ConanServerConfigParser(ConfigParser):
         except ConanException:
             return None
 
+    @property
+    def upstream_url(self):
+        """ If defined, this server is a pull-through cache of that conan remote
+        """
+        try:
+            return self._get_conf_server_string("upstream_url")
+        except ConanException:
+            return None
+
+    @property
+    def upstream_credentials(self):
+        try:
+            return (self._get_conf_server_string("upstream_user"),
+                    self._get_conf_server_string("upstream_password"))
+        except ConanException:
+            return None, None
+
+    @property
+    def upstream_revalidate(self):
+        """ seconds after which the stored recipes and packages are checked against the upstream
+        ones, None to never check them again
+        """
+        try:
+            value = self._get_conf_server_string("upstream_revalidate")
+        except ConanException:
+            return None
+        try:
+            return int(value)
+        except ValueError:
+            raise ConanException("Invalid 'upstream_revalidate' value '%s', it has to be a "
+                                 "number of seconds" % value)
+
     @property
     def users(self):
         def validate_pass_encoding(password):
@@ -217,7 +257,7 @@ class ConanServerConfigParser(ConfigParser):
         return timedelta(minutes=float(self._get_conf_server_string("jwt_expire_minutes")))
 
 
-def get_file_manager(config, public_url=None, updown_auth_manager=None):
+def get_file_manager(config, public_url=None, updown_auth_manager=None, upstream_requester=None):
     store_adapter = config.store_adapter
     if store_adapter == "disk":
         public_url = public_url or config.public_url
@@ -231,4 +271,10 @@ def get_file_manager(config, public_url=None, updown_auth_manager=None):
         # conans.server.store.file_manager.ServerStorageAdapter and implement the abstract methods
         raise Exception("Store adapter not implemented! Change 'store_adapter' "
                         "variable in server.conf file to one of the available options: 'disk' ")
+    upstream_url = config.upstream_url
+    if upstream_url:
+        user, password = config.upstream_credentials
+        upstream = Upstream(upstream_url, upstream_requester or requests.Session(), user, password,
+                            config.upstream_revalidate)
+        return UpstreamFileManager(paths, adapter, upstream)
     return FileManager(paths, adapter)
@@ -22,6 +22,14 @@ disk_storage_path: ~/.conan_server/data
 disk_authorize_timeout: 1800
 updown_secret: {updown_secret}
 
+# Pull-through cache: the recipes and packages not found in this server are retrieved from the
+# upstream conan remote, stored and served from this server from then on. The stored ones are
+# checked again against the upstream ones after upstream_revalidate seconds (empty: never)
+# upstream_url: https://conan.mycompany.com
+# upstream_user:
+# upstream_password:
+# upstream_revalidate: 600
+
 # Check docs.conan.io to implement a different authenticator plugin for conan_server
 # if custom_authenticator is not specified, [users] section will be used to authenticate
 # the users.
@@ -21,9 +21,12 @@ class FileUploadDownloadController(Controller):
             file_path = service.get_file_path(filepath, token)
             # https://github.com/kennethreitz/requests/issues/1586
             mimetype = "x-gzip" if filepath.endswith(".tgz") else "auto"
-            return static_file(os.path.basename(file_path),
-                               root=os.path.dirname(file_path),
-                               mimetype=mimetype)
+            result = static_file(os.path.basename(file_path),
+                                 root=os.path.dirname(file_path),
+                                 mimetype=mimetype)
+            if os.path.isfile(file_path):
+                app.file_manager.file_served(file_path)
+            return result
 
         @app.route(self.route + '/<filepath:path>', method=["PUT"])
         def put(filepath):
@@ -96,6 +96,11 @@ class FileManager(object):
             path = os.path.join(subpath, filepath)
             self._storage_adapter.delete_file(path)
 
+    def file_served(self, abs_path):
+        """ Called after a file of the storage is downloaded by a client
+        """
+        pass
+
     # ############ INTERNAL METHODS
     def _get_snapshot_of_files(self, relative_path):
         snapshot = self._storage_adapter.get_snapshot(relative_path)
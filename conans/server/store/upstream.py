@@ -0,0 +1,197 @@
+""" Pull-through cache: the recipes and packages not found in the storage of this server
+are retrieved from an upstream conan remote, stored and then served locally
+"""
+import os
+import threading
+import time
+
+from requests.exceptions import RequestException
+
+from conans.client.output import ConanOutput
+from conans.client.rest.rest_client import RestApiClient
+from conans.errors import NotFoundException, ConanException, AuthenticationException
+from conans.model.manifest import FileTreeManifest
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.paths import CONAN_MANIFEST
+from conans.server.store.file_manager import FileManager
+from conans.util.files import rmdir
+from conans.util.log import logger
+
+
+def _mb(size):
+    return size / (1024.0 * 1024.0)
+
+
+class _LoggerStream(object):
+    """ The output of the RestApiClient goes to the server log
+    """
+    def write(self, data):
+        data = data.strip()
+        if data:
+            logger.debug(data)
+
+    def flush(self):
+        pass
+
+
+class UpstreamStats(object):
+    """ The bandwidth saved to the upstream remote: the bytes served by this server that
+    didn't need to be retrieved from the upstream remote
+    """
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.upstream_bytes = 0
+        self.served_bytes = 0
+
+    @property
+    def saved_bytes(self):
+        return max(0, self.served_bytes - self.upstream_bytes)
+
+    def report(self):
+        percent = 100 * self.saved_bytes // self.served_bytes if self.served_bytes else 0
+        return ("Upstream cache: %d hits, %d misses, %d revalidations, %.1f MB from upstream, "
+                "%.1f MB served, %.1f MB saved (%d%%)"
+                % (self.hits, self.misses, self.revalidations, _mb(self.upstream_bytes),
+                   _mb(self.served_bytes), _mb(self.saved_bytes), percent))
+
+
+class Upstream(object):
+    """ The connection to the upstream remote
+    """
+    def __init__(self, url, requester, user=None, password=None, revalidate=None):
+        """ revalidate: seconds after which the manifests of the stored recipes and packages are
+        checked again against the upstream ones, None to never check them again
+        """
+        self.url = url
+        self.revalidate = revalidate
+        self._user = user
+        self._password = password
+        self._rest_client = RestApiClient(ConanOutput(_LoggerStream()), requester)
+        self._rest_client.remote_url = url
+        self._auth_lock = threading.Lock()
+
+    @property
+    def rest_client(self):
+        if self._user and not self._rest_client.token:
+            with self._auth_lock:
+                if not self._rest_client.token:
+                    self._rest_client.token = self._rest_client.authenticate(self._user,
+                                                                             self._password)
+        return self._rest_client
+
+    def call(self, function, *args):
+        """ returns function(rest_client, *args), authenticating again and retrying once if
+        the token was rejected, as it expires
+        """
+        token = self._rest_client.token
+        try:
+            return function(self.rest_client, *args)
+        except AuthenticationException:
+            if not self._user:
+                raise
+            logger.info("Upstream cache: authenticating again in %s" % self.url)
+            with self._auth_lock:
+                if self._rest_client.token == token:  # Not already renewed by another thread
+                    self._rest_client.token = None
+            return function(self.rest_client, *args)
+
+
+class UpstreamFileManager(FileManager):
+    """ FileManager that fetches the recipes and packages from the upstream remote when they
+    are not in the storage, or when the upstream ones changed (after "revalidate" seconds)
+    """
+    def __init__(self, paths, storage_adapter, upstream):
+        super(UpstreamFileManager, self).__init__(paths, storage_adapter)
+        self._upstream = upstream
+        self._validated = {}  # {folder: time}
+        self._lock = threading.Lock()  # Only for the locks of the references
+        self._reference_locks = {}
+        self.stats = UpstreamStats()
+
+    def get_conanfile_snapshot(self, reference):
+        self._fetch(reference)
+        return super(UpstreamFileManager, self).get_conanfile_snapshot(reference)
+
+    def get_package_snapshot(self, package_reference):
+        self._fetch(package_reference)
+        return super(UpstreamFileManager, self).get_package_snapshot(package_reference)
+
+    def get_download_conanfile_urls(self, reference, files_subset=None, user=None):
+        self._fetch(reference)
+        return super(UpstreamFileManager, self).get_download_conanfile_urls(reference,
+                                                                            files_subset, user)
+
+    def get_download_package_urls(self, package_reference, files_subset=None, user=None):
+        self._fetch(package_reference)
+        return super(UpstreamFileManager, self).get_download_package_urls(package_reference,
+                                                                          files_subset, user)
+
+    def file_served(self, abs_path):
+        self.stats.served_bytes += os.path.getsize(abs_path)
+        logger.info(self.stats.report())
+
+    def _reference_lock(self, folder):
+        with self._lock:
+            return self._reference_locks.setdefault(folder, threading.Lock())
+
+    def _fetch(self, reference):
+        """ Retrieves the recipe or package from upstream if not stored or outdated. Only the
+        requests of the same recipe or package wait for it
+        """
+        if isinstance(reference, ConanFileReference):
+            folder = self.paths.export(reference)
+        else:
+            folder = self.paths.package(reference)
+        with self._reference_lock(folder):
+            try:
+                self._upstream.call(self._fetch_folder, reference, folder)
+            except NotFoundException:
+                pass  # Not upstream either, or removed upstream but still served locally
+            except (ConanException, RequestException) as exc:
+                # Upstream not available, serve what is stored, if anything
+                logger.error("Upstream cache: error retrieving %s from %s: %s"
+                             % (str(reference), self._upstream.url, str(exc)))
+
+    def _fetch_folder(self, rest_client, reference, folder):
+        if os.path.exists(os.path.join(folder, CONAN_MANIFEST)):
+            if not self._outdated(rest_client, reference, folder):
+                self.stats.hits += 1
+                return
+            logger.info("Upstream cache: %s changed upstream" % str(reference))
+        else:
+            self.stats.misses += 1
+        self._download(rest_client, reference, folder)
+
+    def _outdated(self, rest_client, reference, folder):
+        revalidate = self._upstream.revalidate
+        validated = self._validated.get(folder)
+        if revalidate is None or (validated and time.time() - validated < revalidate):
+            return False
+        self.stats.revalidations += 1
+        if isinstance(reference, PackageReference):
+            upstream_manifest = rest_client.get_package_manifest(reference)
+        else:
+            upstream_manifest = rest_client.get_conan_manifest(reference)
+        self._validated[folder] = time.time()
+        return upstream_manifest != FileTreeManifest.load(folder)
+
+    def _download(self, rest_client, reference, folder):
+        if isinstance(reference, PackageReference):
+            urls = rest_client.get_package_urls(reference)
+        else:
+            urls = rest_client.get_recipe_urls(reference)
+        # Downloaded to a temporary folder, not to serve incomplete recipes or packages
+        tmp_folder = folder + ".upstream"
+        rmdir(tmp_folder)
+        try:
+            files = rest_client.download_files_to_folder(urls, tmp_folder)
+            rmdir(folder)
+            os.rename(tmp_folder, folder)
+        finally:
+            rmdir(tmp_folder)
+        self._validated[folder] = time.time()
+        self.stats.upstream_bytes += sum(os.path.getsize(os.path.join(folder, f))
+                                         for f in files)
+        logger.info("Upstream cache: retrieved %s from %s" % (str(reference), self._upstream.url))
@@ -0,0 +1,117 @@
+import os
+import platform
+import stat
+import sys
+import unittest
+
+from conans import tools
+from conans.client.build.autotools_environment import AutoToolsBuildEnvironment
+from conans.client.build.cmake import CMake
+from conans.client.build.compiler_cache import parse_stats
+from conans.client.conf import default_settings_yml
+from conans.model.settings import Settings
+from conans.test.build_helpers.cmake_test import ConanFileMock
+from conans.test.utils.conanfile import MockConanfile, MockSettings
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import save, load
+
+
+# Behaves as ccache for the statistics, and records the calls in the cache folder
+stub_launcher = """#!%s
+import os, sys
+with open(os.path.join(os.environ["CCACHE_DIR"], "calls.txt"), "a") as f:
+    f.write(" ".join(sys.argv[1:]) + "\\n")
+if sys.argv[1:] == ["--show-stats"]:
+    print("cache directory   " + os.environ["CCACHE_DIR"])
+    print("cache hit (direct)   2")
+    print("cache hit (preprocessed)   1")
+    print("cache miss   1")
+    print("cache hit rate   75.00 %%")
+""" % sys.executable
+
+
+class CompilerCacheTest(unittest.TestCase):
+
+    def parse_stats_test(self):
+        ccache4 = """Cacheable calls:   17 / 17 (100.0%)
+  Hits:            12 / 17 (70.59%)
+    Direct:        10 / 12 (83.33%)
+    Preprocessed:   2 / 12 (16.67%)
+  Misses:           5 / 17 (29.41%)
+Local storage:
+  Cache size (GB): 0.01 / 5.00 ( 0.20%)
+  Hits:            12 / 17 (70.59%)
+  Misses:           5 / 17 (29.41%)
+"""
+        self.assertEqual(parse_stats(ccache4), (12, 5))
+        sccache = """Compile requests                     20
+Cache hits                           15
+Cache hits (C/C++)                   15
+Cache misses                          3
+"""
+        self.assertEqual(parse_stats(sccache), (15, 3))
+        self.assertEqual(parse_stats("unknown output"), (0, 0))
+
+    def _launcher(self):
+        folder = temp_folder()
+        launcher = os.path.join(folder, "stubcache")
+        save(launcher, stub_launcher)
+        os.chmod(launcher, os.stat(launcher).st_mode | stat.S_IEXEC)
+        cache_dir = os.path.join(folder, "cache")
+        os.makedirs(cache_dir)
+        return launcher, cache_dir
+
+    def cmake_test(self):
+        if platform.system() == "Windows":
+            return
+        launcher, cache_dir = self._launcher()
+        settings = Settings.loads(default_settings_yml)
+        settings.os = "Linux"
+        settings.compiler = "gcc"
+        settings.compiler.version = "6.3"
+        settings.arch = "x86_64"
+        settings.build_type = "Release"
+        conanfile = ConanFileMock()
+        conanfile.settings = settings
+
+        cmake = CMake(conanfile)
+        self.assertNotIn("CMAKE_CXX_COMPILER_LAUNCHER", cmake.definitions)
+
+        with tools.environment_append({"CONAN_COMPILER_LAUNCHER": launcher,
+                                       "CONAN_COMPILER_CACHE_DIR": cache_dir}):
+            cmake = CMake(conanfile)
+            self.assertEqual(cmake.definitions["CMAKE_C_COMPILER_LAUNCHER"], launcher)
+            self.assertEqual(cmake.definitions["CMAKE_CXX_COMPILER_LAUNCHER"], launcher)
+            self.assertIn('-DCMAKE_CXX_COMPILER_LAUNCHER="%s"' % launcher, cmake.command_line)
+            cmake.build()
+        self.assertIn("cmake --build", conanfile.command)
+        self.assertEqual(load(os.path.join(cache_dir, "calls.txt")),
+                         "--zero-stats\n--show-stats\n")
+        self.assertIn("Compiler cache (stubcache): 3 hits, 1 misses, 75% hit rate",
+                      conanfile.output)
+
+    def autotools_test(self):
+        if platform.system() == "Windows":
+            return
+        launcher, cache_dir = self._launcher()
+        settings = MockSettings({"build_type": "Release",
+                                 "arch": "x86_64",
+                                 "compiler": "gcc",
+                                 "compiler.version": "6.3"})
+        runs = []
+
+        def runner(command, output=None, win_bash=False, subsystem=None):
+            runs.append((command, os.environ.get("CC"), os.environ.get("CCACHE_DIR")))
+
+        conanfile = MockConanfile(settings, runner=runner)
+        self.assertNotIn("CC", AutoToolsBuildEnvironment(conanfile).vars)
+
+        with tools.environment_append({"CONAN_COMPILER_LAUNCHER": launcher,
+                                       "CONAN_COMPILER_CACHE_DIR": cache_dir,
+                                       "CXX": "g++-6"}):
+            autotools = AutoToolsBuildEnvironment(conanfile)
+            self.assertEqual(autotools.vars["CC"], "%s gcc" % launcher)
+            self.assertEqual(autotools.vars["CXX"], "%s g++-6" % launcher)
+            autotools.make()
+        self.assertEqual(runs[0][1:], ("%s gcc" % launcher, cache_dir))
+        self.assertIn("Compiler cache (stubcache): 3 hits, 1 misses", conanfile.output)
@@ -0,0 +1,183 @@
+import os
+import sqlite3
+import time
+import unittest
+
+from conans.client.client_cache import CACHE_INDEX
+from conans.client.cmd.cache import parse_age
+from conans.errors import ConanException
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.paths import CONANINFO
+from conans.test.utils.tools import TestClient
+from conans.util.config_parser import parse_size
+from conans.util.files import load, rmdir, save
+
+
+conanfile = """from conans import ConanFile
+class Pkg(ConanFile):
+    settings = "os"
+"""
+
+
+def _age(folder):
+    # The index doesn't trust what was modified in the last seconds
+    old = time.time() - 100
+    for root, dirs, files in os.walk(folder):
+        for f in dirs + files:
+            os.utime(os.path.join(root, f), (old, old))
+    os.utime(folder, (old, old))
+
+
+class CacheIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TestClient()
+        self.client.save({"conanfile.py": conanfile})
+        self.client.run("create . Pkg/0.1@lasote/testing -s os=Windows")
+        self.client.run("create . Pkg/0.1@lasote/testing -s os=Linux")
+        _age(self.client.storage_folder)
+
+    def search_test(self):
+        self.client.run("search")
+        self.assertIn("Pkg/0.1@lasote/testing", self.client.out)
+        self.client.run('search Pkg/0.1@lasote/testing -q os=Linux')
+        self.assertIn("os: Linux", self.client.out)
+        self.assertNotIn("os: Windows", self.client.out)
+
+        # Changes done out of conan are detected
+        ref = ConanFileReference.loads("Pkg/0.1@lasote/testing")
+        paths = self.client.client_cache
+        packages = os.listdir(paths.packages(ref))
+        for package_id in packages:
+            info_path = os.path.join(paths.package(PackageReference(ref, package_id)), CONANINFO)
+            save(info_path, load(info_path).replace("os=Windows", "os=Linux"))
+            _age(os.path.dirname(info_path))
+        save(os.path.join(paths.conan(ConanFileReference.loads("Other/0.1@lasote/testing")),
+                          "export", "conanfile.py"), conanfile)
+        _age(self.client.storage_folder)
+
+        self.client.run("search")
+        self.assertIn("Other/0.1@lasote/testing", self.client.out)
+        self.client.run('search Pkg/0.1@lasote/testing -q os=Linux')
+        self.assertEqual(str(self.client.out).count("os: Linux"), 2)
+
+        self.client.run("remove Other* -f")
+        self.client.run("search")
+        self.assertNotIn("Other/0.1@lasote/testing", self.client.out)
+
+    def rebuild_index_test(self):
+        self.client.run("search Pkg/0.1@lasote/testing")
+        self.client.run("cache rebuild-index")
+        self.assertIn("Indexed 1 recipes and 2 packages", self.client.out)
+        self.assertNotIn("outdated", self.client.out)
+
+        # Removed out of conan
+        ref = ConanFileReference.loads("Pkg/0.1@lasote/testing")
+        package_id = os.listdir(self.client.client_cache.packages(ref))[0]
+        rmdir(self.client.client_cache.package(PackageReference(ref, package_id)))
+        self.client.run("cache rebuild-index")
+        self.assertIn("Indexed 1 recipes and 1 packages", self.client.out)
+        self.assertIn("1 outdated entries were found in the previous index", self.client.out)
+
+    def _indexed(self):
+        index = os.path.join(self.client.client_cache.conan_folder, CACHE_INDEX)
+        connection = sqlite3.connect(index)
+        try:
+            return connection.execute("select reference, size from packages "
+                                      "order by reference").fetchall()
+        finally:
+            connection.close()
+
+    def commands_update_test(self):
+        # Indexed with their sizes by the create, without searching nor rebuilding it
+        indexed = self._indexed()
+        self.assertEqual([ref for ref, _ in indexed], ["Pkg/0.1@lasote/testing"] * 2)
+        self.assertTrue(all(size > 0 for _, size in indexed))
+
+        self.client.run("copy Pkg/0.1@lasote/testing lasote/stable --all")
+        self.assertEqual([ref for ref, _ in self._indexed()],
+                         ["Pkg/0.1@lasote/stable"] * 2 + ["Pkg/0.1@lasote/testing"] * 2)
+        self.client.run("search")
+        self.assertIn("Pkg/0.1@lasote/stable", self.client.out)
+
+        ref = ConanFileReference.loads("Pkg/0.1@lasote/testing")
+        package_id = os.listdir(self.client.client_cache.packages(ref))[0]
+        self.client.run("remove Pkg/0.1@lasote/testing -p %s -f" % package_id)
+        self.assertEqual(len(self._indexed()), 3)
+        self.client.run("remove Pkg/0.1@lasote/stable -f")
+        self.assertEqual(len(self._indexed()), 1)
+        self.client.run("search")
+        self.assertNotIn("Pkg/0.1@lasote/stable", self.client.out)
+        self.assertIn("Pkg/0.1@lasote/testing", self.client.out)
+
+
+class CacheGCTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TestClient()
+        self.client.save({"conanfile.py": conanfile})
+        for os_ in ("Windows", "Linux", "Macos"):
+            self.client.run("create . Pkg/0.1@lasote/testing -s os=%s" % os_)
+        _age(self.client.storage_folder)
+        index = os.path.join(self.client.client_cache.conan_folder, CACHE_INDEX)
+        connection = sqlite3.connect(index)
+        connection.execute("update access set last_access=last_access-100")
+        connection.commit()
+        connection.close()
+        self.reference = ConanFileReference.loads("Pkg/0.1@lasote/testing")
+
+    def _folders(self, folder):
+        folder = getattr(self.client.client_cache, folder)(self.reference)
+        return sorted(os.listdir(folder)) if os.path.exists(folder) else []
+
+    def max_age_test(self):
+        self.client.run("install Pkg/0.1@lasote/testing -s os=Linux")
+        self.assertEqual(len(self._folders("packages")), 3)
+        self.assertEqual(len(self._folders("builds")), 3)
+
+        self.client.run("cache gc --max-age 1m")
+        packages = self._folders("packages")
+        self.assertEqual(len(packages), 1)
+        self.assertEqual(self._folders("builds"), [])
+        self.assertIn("Removed package Pkg/0.1@lasote/testing:", self.client.out)
+        self.assertIn("Removed build Pkg/0.1@lasote/testing:", self.client.out)
+        self.assertIn("removing 5 folders", self.client.out)
+        self.client.run("search Pkg/0.1@lasote/testing")
+        self.assertIn("os: Linux", self.client.out)
+        self.assertNotIn("os: Windows", self.client.out)
+
+    def max_size_test(self):
+        self.client.run("install Pkg/0.1@lasote/testing -s os=Linux")
+        self.client.run("cache gc --max-size 0")
+        self.assertEqual(self._folders("packages"), [])
+        self.assertEqual(self._folders("builds"), [])
+        self.assertIn("removing 6 folders", self.client.out)
+        self.assertIn("The cache is still bigger than 0.0 MB", self.client.out)
+        # The least recently used first
+        self.assertLess(str(self.client.out).index("Removed build"),
+                        str(self.client.out).index("Removed package Pkg/0.1@lasote/testing:"
+                                                   "cb054d0b3e1ca595dc66bc2339d40f1f8f04ab31"))
+
+    def locked_test(self):
+        with self.client.client_cache.conanfile_read_lock(self.reference):
+            self.client.run("cache gc --max-size 0")
+        self.assertIn("Skipping package Pkg/0.1@lasote/testing", self.client.out)
+        self.assertIn("removing 0 folders", self.client.out)
+        self.assertEqual(len(self._folders("packages")), 3)
+
+    def errors_test(self):
+        error = self.client.run("cache gc", ignore_error=True)
+        self.assertTrue(error)
+        self.assertIn("Specify --max-size and/or --max-age", self.client.out)
+        error = self.client.run("cache gc --max-size 3X", ignore_error=True)
+        self.assertTrue(error)
+        self.assertIn("Invalid size '3X'", self.client.out)
+
+    def parse_test(self):
+        self.assertEqual(parse_size("1024"), 1024)
+        self.assertEqual(parse_size("2K"), 2048)
+        self.assertEqual(parse_size("1.5GB"), int(1.5 * 1024 ** 3))
+        self.assertEqual(parse_age("90m"), 5400)
+        self.assertEqual(parse_age("2d"), 2 * 24 * 3600)
+        with self.assertRaisesRegexp(ConanException, "Invalid age"):
+            parse_age("3 months")
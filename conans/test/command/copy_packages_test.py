@@ -1,7 +1,8 @@
 import unittest
 from conans.test.utils.tools import TestClient
 import os
-from conans.model.ref import ConanFileReference
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.util.files import save
 
 
 class CopyPackagesTest(unittest.TestCase):
@@ -39,3 +40,60 @@ class Pkg(ConanFile):
         client.run("copy Hello0/0.1@lasote/stable pepe/alpha", ignore_error=True)
         pkgdir = client.paths.packages(ConanFileReference.loads("Hello0/0.1@pepe/alpha"))
         self.assertFalse(os.path.exists(pkgdir))
+
+    def test_copy_link(self):
+        client = TestClient()
+        conanfile = """from conans import ConanFile
+class Pkg(ConanFile):
+    settings = "os"
+    exports_sources = "*.h"
+    def package(self):
+        self.copy("*.h", dst="include")
+"""
+        client.save({"conanfile.py": conanfile, "header.h": "//header"})
+        client.run("create . Hello0/0.1@lasote/stable -s os=Windows")
+        client.run("create . Hello0/0.1@lasote/stable -s os=Linux")
+
+        client.run("copy Hello0/0.1@lasote/stable pepe/testing --all --link hardlink")
+        self.assertIn("Copied sources Hello0/0.1@lasote/stable to Hello0/0.1@pepe/testing",
+                      client.out)
+        src_ref = ConanFileReference.loads("Hello0/0.1@lasote/stable")
+        dst_ref = ConanFileReference.loads("Hello0/0.1@pepe/testing")
+        packages = os.listdir(client.paths.packages(dst_ref))
+        self.assertEqual(len(packages), 2)
+        for package_id in packages:
+            src = client.paths.package(PackageReference(src_ref, package_id))
+            dst = client.paths.package(PackageReference(dst_ref, package_id))
+            self.assertTrue(os.path.samefile(os.path.join(src, "include", "header.h"),
+                                             os.path.join(dst, "include", "header.h")))
+            self.assertFalse(os.path.samefile(os.path.join(src, "conaninfo.txt"),
+                                              os.path.join(dst, "conaninfo.txt")))
+        self.assertTrue(os.path.samefile(os.path.join(client.paths.export(src_ref),
+                                                      "conanfile.py"),
+                                         os.path.join(client.paths.export(dst_ref),
+                                                      "conanfile.py")))
+        client.run("install Hello0/0.1@pepe/testing -s os=Linux")
+        self.assertIn("Hello0/0.1@pepe/testing: Already installed!", client.out)
+
+        # The reflinks fall back to a copy if the file system doesn't support them
+        client.run("copy Hello0/0.1@lasote/stable pepe/stable --all --link reflink")
+        packages = os.listdir(client.paths.packages(ConanFileReference.loads(
+            "Hello0/0.1@pepe/stable")))
+        self.assertEqual(len(packages), 2)
+
+    def test_copy_link_corrupted(self):
+        client = TestClient()
+        conanfile = """from conans import ConanFile
+class Pkg(ConanFile):
+    pass
+"""
+        client.save({"conanfile.py": conanfile})
+        client.run("create . Hello0/0.1@lasote/stable")
+        src_ref = ConanFileReference.loads("Hello0/0.1@lasote/stable")
+        package_id = os.listdir(client.paths.packages(src_ref))[0]
+        save(os.path.join(client.paths.package(PackageReference(src_ref, package_id)),
+                          "extra.txt"), "")
+        error = client.run("copy Hello0/0.1@lasote/stable pepe/testing --all --link hardlink",
+                           ignore_error=True)
+        self.assertTrue(error)
+        self.assertIn("The manifest of the copy in", client.out)
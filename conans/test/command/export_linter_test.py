@@ -1,4 +1,5 @@
 import unittest
+from mock import patch
 from conans.paths import CONANFILE
 from conans.test.utils.tools import TestClient
 import six
@@ -154,3 +155,72 @@ class BaseConan(ConanFile):
                          client.out)
         self.assertNotIn("WARN: Linter. Line 8: self.copy_deps is not callable",
                          client.out)
+
+
+class LinterCacheTest(unittest.TestCase):
+    """ pylint is replaced by a runner returning a message for every linted recipe
+    """
+    def setUp(self):
+        self.calls = []
+
+        def runner(args):
+            self.calls.append(args)
+            paths = [arg.strip('"') for arg in args if arg.endswith('conanfile.py"')]
+            return [{"type": "warning", "symbol": "unused-variable", "line": 8,
+                     "message": "Unused variable 'k'", "path": path} for path in paths]
+        self.runner = runner
+
+    def cache_test(self):
+        client = TestClient()
+        client.save({CONANFILE: conanfile})
+        with patch("conans.client.cmd.export_linter._runner", new=self.runner), \
+                tools.environment_append({"CONAN_RECIPE_LINTER": "True"}):
+            client.run("export . lasote/stable")
+            self.assertIn("WARN: Linter. Line 8: Unused variable 'k'", client.out)
+            client.run("export . lasote/testing")
+            self.assertIn("WARN: Linter. Line 8: Unused variable 'k'", client.out)
+            self.assertEqual(len(self.calls), 1)
+
+            client.save({CONANFILE: conanfile + "\n"})
+            with tools.environment_append({"CONAN_RECIPE_LINTER_ASYNC": "True"}):
+                client.run("export . lasote/stable")
+            self.assertIn("WARN: Linter. Line 8: Unused variable 'k'", client.out)
+            self.assertEqual(len(self.calls), 2)
+
+    def batch_test(self):
+        client = TestClient()
+        client.save({"pkg1/conanfile.py": conanfile, "pkg2/conanfile.py": conanfile})
+        with patch("conans.client.cmd.export_linter._runner", new=self.runner), \
+                tools.environment_append({"CONAN_RECIPE_LINTER": "True"}):
+            client.run("cache lint pkg1 pkg2/conanfile.py")
+            self.assertEqual(len(self.calls), 1)
+            self.assertIn("Linted 2 recipes, 2 with linter messages", client.out)
+            for pkg in ("pkg1", "pkg2"):
+                self.assertIn(os.path.join(client.current_folder, pkg, "conanfile.py"),
+                              client.out)
+
+            client.run("export pkg1 lasote/stable")
+            self.assertIn("WARN: Linter. Line 8: Unused variable 'k'", client.out)
+            self.assertEqual(len(self.calls), 1)
+
+    def local_modules_test(self):
+        client = TestClient()
+        client.save({"pkg1/conanfile.py": conanfile, "pkg1/helper.py": "value = 1",
+                     "pkg2/conanfile.py": conanfile, "pkg2/helper.py": "value = 2",
+                     "pkg3/conanfile.py": conanfile, "pkg4/conanfile.py": conanfile})
+        with patch("conans.client.cmd.export_linter._runner", new=self.runner), \
+                tools.environment_append({"CONAN_RECIPE_LINTER": "True"}):
+            # The recipes with local modules are linted alone
+            client.run("cache lint pkg1 pkg2 pkg3 pkg4")
+            self.assertIn("Linted 4 recipes, 4 with linter messages", client.out)
+            linted = sorted(sorted(os.path.basename(os.path.dirname(arg.strip('"')))
+                                   for arg in args if arg.endswith('conanfile.py"'))
+                            for args in self.calls)
+            self.assertEqual(linted, [["pkg1"], ["pkg2"], ["pkg3", "pkg4"]])
+
+            # A change in the modules of the recipe invalidates its cached result
+            client.run("cache lint pkg1 pkg2")
+            self.assertEqual(len(self.calls), 3)
+            client.save({"pkg1/helper.py": "value = 3"})
+            client.run("cache lint pkg1 pkg2")
+            self.assertEqual(len(self.calls), 4)
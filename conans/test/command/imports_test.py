@@ -1,8 +1,13 @@
+import errno
 import unittest
+import mock
 from conans.test.utils.tools import TestClient
 import os
+import platform
+from conans.client import tools
 from conans.client.importer import IMPORTS_MANIFESTS
-from conans.util.files import load, mkdir
+from conans.model.ref import ConanFileReference
+from conans.util.files import load, mkdir, save, link_or_copy
 from conans.model.manifest import FileTreeManifest
 from conans.test.utils.test_files import temp_folder
 
@@ -213,3 +218,94 @@ class ConanLib(ConanFile):
         self.client.run("imports ./conanfile.txt")
         self.assertIn("file1.txt", os.listdir(self.client.current_folder))
         self.assertIn("file2.txt", os.listdir(self.client.current_folder))
+
+    def imports_incremental_test(self):
+        self.client.save({"conanfile.txt": test1}, clean_first=True)
+        self.client.run("install .")
+        self.assertNotIn("unchanged", self.client.user_io.out)
+        file1 = os.path.join(self.client.current_folder, "file1.txt")
+        file2 = os.path.join(self.client.current_folder, "file2.txt")
+        self.client.run("imports .")
+        self.assertIn("imports(): Skipped 2 unchanged imported files", self.client.user_io.out)
+        self.assertIn("imports(): Copied 2 '.txt' files", self.client.user_io.out)
+        self._check_manifest()
+
+        # A modified imported file is copied again
+        save(file2, "Modified")
+        os.utime(file2, (0, 0))
+        self.client.run("imports .")
+        self.assertIn("imports(): Skipped 1 unchanged imported files", self.client.user_io.out)
+        self.assertEqual(load(file2), "World")
+        self._check_manifest()
+
+        # Without a previous manifest everything is copied
+        os.remove(os.path.join(self.client.current_folder, IMPORTS_MANIFESTS))
+        self.client.run("imports .")
+        self.assertNotIn("unchanged", self.client.user_io.out)
+        self.assertEqual(load(file1), "Hello")
+
+    def imports_hardlink_test(self):
+        if platform.system() == "Windows":
+            return
+        self.client.save({"conanfile.txt": test1}, clean_first=True)
+        with tools.environment_append({"CONAN_IMPORTS_LINK": "hardlink"}):
+            self.client.run("install .")
+        file1 = os.path.join(self.client.current_folder, "file1.txt")
+        self.assertEqual(os.stat(file1).st_nlink, 2)
+        self._check_manifest()
+
+        # Without links, the files are not copied again, but writing them doesn't modify the cache
+        self.client.run("imports .")
+        self.assertIn("imports(): Skipped 2 unchanged imported files", self.client.user_io.out)
+        save(file1, "Modified")
+        self.client.run("imports .")
+        self.assertEqual(os.stat(file1).st_nlink, 1)
+        self.assertEqual(load(file1), "Hello")
+
+        with tools.environment_append({"CONAN_IMPORTS_LINK": "symlink"}):
+            error = self.client.run("imports .", ignore_error=True)
+        self.assertTrue(error)
+        self.assertIn("Invalid imports_link 'symlink'", self.client.user_io.out)
+
+    def imports_same_destination_test(self):
+        conanfile_libs = """from conans import ConanFile
+class Pkg(ConanFile):
+    exports_sources = "*.dll"
+    def package(self):
+        self.copy("*.dll")
+"""
+        client = TestClient()
+        files = {"conanfile.py": conanfile_libs}
+        for i in range(8):
+            files["build%d/lib.dll" % i] = str(i) * (i + 1) * 1000
+        client.save(files)
+        client.run("create . Libs/0.1@lasote/stable")
+        client.save({"conanfile.txt": "[requires]\nLibs/0.1@lasote/stable\n"
+                                      "[imports]\n., *.dll -> ./bin @ keep_path=False"},
+                    clean_first=True)
+        with tools.environment_append({"CONAN_IMPORTS_LINK": "hardlink"}):
+            client.run("install .")
+        imported = load(os.path.join(client.current_folder, "bin", "lib.dll"))
+        self.assertIn(imported, [files["build%d/lib.dll" % i] for i in range(8)])
+        # The files of the package are not modified by the other imported ones
+        package_folder = client.client_cache.packages(ConanFileReference.loads(
+            "Libs/0.1@lasote/stable"))
+        for root, _, filenames in os.walk(package_folder):
+            if "lib.dll" in filenames:
+                name = "%s/lib.dll" % os.path.basename(root)
+                self.assertEqual(load(os.path.join(root, "lib.dll")), files[name])
+
+    def link_or_copy_existing_link_test(self):
+        """ The copy over an existing destination doesn't write through it, it could be
+        hardlinked to a file of the cache
+        """
+        folder = temp_folder()
+        src, dst, cached = [os.path.join(folder, name) for name in ("src", "dst", "cached")]
+        save(src, "new")
+        save(cached, "cached")
+        os.link(cached, dst)
+        with mock.patch("os.link", side_effect=OSError(errno.EEXIST, "File exists")):
+            self.assertFalse(link_or_copy(src, dst, "hardlink"))
+        self.assertEqual(load(dst), "new")
+        self.assertEqual(load(cached), "cached")
+        self.assertEqual(sorted(os.listdir(folder)), ["cached", "dst", "src"])
@@ -1,3 +1,4 @@
+import json
 import unittest
 import platform
 import os
@@ -9,7 +10,7 @@ from conans.model.info import ConanInfo
 from conans.test.utils.cpp_test_files import cpp_hello_conan_files
 from conans.paths import CONANFILE_TXT
 from conans.client.conf.detect import detected_os
-from conans.util.files import load, mkdir, rmdir
+from conans.util.files import load, mkdir, rmdir, save
 
 
 class InstallTest(unittest.TestCase):
@@ -492,3 +493,61 @@ class TestConan(ConanFile):
         client.run("install -o boost:shared=True --build missing --build boost .")
         output_5 = "%s" % client.out
         self.assertEqual(output_4, output_5)
+
+    def install_graph_timing_test(self):
+        client = TestClient()
+        client.save({"conanfile.py": """from conans import ConanFile
+class Pkg(ConanFile):
+    settings = "os"
+"""})
+        client.run("create . Pkg/0.1@user/testing")
+        client.save({"conanfile.py": """from conans import ConanFile
+class Consumer(ConanFile):
+    requires = "Pkg/0.1@user/testing"
+    def configure(self):
+        pass
+"""}, clean_first=True)
+        client.run("install . --graph-timing=timing.json")
+        self.assertIn("Pkg/0.1@user/testing get_recipe (1 calls)", client.out)
+        report = json.loads(load(os.path.join(client.current_folder, "timing.json")))
+        measures = sum(len(node["phases"]) for node in report["nodes"].values())
+        self.assertIn("Dependency graph timings, %d slowest:" % min(10, measures), client.out)
+        self.assertIn("total_time", report)
+        self.assertIn("package_id", report["phases"])
+        pkg_phases = report["nodes"]["Pkg/0.1@user/testing"]["phases"]
+        for phase in ("get_recipe", "load_conan", "config_options", "configure", "package_id"):
+            self.assertEqual(1, pkg_phases[phase]["calls"])
+        self.assertIn("PROJECT", report["nodes"])
+
+        client.run("install Pkg/0.1@user/testing --graph-timing=timing_ref.json")
+        report = json.loads(load(os.path.join(client.current_folder, "timing_ref.json")))
+        self.assertIn("Pkg/0.1@user/testing", report["nodes"])
+
+    def install_graph_timing_build_test(self):
+        client = TestClient()
+        client.save({"conanfile.py": """import time
+from conans import ConanFile
+class Pkg(ConanFile):
+    def build(self):
+        time.sleep(1)
+"""})
+        client.run("export . Pkg/0.1@user/testing")
+        client.run("install Pkg/0.1@user/testing --build --graph-timing=timing.json")
+        # Only the graph computation, not the build
+        report = json.loads(load(os.path.join(client.current_folder, "timing.json")))
+        self.assertLess(report["total_time"], 1)
+
+        # Only the existing measures are listed
+        client.save({"conanfile.py": "from conans import ConanFile\n"
+                                     "class Pkg(ConanFile):\n"
+                                     "    pass"}, clean_first=True)
+        client.run("install . --graph-timing=timing.json")
+        self.assertIn("Dependency graph timings, 4 slowest:", client.out)
+
+        # A failure saving them doesn't hide the install error
+        save(os.path.join(client.current_folder, "file"), "")
+        error = client.run("install Missing/0.1@user/testing --graph-timing=file/timing.json",
+                           ignore_error=True)
+        self.assertTrue(error)
+        self.assertIn("WARN: Couldn't save the dependency graph timings", client.out)
+        self.assertIn("ERROR: No remote defined", client.out)
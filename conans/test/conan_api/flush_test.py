@@ -0,0 +1,22 @@
+import unittest
+
+import mock
+
+from conans.test.utils.tools import TestClient
+
+
+class FlushTest(unittest.TestCase):
+
+    def flush_error_test(self):
+        client = TestClient()
+        with mock.patch("conans.client.remote_registry.RemoteRegistry.flush",
+                        side_effect=IOError("Disk full")), \
+                mock.patch("conans.client.remote_health.RemotesHealth.save") as health_save, \
+                mock.patch("conans.client.store.cache_index.CacheIndex.flush") as index_flush:
+            error = client.run("install Missing/0.1@user/testing", ignore_error=True)
+        self.assertTrue(error)
+        # The error of the command is not hidden, and the rest are still written
+        self.assertIn("ERROR: No remote defined", client.out)
+        self.assertIn("WARN: Couldn't save the remotes registry: Disk full", client.out)
+        self.assertTrue(health_save.called)
+        self.assertTrue(index_flush.called)
@@ -0,0 +1,162 @@
+import errno
+import os
+import stat
+import unittest
+from collections import OrderedDict
+
+import mock
+
+from conans.client import tools
+from conans.client.client_cache import ClientCache
+from conans.client.store import blob_store
+from conans.client.store.blob_store import BlobStore
+from conans.model.manifest import FileTreeManifest
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.test.utils.test_files import temp_folder
+from conans.test.utils.tools import TestClient, TestServer, TestBufferConanOutput
+from conans.util.files import save, load, md5
+
+
+conanfile = """from conans import ConanFile
+class Pkg(ConanFile):
+    pass
+"""
+
+
+class BlobStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = TestServer()
+        self.client = TestClient(servers=OrderedDict([("default", self.server)]),
+                                 users={"default": [("lasote", "mypass")]})
+        self.client.save({"conanfile.py": conanfile,
+                          "pkg/include/header.h": "//header",
+                          "pkg/lib/mylib.a": "mylib"})
+
+    def _file(self, reference, path):
+        reference = ConanFileReference.loads(reference)
+        packages = self.client.client_cache.packages(reference)
+        package_id = os.listdir(packages)[0]
+        return os.path.join(self.client.client_cache.package(PackageReference(reference,
+                                                                              package_id)), path)
+
+    def _same_file(self, ref1, ref2, path):
+        return os.path.samefile(self._file(ref1, path), self._file(ref2, path))
+
+    def export_pkg_test(self):
+        with tools.environment_append({"CONAN_CACHE_DEDUP": "1", "CONAN_READ_ONLY_CACHE": "1"}):
+            self.client.run("export-pkg . Pkg/0.1@lasote/stable -pf=pkg")
+            self.assertIn("Deduplicated 0 of 2 files (0.0 of 0.0 MB, 0%)", self.client.out)
+            self.client.run("export-pkg . Pkg/0.1@lasote/testing -pf=pkg")
+            self.assertIn("Deduplicated 2 of 2 files", self.client.out)
+        self.assertTrue(self._same_file("Pkg/0.1@lasote/stable", "Pkg/0.1@lasote/testing",
+                                        "include/header.h"))
+        self.assertFalse(self._same_file("Pkg/0.1@lasote/stable", "Pkg/0.1@lasote/testing",
+                                         "conaninfo.txt"))
+        header = self._file("Pkg/0.1@lasote/stable", "include/header.h")
+        self.assertFalse(os.stat(header).st_mode & stat.S_IWRITE)
+
+        # The shared files cannot be writable, it needs the read only cache
+        with tools.environment_append({"CONAN_CACHE_DEDUP": "1"}):
+            self.client.run("export-pkg . Pkg/0.1@lasote/writable -pf=pkg")
+            self.assertNotIn("Deduplicated", self.client.out)
+            output = TestBufferConanOutput()
+            self.assertIsNone(ClientCache(temp_folder(), None, output).blob_store)
+            self.assertIn("WARN: cache_dedup needs read_only_cache", output)
+
+        # Disabled by default
+        self.client.run("export-pkg . Pkg/0.1@lasote/other -pf=pkg")
+        self.assertNotIn("Deduplicated", self.client.out)
+        self.assertFalse(self._same_file("Pkg/0.1@lasote/stable", "Pkg/0.1@lasote/other",
+                                         "include/header.h"))
+
+    def copy_test(self):
+        self.client.run("export-pkg . Pkg/0.1@lasote/stable -pf=pkg")
+        with tools.environment_append({"CONAN_CACHE_DEDUP": "1", "CONAN_READ_ONLY_CACHE": "1"}):
+            self.client.run("copy Pkg/0.1@lasote/stable pepe/testing --all")
+        self.assertIn("Deduplicated 2 of 2 files", self.client.out)
+        self.assertTrue(self._same_file("Pkg/0.1@lasote/stable", "Pkg/0.1@pepe/testing",
+                                        "lib/mylib.a"))
+        self.client.run("search Pkg/0.1@pepe/testing")
+        self.assertIn("Package_ID:", self.client.out)
+
+    def download_read_only_test(self):
+        with tools.environment_append({"CONAN_CACHE_DEDUP": "1", "CONAN_READ_ONLY_CACHE": "1"}):
+            self.client.run("export-pkg . Pkg/0.1@lasote/stable -pf=pkg")
+            self.client.run("upload Pkg/0.1@lasote/stable --all")
+            self.client.run("remove Pkg/0.1@lasote/stable -f")
+            # The blobs of the removed package are still there, until "conan cache gc"
+            self.client.run("install Pkg/0.1@lasote/stable")
+            self.assertIn("Deduplicated 2 of 2 files", self.client.out)
+            header = self._file("Pkg/0.1@lasote/stable", "include/header.h")
+            self.assertFalse(os.stat(header).st_mode & stat.S_IWRITE)
+            self.assertEqual(os.stat(header).st_nlink, 2)
+
+            self.client.run("remove Pkg/0.1@lasote/stable -f")
+            self.client.run("cache gc --max-size 0")
+        blobs = [f for _, _, files in os.walk(self.client.client_cache.blobs_folder)
+                 for f in files]
+        self.assertEqual(blobs, [])
+
+    def dedup_checks_content_test(self):
+        store = BlobStore(temp_folder())
+        contents = {"a.txt": "aaaa", "b.txt": "bbbb"}
+        pkg1 = temp_folder()
+        for name, content in contents.items():
+            save(os.path.join(pkg1, name), content)
+        manifest = FileTreeManifest(0, {name: md5(content) for name, content in contents.items()})
+        self.assertEqual(store.dedup(pkg1, manifest).shared_files, 0)
+
+        # Same size but other contents than the manifest ones, not replaced by the blobs
+        pkg2 = temp_folder()
+        save(os.path.join(pkg2, "a.txt"), "xxxx")
+        save(os.path.join(pkg2, "b.txt"), "bbbb")
+        stats = store.dedup(pkg2, manifest)
+        self.assertEqual(load(os.path.join(pkg2, "a.txt")), "xxxx")
+        self.assertTrue(os.path.samefile(os.path.join(pkg1, "b.txt"),
+                                         os.path.join(pkg2, "b.txt")))
+        self.assertEqual((stats.files, stats.shared_files), (1, 1))
+
+        # A file that fails doesn't stop the deduplication of the others
+        pkg3 = temp_folder()
+        for name, content in contents.items():
+            save(os.path.join(pkg3, name), content)
+        replace = blob_store._replace
+
+        def failing_replace(src, dst):
+            if dst.endswith("a.txt"):
+                raise OSError(errno.EACCES, "Permission denied")
+            replace(src, dst)
+
+        with mock.patch("conans.client.store.blob_store._replace", side_effect=failing_replace):
+            stats = store.dedup(pkg3, manifest)
+        self.assertEqual((stats.files, stats.shared_files), (1, 1))
+        self.assertTrue(os.path.samefile(os.path.join(pkg1, "b.txt"),
+                                         os.path.join(pkg3, "b.txt")))
+
+    def dedup_checks_blobs_test(self):
+        store = BlobStore(temp_folder())
+        manifest = FileTreeManifest(0, {"a.txt": md5("aaaa")})
+        pkg1 = temp_folder()
+        save(os.path.join(pkg1, "a.txt"), "aaaa")
+        store.dedup(pkg1, manifest)
+        self.assertFalse(os.stat(os.path.join(pkg1, "a.txt")).st_mode & stat.S_IWRITE)
+
+        # Modified in place through the package, with the same size
+        os.chmod(os.path.join(pkg1, "a.txt"), stat.S_IREAD | stat.S_IWRITE)
+        with open(os.path.join(pkg1, "a.txt"), "w") as f:
+            f.write("xxxx")
+        pkg2 = temp_folder()
+        save(os.path.join(pkg2, "a.txt"), "aaaa")
+        stats = store.dedup(pkg2, manifest)
+        self.assertEqual((stats.files, stats.shared_files), (1, 0))
+        self.assertEqual(load(os.path.join(pkg2, "a.txt")), "aaaa")
+        self.assertFalse(os.path.samefile(os.path.join(pkg1, "a.txt"),
+                                          os.path.join(pkg2, "a.txt")))
+
+        # The modified blob was replaced by the good one
+        pkg3 = temp_folder()
+        save(os.path.join(pkg3, "a.txt"), "aaaa")
+        self.assertEqual(store.dedup(pkg3, manifest).shared_files, 1)
+        self.assertTrue(os.path.samefile(os.path.join(pkg2, "a.txt"),
+                                         os.path.join(pkg3, "a.txt")))
@@ -0,0 +1,66 @@
+import os
+import unittest
+
+from conans.client import tools
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.test.utils.tools import TestClient
+
+
+conanfile = """from conans import ConanFile, tools
+class Pkg(ConanFile):
+    exports_sources = "*.txt"
+    def build(self):
+        tools.replace_in_file("edited.txt", "source", "build")
+        tools.save("saved.txt", "build")
+"""
+
+
+class BuildFolderLinkTest(unittest.TestCase):
+
+    def reflink_test(self):
+        client = TestClient()
+        client.save({"conanfile.py": conanfile,
+                     "edited.txt": "source",
+                     "saved.txt": "source",
+                     "untouched.txt": "source"})
+        with tools.environment_append({"CONAN_BUILD_FOLDER_LINK": "reflink"}):
+            client.run("create . Pkg/0.1@lasote/stable")
+
+        ref = ConanFileReference.loads("Pkg/0.1@lasote/stable")
+        source_folder = client.client_cache.source(ref)
+        builds = client.client_cache.builds(ref)
+        build_folder = client.client_cache.build(PackageReference(ref, os.listdir(builds)[0]))
+
+        self.assertEqual(tools.load(os.path.join(build_folder, "untouched.txt")), "source")
+        # Cloned or copied (if the file system can't clone), the sources are not modified
+        for name in ("edited.txt", "saved.txt"):
+            self.assertEqual(tools.load(os.path.join(source_folder, name)), "source")
+            self.assertEqual(tools.load(os.path.join(build_folder, name)), "build")
+
+    def invalid_test(self):
+        client = TestClient()
+        client.save({"conanfile.py": conanfile, "edited.txt": "source"})
+        # The hardlinked sources would be modified by the builds writing them in place
+        for link in ("symlink", "hardlink"):
+            with tools.environment_append({"CONAN_BUILD_FOLDER_LINK": link}):
+                error = client.run("create . Pkg/0.1@lasote/stable", ignore_error=True)
+            self.assertTrue(error)
+            self.assertIn("Invalid build_folder_link '%s', use 'reflink'" % link, client.out)
+
+    def in_place_write_test(self):
+        """ The files rewritten in place by the build are not shared with the source folder
+        """
+        in_place = """from conans import ConanFile
+class Pkg(ConanFile):
+    exports_sources = "*.txt"
+    def build(self):
+        with open("edited.txt", "w") as f:
+            f.write("build")
+"""
+        client = TestClient()
+        client.save({"conanfile.py": in_place, "edited.txt": "source"})
+        with tools.environment_append({"CONAN_BUILD_FOLDER_LINK": "reflink"}):
+            client.run("create . Pkg/0.1@lasote/stable")
+        ref = ConanFileReference.loads("Pkg/0.1@lasote/stable")
+        source = os.path.join(client.client_cache.source(ref), "edited.txt")
+        self.assertEqual(tools.load(source), "source")
@@ -1,7 +1,10 @@
 import os
 import platform
+import shutil
 import unittest
 
+import mock
+
 from conans.client.file_copier import FileCopier
 from conans.test.utils.test_files import temp_folder
 from conans.util.files import save, load
@@ -125,3 +128,72 @@ class FileCopierTest(unittest.TestCase):
         copier = FileCopier(folder1, folder2)
         copier("*.txt", excludes=("*Test*.txt", "*Impl*"))
         self.assertEqual(['MyLib.txt'], os.listdir(folder2))
+
+    def walk_cache_test(self):
+        folder1 = temp_folder()
+        save(os.path.join(folder1, "include/header.h"), "")
+        save(os.path.join(folder1, "lib/mylib.a"), "")
+        save(os.path.join(folder1, "test_package/build/test.a"), "")
+        save(os.path.join(folder1, ".git/config.h"), "")
+
+        folder2 = temp_folder()
+        copier = FileCopier(folder1, folder2)
+        walk = os.walk
+        with mock.patch("os.walk", side_effect=walk) as walk_mock:
+            self.assertEqual(copier("*.h"), [os.path.join(folder2, "include", "header.h")])
+            self.assertEqual(copier("*.a", dst="lib", keep_path=False),
+                             [os.path.join(folder2, "lib", "mylib.a")])
+            # The subfolders are answered with the walk of the parent
+            self.assertEqual(copier("*", src="include", dst="inc"),
+                             [os.path.join(folder2, "inc", "header.h")])
+            self.assertEqual(walk_mock.call_count, 1)
+
+            # The folders skipped by the walk are walked if requested
+            self.assertEqual(copier("*.a", src="test_package/build", dst="test"),
+                             [os.path.join(folder2, "test", "test.a")])
+            self.assertEqual(walk_mock.call_count, 2)
+            self.assertEqual(copier("*", src="missing"), [])
+
+            # New files are found
+            save(os.path.join(folder1, "include/other/header2.h"), "")
+            self.assertEqual(sorted(copier("*.h", src="include", dst="include2")),
+                             [os.path.join(folder2, "include2", "header.h"),
+                              os.path.join(folder2, "include2", "other", "header2.h")])
+
+    def walk_cache_mtime_resolution_test(self):
+        """ A file created in the same mtime tick of the walked directory (coarse resolution
+        file systems) is found anyway
+        """
+        folder1 = temp_folder()
+        save(os.path.join(folder1, "lib/mylib.a"), "")
+        lib_folder = os.path.join(folder1, "lib")
+        folder2 = temp_folder()
+        copier = FileCopier(folder1, folder2)
+        self.assertEqual(copier("*.a", dst="lib1"),
+                         [os.path.join(folder2, "lib1", "lib", "mylib.a")])
+
+        mtime = os.stat(lib_folder).st_mtime
+        save(os.path.join(lib_folder, "other.a"), "")
+        os.utime(lib_folder, (mtime, mtime))
+        self.assertEqual(sorted(copier("*.a", dst="lib2", keep_path=False)),
+                         [os.path.join(folder2, "lib2", "mylib.a"),
+                          os.path.join(folder2, "lib2", "other.a")])
+
+    def keep_path_collision_test(self):
+        """ Without keep_path the files with the same name go to the same destination, only
+        the last one in walk order is copied there
+        """
+        folder1 = temp_folder()
+        for i in range(8):
+            save(os.path.join(folder1, "build%d" % i, "lib.dll"), str(i) * (i + 1) * 1000)
+        last = [os.path.join(root, "lib.dll") for root, _, files in os.walk(folder1)
+                if "lib.dll" in files][-1]
+        folder2 = temp_folder()
+        copier = FileCopier(folder1, folder2)
+        copy2 = shutil.copy2
+        with mock.patch("shutil.copy2", side_effect=copy2) as copy_mock:
+            copied = copier("*.dll", dst="bin", keep_path=False)
+        dst = os.path.join(folder2, "bin", "lib.dll")
+        self.assertEqual(set(copied), {dst})
+        copy_mock.assert_called_once_with(last, dst)
+        self.assertEqual(load(dst), load(last))
@@ -1,11 +1,12 @@
 import unittest
 import os
+from mock import patch
 from conans.test.utils.test_files import temp_folder
 from conans.client.remote_registry import RemoteRegistry
 from conans.model.ref import ConanFileReference
 from conans.errors import ConanException
 from conans.test.utils.tools import TestBufferConanOutput
-from conans.util.files import save
+from conans.util.files import save, load
 
 
 class RegistryTest(unittest.TestCase):
@@ -82,3 +83,39 @@ class RegistryTest(unittest.TestCase):
                                             ("repo2", "url2", True),
                                             ("conan.io", "https://server.conan.io", True),
                                             ("repo3", "url3", True)])
+
+    def refs_batched_test(self):
+        f = os.path.join(temp_folder(), "aux_file")
+        save(f, "conan.io https://server.conan.io True")
+        registry = RemoteRegistry(f, TestBufferConanOutput())
+        ref = ConanFileReference.loads("MyLib/0.1@lasote/stable")
+        remote = registry.remotes[0]
+
+        registry.set_ref(ref, remote)
+        self.assertEqual(registry.get_ref(ref), remote)
+        self.assertEqual(registry.refs, {str(ref): "conan.io"})
+        self.assertNotIn(str(ref), load(f))
+        self.assertIsNone(RemoteRegistry(f, TestBufferConanOutput()).get_ref(ref))
+
+        registry.flush()
+        self.assertIn("MyLib/0.1@lasote/stable conan.io", load(f))
+        self.assertEqual(RemoteRegistry(f, TestBufferConanOutput()).get_ref(ref), remote)
+
+    def change_detection_test(self):
+        f = os.path.join(temp_folder(), "aux_file")
+        save(f, "conan.io https://server.conan.io True")
+        registry = RemoteRegistry(f, TestBufferConanOutput())
+        self.assertEqual(registry.remotes, [("conan.io", "https://server.conan.io", True)])
+
+        with patch.object(RemoteRegistry, "_parse", side_effect=Exception("Not parsed")):
+            self.assertEqual(registry.remotes, [("conan.io", "https://server.conan.io", True)])
+            self.assertIsNone(registry.get_ref(ConanFileReference.loads("MyLib/0.1@user/testing")))
+
+        # Modified by another process or registry
+        other = RemoteRegistry(f, TestBufferConanOutput())
+        other.add("repo1", "url1", True)
+        other.set_ref(ConanFileReference.loads("MyLib/0.1@user/testing"), other.remote("repo1"))
+        other.flush()
+        self.assertEqual(registry.remotes, [("conan.io", "https://server.conan.io", True),
+                                            ("repo1", "url1", True)])
+        self.assertEqual(registry.refs, {"MyLib/0.1@user/testing": "repo1"})
@@ -0,0 +1,48 @@
+import os
+import time
+import unittest
+
+from conans.client.remote_health import RemotesHealth
+from conans.client.remote_registry import Remote
+from conans.test.utils.test_files import temp_folder
+
+
+class RemotesHealthTest(unittest.TestCase):
+
+    def demote_test(self):
+        f = os.path.join(temp_folder(), "health.json")
+        health = RemotesHealth(f)
+        remotes = [Remote("r0", "url0", True), Remote("r1", "url1", True),
+                   Remote("r2", "url2", True)]
+        health.success("r1", 0.5)
+        for _ in range(RemotesHealth.max_failures - 1):
+            health.failure("r0")
+        self.assertEqual(health.sort(remotes), remotes)
+
+        health.failure("r0")
+        self.assertEqual(health.sort(remotes), remotes[1:] + remotes[:1])
+        health.save()
+
+        # Persisted for the next commands
+        health = RemotesHealth(f)
+        self.assertTrue(health.demoted("r0"))
+        self.assertEqual(health.scores["r1"]["latency"], 0.5)
+        health.success("r1", 1)
+        self.assertAlmostEqual(health.scores["r1"]["latency"], 0.6)
+
+        # It is given another chance after some time
+        health.scores["r0"]["last_failure"] = time.time() - RemotesHealth.demotion_time
+        self.assertEqual(health.sort(remotes), remotes)
+        # And it recovers with the first success
+        health.success("r0", 1)
+        self.assertEqual(health.scores["r0"]["failures"], 0)
+
+    def corrupted_test(self):
+        f = os.path.join(temp_folder(), "health.json")
+        with open(f, "w") as handle:
+            handle.write("{corrupted")
+        health = RemotesHealth(f)
+        self.assertEqual(health.scores, {})
+        health.save()  # No changes, nothing written
+        with open(f) as handle:
+            self.assertEqual(handle.read(), "{corrupted")
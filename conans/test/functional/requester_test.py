@@ -55,3 +55,22 @@ request_timeout=any_string
 
 
 
+
+    def remote_timeouts_test(self):
+        client = TestClient(requester_class=MyRequester)
+        conf = """
+[general]
+request_timeout=2
+"""
+        save(client.client_cache.conan_conf_path, conf)
+        client.init_dynamic_vars()
+        remote_timeouts = "http://slow.com/*=10, https://other.com:9300/*=0.5"
+        with tools.environment_append({"CONAN_REMOTE_TIMEOUTS": remote_timeouts}):
+            self.assertEquals(client.requester.get("http://slow.com/v1/conans"), 10.0)
+            self.assertEquals(client.requester.get("https://other.com:9300/v1/ping"), 0.5)
+            self.assertEquals(client.requester.get("http://fast.com/v1/conans"), 2.0)
+
+        with tools.environment_append({"CONAN_REMOTE_TIMEOUTS": "http://slow.com/*=any"}):
+            with self.assertRaisesRegexp(Exception, "Specify a numeric timeout for "
+                                                    "'http://slow.com/\\*'"):
+                client.requester.get("http://slow.com/v1/conans")
@@ -1,10 +1,15 @@
+# -*- coding: utf-8 -*-
 import os
 import six
+import sys
 import unittest
 
 from io import StringIO
+from conans.client.output import ScopedOutput
 from conans.client.runner import ConanRunner
-from conans.test.utils.tools import TestClient
+from conans.test.utils.test_files import temp_folder
+from conans.test.utils.tools import TestClient, TestBufferConanOutput
+from conans.util.files import save, load
 
 
 class RunnerTest(unittest.TestCase):
@@ -159,3 +164,53 @@ class ConanFileToolsTest(ConanFile):
         self.assertTrue(error)
         self.assertIn("Error while executing 'mkdir test_folder'", client.user_io.out)
         self.assertFalse(os.path.exists(test_folder))
+
+    def _python_command(self, code):
+        folder = temp_folder()
+        save(os.path.join(folder, "script.py"), code)
+        return '"%s" "%s"' % (sys.executable, os.path.join(folder, "script.py"))
+
+    def big_output_test(self):
+        # Multi-byte characters split between the chunks read from the pipe
+        command = self._python_command("""import sys
+out = getattr(sys.stdout, "buffer", sys.stdout)
+for i in range(20000):
+    out.write(("line %d \\xe1\\xe9\\u20ac\\n" % i).encode("utf-8"))
+""")
+        out = six.StringIO()
+        log_file = os.path.join(temp_folder(), "run.log")
+        runner = ConanRunner(generate_run_log_file=True)
+        self.assertEqual(runner(command, output=out, log_filepath=log_file), 0)
+        expected = "".join(u"line %d \xe1\xe9€\n" % i for i in range(20000))
+        self.assertIn(expected, out.getvalue())
+        self.assertIn(expected, load(log_file))
+
+        out = TestBufferConanOutput()
+        runner(command, output=ScopedOutput("Pkg", out))
+        self.assertIn(u"Pkg: line 12345 \xe1\xe9€\nPkg: line 12346", str(out))
+
+    def output_tail_test(self):
+        command = self._python_command("""for i in range(1000):
+    print("line %d" % i)
+import sys
+sys.exit(3)
+""")
+        out = TestBufferConanOutput()
+        log_file = os.path.join(temp_folder(), "run.log")
+        runner = ConanRunner(generate_run_log_file=True, output_tail=10)
+        self.assertEqual(runner(command, output=out, log_filepath=log_file), 3)
+        self.assertIn("[Last 10 of 1000 output lines, full output in '%s']\n" % log_file,
+                      str(out))
+        self.assertIn("".join("line %d\n" % i for i in range(990, 1000)), str(out))
+        self.assertNotIn("line 989\n", str(out))
+        self.assertIn("line 0\n", load(log_file))
+
+        out = TestBufferConanOutput()
+        runner = ConanRunner(output_tail=10)
+        runner(self._python_command("print('hello')"), output=out)
+        self.assertEqual("hello\n", str(out))
+
+        # A stream given to capture the output gets the whole output
+        out = six.StringIO()
+        self.assertEqual(runner(command, output=out), 3)
+        self.assertEqual("".join("line %d\n" % i for i in range(1000)), out.getvalue())
@@ -0,0 +1,62 @@
+import os
+import unittest
+from collections import OrderedDict
+
+from conans.client import tools
+from conans.model.ref import ConanFileReference
+from conans.test.utils.tools import TestClient, TestServer
+from conans.util.files import load
+
+
+conanfile = """from conans import ConanFile
+class Pkg(ConanFile):
+    exports_sources = "*.h"
+    def package(self):
+        self.copy("*.h", dst="include")
+"""
+
+
+class SharedCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = TestServer()
+        servers = OrderedDict([("default", self.server)])
+        users = {"default": [("lasote", "mypass")]}
+        self.shared = TestClient(servers=servers, users=users)
+        self.shared.save({"conanfile.py": conanfile, "header.h": "//header"})
+        self.shared.run("create . Pkg/0.1@lasote/stable")
+        self.shared.run("upload Pkg/0.1@lasote/stable --all")
+        self.client = TestClient(servers=servers, users=users)
+        self.client.save({"conanfile.txt": "[requires]\nPkg/0.1@lasote/stable"})
+
+    def install_test(self):
+        with tools.environment_append({"CONAN_SHARED_STORAGE_PATH":
+                                       self.shared.client_cache.store}):
+            self.client.run("install .")
+        self.assertIn("Pkg/0.1@lasote/stable: Already installed!", self.client.out)
+        self.assertNotIn("Retrieving", self.client.out)
+        self.assertNotIn("Downloading", self.client.out)
+        self.assertIn(self.shared.client_cache.store,
+                      load(os.path.join(self.client.current_folder, "conanbuildinfo.txt")))
+        ref = ConanFileReference.loads("Pkg/0.1@lasote/stable")
+        # Only the locks are in the user store
+        self.assertFalse(os.path.exists(self.client.client_cache.export(ref)))
+        self.assertFalse(os.path.exists(self.client.client_cache.packages(ref)))
+
+        # Without it, they are retrieved from the remote to the user store
+        self.client.run("install .")
+        self.assertIn("Downloading", self.client.out)
+        self.assertTrue(os.path.exists(self.client.client_cache.packages(ref)))
+        self.assertNotIn(self.shared.client_cache.store,
+                         load(os.path.join(self.client.current_folder, "conanbuildinfo.txt")))
+
+    def build_test(self):
+        with tools.environment_append({"CONAN_SHARED_STORAGE_PATH":
+                                       self.shared.client_cache.store}):
+            self.client.run("install . --build Pkg")
+        self.assertIn("Pkg/0.1@lasote/stable: Package '5ab84d6acfe1f23c4fae0ab88f26e3a396351ac9' created",
+                      self.client.out)
+        self.assertNotIn(self.shared.client_cache.store,
+                         load(os.path.join(self.client.current_folder, "conanbuildinfo.txt")))
+        ref = ConanFileReference.loads("Pkg/0.1@lasote/stable")
+        self.assertTrue(os.path.exists(self.client.client_cache.packages(ref)))
@@ -0,0 +1,95 @@
+import os
+import unittest
+
+from conans.client import tools
+from conans.model.ref import ConanFileReference
+from conans.test.utils.tools import TestClient
+
+
+conanfile = """from conans import ConanFile
+from conans.tools import save
+class Pkg(ConanFile):
+    exports_sources = "data.txt"
+    def source(self):
+        self.output.info("Running source()!")
+        save("source.txt", "source %s" % self.version)
+    def package(self):
+        self.copy("*.txt")
+"""
+
+
+class SourceCacheTest(unittest.TestCase):
+
+    def _source_file(self, reference):
+        ref = ConanFileReference.loads(reference)
+        return tools.load(os.path.join(self.client.client_cache.source(ref), "source.txt"))
+
+    def search_test(self):
+        """ The cache entries are not listed as recipes of the store
+        """
+        self.client = TestClient()
+        deep_conanfile = conanfile.replace('save("source.txt"', 'save("src/sub/deep/f.h"')
+        self.client.save({"conanfile.py": deep_conanfile, "data.txt": "data"})
+        with tools.environment_append({"CONAN_SOURCE_CACHE": "1"}):
+            self.client.run("create . Pkg/0.1@lasote/stable")
+        self.client.run("search")
+        self.assertIn("Pkg/0.1@lasote/stable", self.client.out)
+        self.assertNotIn("src/sub", self.client.out)
+        self.assertEqual(os.listdir(self.client.client_cache.store), ["Pkg"])
+
+    def reuse_test(self):
+        self.client = TestClient()
+        self.client.save({"conanfile.py": conanfile, "data.txt": "data"})
+        with tools.environment_append({"CONAN_SOURCE_CACHE": "1"}):
+            self.client.run("create . Pkg/0.1@lasote/stable")
+            self.assertIn("Running source()!", self.client.out)
+
+            # Same recipe in another channel, or after removing the source folder
+            for reference in ("Pkg/0.1@lasote/testing", "Pkg/0.1@lasote/stable"):
+                self.client.run("remove Pkg/0.1@lasote/stable -s -f")
+                self.client.run("create . %s" % reference)
+                self.assertNotIn("Running source()!", self.client.out)
+                self.assertIn("Restored sources from the source cache", self.client.out)
+                self.assertEqual(self._source_file(reference), "source 0.1")
+
+            # The version and the exported sources are part of the key
+            self.client.run("create . Pkg/0.2@lasote/stable")
+            self.assertIn("Running source()!", self.client.out)
+            self.assertEqual(self._source_file("Pkg/0.2@lasote/stable"), "source 0.2")
+            self.client.save({"data.txt": "data2"})
+            self.client.run("create . Pkg/0.1@lasote/other")
+            self.assertIn("Running source()!", self.client.out)
+
+        # Opt-in
+        self.client.run("create . Pkg/0.1@lasote/disabled")
+        self.assertIn("Running source()!", self.client.out)
+
+    def gc_test(self):
+        self.client = TestClient()
+        self.client.save({"conanfile.py": conanfile, "data.txt": "data"})
+        with tools.environment_append({"CONAN_SOURCE_CACHE": "1"}):
+            self.client.run("create . Pkg/0.1@lasote/stable")
+            self.client.run("create . Pkg/0.2@lasote/stable")
+        entries_folder = self.client.client_cache.source_cache_folder
+        entries = sorted(os.listdir(entries_folder))
+        self.assertEqual(len(entries), 2)
+        # The least recently used is evicted first, restoring it counts as a use
+        old = os.path.getmtime(os.path.join(entries_folder, entries[0])) - 3600
+        os.utime(os.path.join(entries_folder, entries[0]), (old, old))
+        os.utime(os.path.join(entries_folder, entries[1]), (old - 10, old - 10))
+        self.client.run("remove Pkg/0.2@lasote/stable -s -f")
+        with tools.environment_append({"CONAN_SOURCE_CACHE": "1"}):
+            self.client.run("install Pkg/0.2@lasote/stable --build")
+        self.assertIn("Restored sources from the source cache", self.client.out)
+
+        self.client.run("cache gc --max-age 1m")
+        self.assertIn("Removed sources ", self.client.out)
+        remaining = os.listdir(entries_folder)
+        self.assertEqual(len(remaining), 1)
+        with tools.environment_append({"CONAN_SOURCE_CACHE": "1"}):
+            self.client.run("remove Pkg/0.2@lasote/stable -s -f")
+            self.client.run("install Pkg/0.2@lasote/stable --build")
+        self.assertIn("Restored sources from the source cache", self.client.out)
+
+        self.client.run("cache gc --max-size 0")
+        self.assertEqual(os.listdir(entries_folder), [])
@@ -0,0 +1,106 @@
+import os
+import threading
+import unittest
+from collections import OrderedDict
+
+from conans.client import tools
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.test.utils.tools import TestClient, TestServer
+
+
+conanfile = """from conans import ConanFile
+class Pkg(ConanFile):
+    exports_sources = "*.h"
+    def package(self):
+        self.copy("*.h", dst="include")
+"""
+
+
+class UpstreamServerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.upstream = TestServer()
+        client = TestClient(servers={"default": self.upstream},
+                            users={"default": [("lasote", "mypass")]})
+        client.save({"conanfile.py": conanfile, "header.h": "//header"})
+        client.run("create . Pkg/0.1@lasote/stable")
+        client.run("upload Pkg/0.1@lasote/stable --all")
+        self.uploader = client
+
+    def _install(self, proxy):
+        client = TestClient(servers=OrderedDict([("proxy", proxy)]))
+        client.run("install Pkg/0.1@lasote/stable")
+        self.assertIn("Pkg/0.1@lasote/stable: Retrieving package", client.out)
+        return client
+
+    def pull_through_test(self):
+        proxy = TestServer(upstream=self.upstream)
+        stats = proxy.test_server.file_manager.stats
+        self._install(proxy)
+        ref = ConanFileReference.loads("Pkg/0.1@lasote/stable")
+        self.assertTrue(os.path.exists(os.path.join(proxy.paths.export(ref), "conanfile.py")))
+        self.assertGreater(stats.misses, 0)
+        upstream_bytes, served_bytes = stats.upstream_bytes, stats.served_bytes
+
+        # The upstream is not needed anymore
+        self.upstream.app = None
+        self._install(proxy)
+        self.assertEqual(stats.upstream_bytes, upstream_bytes)
+        self.assertEqual(stats.saved_bytes, 2 * served_bytes - upstream_bytes)
+        self.assertIn("MB served", stats.report())
+
+    def revalidate_test(self):
+        with tools.environment_append({"CONAN_SERVER_UPSTREAM_REVALIDATE": "0"}):
+            proxy = TestServer(upstream=self.upstream)
+        self._install(proxy)
+
+        self.uploader.save({"header.h": "//header2"})
+        self.uploader.run("create . Pkg/0.1@lasote/stable")
+        self.uploader.run("upload Pkg/0.1@lasote/stable --all")
+        client = self._install(proxy)
+        ref = ConanFileReference.loads("Pkg/0.1@lasote/stable")
+        package_ref = PackageReference(ref, "5ab84d6acfe1f23c4fae0ab88f26e3a396351ac9")
+        header = os.path.join(client.client_cache.package(package_ref), "include", "header.h")
+        self.assertEqual(tools.load(header), "//header2")
+        self.assertGreater(proxy.test_server.file_manager.stats.revalidations, 0)
+
+    def expired_token_test(self):
+        with tools.environment_append({"CONAN_SERVER_UPSTREAM_USER": "lasote",
+                                       "CONAN_SERVER_UPSTREAM_PASSWORD": "mypass"}):
+            proxy = TestServer(upstream=self.upstream)
+        upstream = proxy.test_server.file_manager._upstream
+        self._install(proxy)
+        self.assertTrue(upstream.rest_client.token)
+
+        upstream.rest_client.token = "expired"
+        self.uploader.run("create . Pkg/0.2@lasote/stable")
+        self.uploader.run("upload Pkg/0.2@lasote/stable --all")
+        client = TestClient(servers=OrderedDict([("proxy", proxy)]))
+        client.run("install Pkg/0.2@lasote/stable")
+        self.assertIn("Pkg/0.2@lasote/stable: Retrieving package", client.out)
+        self.assertNotEqual(upstream.rest_client.token, "expired")
+
+    def concurrent_fetch_test(self):
+        proxy = TestServer(upstream=self.upstream)
+        file_manager = proxy.test_server.file_manager
+        slow_ref = ConanFileReference.loads("Slow/0.1@lasote/stable")
+        fetch_folder = file_manager._fetch_folder
+        started, release = threading.Event(), threading.Event()
+
+        def slow_fetch_folder(rest_client, reference, folder):
+            if reference == slow_ref:
+                started.set()
+                release.wait(10)
+            return fetch_folder(rest_client, reference, folder)
+
+        file_manager._fetch_folder = slow_fetch_folder
+        thread = threading.Thread(target=file_manager._fetch, args=(slow_ref, ))
+        thread.start()
+        try:
+            self.assertTrue(started.wait(10))
+            # The other references are not blocked by the slow upstream request
+            self._install(proxy)
+            self.assertTrue(thread.is_alive())
+        finally:
+            release.set()
+            thread.join()
@@ -3,6 +3,8 @@ import os
 import unittest
 from collections import OrderedDict
 
+import mock
+
 from conans import tools
 from conans.client.client_cache import ClientCache
 from conans.client.conf.detect import detect_defaults_settings
@@ -82,3 +84,27 @@ os=Windows
             expected["compiler.version"] = "14"
 
             self.assertEquals(cache.default_profile.settings, expected)
+
+    def settings_cache_test(self):
+        tmp_dir = temp_folder()
+        cache = ClientCache(tmp_dir, None, MockOut())
+        save(cache.settings_path, "os: [Windows, Linux]")
+        self.assertEqual(cache.settings.os.values_range, ["Linux", "Windows"])
+        self.assertTrue(os.path.exists(cache.settings_cache_path))
+
+        # The cached definition is used while settings.yml doesn't change
+        with mock.patch("yaml.load") as yaml_load:
+            cache.invalidate()
+            self.assertEqual(cache.settings.os.values_range, ["Linux", "Windows"])
+            self.assertFalse(yaml_load.called)
+
+        save(cache.settings_path, "os: [Windows, Linux, Macos]")
+        cache.invalidate()
+        self.assertEqual(cache.settings.os.values_range, ["Linux", "Macos", "Windows"])
+
+        # A corrupted cache is ignored and regenerated
+        save(cache.settings_cache_path, "corrupted")
+        cache.invalidate()
+        self.assertEqual(cache.settings.os.values_range, ["Linux", "Macos", "Windows"])
+        cache.invalidate()
+        self.assertEqual(cache.settings.os.values_range, ["Linux", "Macos", "Windows"])
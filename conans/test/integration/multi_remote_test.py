@@ -1,5 +1,13 @@
+import json
 import unittest
+
+from mock import patch
+
+from conans.client.remote_manager import RemoteManager
+from conans.client.rest.rest_client import RestApiClient
+from conans.errors import AuthenticationException
 from conans.test.utils.tools import TestServer, TestClient
+from conans.util.files import load
 from conans.model.ref import ConanFileReference
 from conans.test.utils.cpp_test_files import cpp_hello_conan_files
 from collections import OrderedDict
@@ -114,3 +122,58 @@ class MultiRemoteTest(unittest.TestCase):
         self.assertIn("Remote: remote0=http://", client2.user_io.out)
         self.assertIn("Remote: remote1=http://", client2.user_io.out)
         self.assertIn("Remote: remote2=http://", client2.user_io.out)
+
+    def install_concurrent_check_remotes_test(self):
+        files = cpp_hello_conan_files("Hello0", "0.1", build=False)
+        self.client.save(files)
+        self.client.run("export . lasote/stable")
+        self.client.run("upload Hello0/0.1@lasote/stable -r=remote2")
+
+        client2 = TestClient(servers=self.servers, users=self.users)
+        with patch.object(RemoteManager, "get_recipe",
+                          side_effect=RemoteManager.get_recipe, autospec=True) as get_recipe:
+            client2.run("install Hello0/0.1@lasote/stable --build=missing")
+        # Only retrieved from the remote that has it, the other ones are just checked
+        self.assertEqual(1, get_recipe.call_count)
+        self.assertEqual("remote2", get_recipe.call_args[0][2].name)
+        self.assertIn("Hello0/0.1@lasote/stable: Trying with 'remote0'...", client2.out)
+        self.assertIn("Hello0/0.1@lasote/stable: Trying with 'remote1'...", client2.out)
+        self.assertIn("Hello0/0.1@lasote/stable: Trying with 'remote2'...", client2.out)
+        client2.run("remote list_ref")
+        self.assertIn("Hello0/0.1@lasote/stable: remote2", client2.out)
+
+        health = json.loads(load(client2.client_cache.remotes_health))
+        self.assertEqual(set(health), {"remote0", "remote1", "remote2"})
+        self.assertEqual(0, health["remote2"]["failures"])
+
+    def search_all_remotes_test(self):
+        for i in range(2):
+            files = cpp_hello_conan_files("Hello%d" % i, "0.1", build=False)
+            self.client.save(files)
+            self.client.run("export . lasote/stable")
+            self.client.run("upload Hello%d/0.1@lasote/stable -r=remote%d" % (i, i))
+        self.client.run("search Hello* -r=all")
+        self.assertIn("Remote 'remote0':\nHello0/0.1@lasote/stable", self.client.out)
+        self.assertIn("Remote 'remote1':\nHello1/0.1@lasote/stable", self.client.out)
+        self.assertNotIn("remote2", self.client.out)
+
+    def search_all_remotes_login_test(self):
+        for i in range(2):
+            files = cpp_hello_conan_files("Hello%d" % i, "0.1", build=False)
+            self.client.save(files)
+            self.client.run("export . lasote/stable")
+            self.client.run("upload Hello%d/0.1@lasote/stable -r=remote%d" % (i, i))
+
+        search = RestApiClient.search
+
+        def search_logged(rest_client, *args):
+            if not rest_client.token:
+                raise AuthenticationException("Logged user needed")
+            return search(rest_client, *args)
+
+        # The remotes that need the credentials are searched again asking for them
+        client2 = TestClient(servers=self.servers, users=self.users)
+        with patch.object(RestApiClient, "search", new=search_logged):
+            client2.run("search Hello* -r=all")
+        self.assertIn("Remote 'remote0':\nHello0/0.1@lasote/stable", client2.out)
+        self.assertIn("Remote 'remote1':\nHello1/0.1@lasote/stable", client2.out)
@@ -136,6 +136,19 @@ class HelloReuseConan(ConanFile):
             content = load(os.path.join(self.client.current_folder, "conaninfo.txt"))
             self.assertIn("Hello0/%s@lasote/stable" % solution, content)
 
+    def prefetch_named_remote_test(self):
+        """ Several ranges are searched concurrently, also in the remote given with -r
+        """
+        self._export("Hello0", "0.1", remote="other")
+        self._export("Hello0", "0.2", remote="other")
+        self._export("Hello2", "0.1", remote="other")
+        self._export("Hello1", "0.1", ["Hello0/[>0.0]@lasote/stable",
+                                       "Hello2/[>0.0]@lasote/stable"], export=False, upload=False)
+        self.client.run('remove "Hello*" -f')
+        self.client.run("install . --build missing -r=other")
+        self.assertIn("resolved to 'Hello0/0.2@lasote/stable'", self.client.user_io.out)
+        self.assertIn("resolved to 'Hello2/0.1@lasote/stable'", self.client.user_io.out)
+
 
 class VersionRangesDiamondTest(unittest.TestCase):
 
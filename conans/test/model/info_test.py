@@ -67,6 +67,24 @@ class ConanInfoTest(unittest.TestCase):
         dump = info.dumps()
         self.assertEquals(dump, info_text)
 
+    def test_package_id_cached_shas(self):
+        info = ConanInfo.loads(info_text)
+        self.assertEqual(info.package_id(), "69952023149d740a985691bf98700611cdbed339")
+        # The cached shas are invalidated by the modifications
+        copied = info.copy()
+        copied.settings.compiler.version = "4.9"
+        copied.options.shared = True
+        copied.requires.full_package_mode()
+        self.assertEqual(copied.package_id(), "39f7fd7e589aa988dc2cc7c57ef3b45654b0bdd4")
+        copied = copied.copy()
+        copied.settings.compiler.version = "5.2"
+        copied.options.shared = False
+        self.assertEqual(copied.package_id(), "69952023149d740a985691bf98700611cdbed339")
+
+        info = ConanInfo.loads(info_text)
+        info.requires["zlib"].version = "2.0"
+        self.assertEqual(info.package_id(), "d3e16da79b997b771a8df7e813ae1cafb756cd40")
+
     def test_modes(self):
         info_text = '''[settings]
     arch=x86_64
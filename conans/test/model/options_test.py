@@ -265,3 +265,23 @@ class OptionsValuesTest(unittest.TestCase):
                                                       "Poco:new_option=0"]))
         self.assertEqual(self.sut.sha,
                          "2442d43f1d558621069a15ff5968535f818939b5")
+
+    def copy_on_write_test(self):
+        copied = self.sut.copy()
+        copied["Boost"].static = True
+        copied["Zlib"].shared = True
+        copied.optimized = 2
+        self.sut["Poco"].deps_bundled = False
+        self.assertEqual(self.sut.dumps(), "\n".join(["optimized=3",
+                                                      "static=True",
+                                                      "Boost:static=False",
+                                                      "Boost:thread=True",
+                                                      "Boost:thread.multi=off",
+                                                      "Poco:deps_bundled=False"]))
+        self.assertEqual(copied.dumps(), "\n".join(["optimized=2",
+                                                    "static=True",
+                                                    "Boost:static=True",
+                                                    "Boost:thread=True",
+                                                    "Boost:thread.multi=off",
+                                                    "Poco:deps_bundled=True",
+                                                    "Zlib:shared=True"]))
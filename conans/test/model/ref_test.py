@@ -1,3 +1,4 @@
+import pickle
 import unittest
 from conans.model.ref import ConanFileReference
 from conans.errors import ConanException
@@ -26,6 +27,22 @@ class RefTest(unittest.TestCase):
         self.assertEqual(ref.channel, "testing")
         self.assertEqual(str(ref), "opencv/2.4.10@3rd-party/testing")
 
+    def interned_test(self):
+        ref = ConanFileReference.loads("opencv/2.4.10@lasote/testing")
+        self.assertIs(ref, ConanFileReference("opencv", "2.4.10", "lasote", "testing"))
+        self.assertEqual(hash(ref), hash(("opencv", "2.4.10", "lasote", "testing")))
+        self.assertIs(ref, pickle.loads(pickle.dumps(ref)))
+        other = ref._replace(channel="stable")
+        self.assertEqual(str(other), "opencv/2.4.10@lasote/stable")
+        self.assertEqual(other, ConanFileReference.loads("opencv/2.4.10@lasote/stable"))
+        self.assertEqual(hash(other),
+                         hash(ConanFileReference.loads("opencv/2.4.10@lasote/stable")))
+
+        # Trusted references are not validated, but they are if requested later
+        trusted = ConanFileReference("o", "2.4.10", "lasote", "testing", validate=False)
+        self.assertEqual(str(trusted), "o/2.4.10@lasote/testing")
+        self.assertRaises(ConanException, ConanFileReference.loads, "o/2.4.10@lasote/testing")
+
     def errors_test(self):
         self.assertRaises(ConanException, ConanFileReference.loads, "")
         self.assertRaises(ConanException, ConanFileReference.loads, "opencv/2.4.10")
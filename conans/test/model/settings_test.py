@@ -71,6 +71,30 @@ class SettingsTest(unittest.TestCase):
                 "os": ["Windows", "Linux"]}
         self.sut = Settings(data)
 
+    def copy_on_write_test(self):
+        self.sut.compiler = "gcc"
+        copied = self.sut.copy()
+        copied.compiler.version = "4.9"
+        copied.compiler.arch = "x64"
+        copied.compiler.arch.speed = "C"
+        copied.os = "Linux"
+        copied.compiler.remove("Visual Studio")
+        self.assertEqual(copied.values.dumps(), "compiler=gcc\ncompiler.arch=x64\n"
+                                                "compiler.arch.speed=C\n"
+                                                "compiler.version=4.9\nos=Linux")
+        self.assertEqual(self.sut.values.dumps(), "compiler=gcc")
+        self.assertEqual(self.sut.compiler.values_range, ["Visual Studio", "gcc"])
+
+        # Modifying the original must not affect the copies either
+        other = self.sut.copy()
+        self.sut.constraint({"compiler": {"gcc": {"version": ["4.8"]}}})
+        self.sut.compiler.version = "4.8"
+        self.assertEqual(other.compiler.version.values_range, ["4.8", "4.9"])
+        self.assertEqual(other.values.dumps(), "compiler=gcc")
+        other.compiler.version = "4.9"
+        self.assertEqual(copied.compiler.version, "4.9")
+        self.assertEqual(self.sut.compiler.version, "4.8")
+
     def test_in_contains(self):
         self.sut.compiler = "Visual Studio"
         self.assertTrue("Visual" in self.sut.compiler)
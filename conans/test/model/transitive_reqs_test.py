@@ -120,6 +120,9 @@ def _get_edges(graph):
 
 
 class MockRequireResolver(object):
+    def prefetch(self, requires, update):  # @UnusedVariable
+        return
+
     def resolve(self, rquire, conanref, update):  # @UnusedVariable
         return
 
@@ -24,3 +24,15 @@ class ValuesTest(unittest.TestCase):
         v.compiler = None
         self.assertEqual(v.as_list(), [('compiler', 'None')])
         self.assertEqual(v.dumps(), "compiler=None")
+
+    def copy_on_write_test(self):
+        v = Values.from_list([("compiler", "gcc"), ("compiler.version", "7"), ("os", "Linux")])
+        copied = v.copy()
+        copied.compiler.version = "8"
+        copied.compiler.libcxx = "libstdc++"
+        del copied.os
+        self.assertEqual(v.dumps(), "compiler=gcc\ncompiler.version=7\nos=Linux")
+        self.assertEqual(copied.dumps(),
+                         "compiler=gcc\ncompiler.libcxx=libstdc++\ncompiler.version=8")
+        v.compiler = "clang"
+        self.assertEqual(copied.compiler, "gcc")
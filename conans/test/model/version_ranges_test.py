@@ -1,3 +1,4 @@
+import fnmatch
 import os
 import unittest
 from collections import namedtuple
@@ -12,6 +13,7 @@ from conans.model.requires import Requirements
 from conans.test.utils.test_files import temp_folder
 from conans.client.graph.range_resolver import RangeResolver, satisfying
 from parameterized import parameterized
+from mock import patch
 from conans.model.profile import Profile
 from conans.errors import ConanException
 from conans.util.files import save
@@ -141,9 +143,12 @@ def _get_edges(graph):
 class MockSearchRemote(object):
     def __init__(self, packages=None):
         self.packages = packages or []
+        self.count = {}
 
-    def search_remotes(self, pattern, ignorecase):  # @UnusedVariable
-        return self.packages
+    def search_remotes(self, pattern, ignorecase, concurrent=False):  # @UnusedVariable
+        self.count[pattern] = self.count.get(pattern, 0) + 1
+        self.concurrent = concurrent
+        return [p for p in self.packages if fnmatch.fnmatch(str(p), pattern)]
 
 
 class VersionRangesTest(unittest.TestCase):
@@ -207,6 +212,35 @@ class SayConan(ConanFile):
         self.remote_search.packages = remote_packages
         self.test_local_basic()
 
+    def test_cached_searches(self):
+        remote_packages = [ConanFileReference.loads("%s/%s@memsharded/testing" % (name, v))
+                           for name in ("Say", "Bye") for v in ("0.1", "1.1", "2.1")]
+        self.remote_search.packages = remote_packages
+        for ref in remote_packages:
+            self.retriever.conan(ref, 'from conans import ConanFile\n'
+                                      'class Pkg(ConanFile):\n'
+                                      '    name = "%s"\n'
+                                      '    version = "%s"\n' % (ref.name, ref.version))
+        content = """
+from conans import ConanFile
+
+class Hello(ConanFile):
+    requires = "Say/[>0.1]@memsharded/testing", "Bye/[>0.1]@memsharded/testing"
+"""
+        with patch("conans.client.graph.range_resolver.search_recipes",
+                   return_value=[]) as search_mock:
+            deps_graph = self.root(content)
+            deps_graph = self.root(content)
+        self.assertEqual(3, len(deps_graph.nodes))
+        # The local store is walked just once
+        self.assertEqual(1, search_mock.call_count)
+        # Prefetched, both at once, and only once
+        self.assertEqual(self.remote_search.count, {"Say/*@memsharded/testing": 1,
+                                                    "Bye/*@memsharded/testing": 1})
+        self.assertTrue(self.remote_search.concurrent)
+        say = _get_nodes(deps_graph, "Say")[0]
+        self.assertEqual(say.conan_ref, ConanFileReference.loads("Say/2.1@memsharded/testing"))
+
     @parameterized.expand([("", "0.3", None, None),
                            ('"Say/1.1@memsharded/testing"', "1.1", False, False),
                            ('"Say/0.2@memsharded/testing"', "0.2", False, True),
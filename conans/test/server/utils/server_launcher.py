@@ -26,7 +26,7 @@ class TestServerLauncher(object):
                  write_permissions=None, users=None, base_url=None, plugins=None,
                  server_version=None,
                  min_client_compatible_version=None,
-                 server_capabilities=None):
+                 server_capabilities=None, upstream_requester=None):
 
         plugins = plugins or []
         if not base_path:
@@ -51,7 +51,8 @@ class TestServerLauncher(object):
         updown_auth_manager = JWTUpDownAuthManager(server_config.updown_secret,
                                                    server_config.authorize_timeout)
         self.file_manager = get_file_manager(server_config, public_url=base_url,
-                                             updown_auth_manager=updown_auth_manager)
+                                             updown_auth_manager=updown_auth_manager,
+                                             upstream_requester=upstream_requester)
 
         # Prepare some test users
         if not read_permissions:
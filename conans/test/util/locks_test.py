@@ -0,0 +1,165 @@
+import os
+import platform
+import socket
+import subprocess
+import sys
+import threading
+import time
+import unittest
+
+from conans import tools
+from conans.test.utils.test_files import temp_folder
+from conans.test.utils.tools import TestBufferConanOutput, TestClient
+from conans.util.files import save
+from conans.util.locks import FcntlReadLock, FcntlWriteLock, lock_wait_times
+
+try:
+    import fcntl
+except ImportError:
+    pass
+
+
+@unittest.skipIf(platform.system() == "Windows", "No fcntl in Windows")
+class FcntlLockTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = os.path.join(temp_folder(), "Pkg", "0.1", "user", "channel")
+        self.output = TestBufferConanOutput()
+
+    def _lock(self, lock_class, item="Pkg/0.1@user/channel"):
+        return lock_class(self.folder, item, self.output)
+
+    def shared_exclusive_test(self):
+        with self._lock(FcntlReadLock):
+            with self._lock(FcntlReadLock):
+                write_lock = self._lock(FcntlWriteLock)
+                self.assertFalse(write_lock.try_acquire())
+        self.assertTrue(write_lock.try_acquire())
+        self.assertFalse(self._lock(FcntlReadLock).try_acquire())
+        self.assertIn("%d %s" % (os.getpid(), socket.gethostname()),
+                      open(self.folder + ".flock").read())
+        write_lock.release()
+        self.assertEqual(open(self.folder + ".flock").read(), "")
+        self.assertTrue(self._lock(FcntlReadLock).try_acquire())
+
+    def blocking_wait_test(self):
+        write_lock = self._lock(FcntlWriteLock, item="Wait/0.1@user/channel")
+        write_lock.try_acquire()
+        threading.Timer(0.2, write_lock.release).start()
+        with self._lock(FcntlReadLock, item="Wait/0.1@user/channel"):
+            pass
+        self.assertIn("Wait/0.1@user/channel is locked by another concurrent conan process",
+                      self.output)
+        self.assertGreater(lock_wait_times()["Wait/0.1@user/channel"], 0.1)
+
+    def stale_owner_test(self):
+        # A reader that inherited the lock of a dead process
+        save(self.folder + ".flock", "999999999 %s\n" % socket.gethostname())
+        fd = os.open(self.folder + ".flock", os.O_RDWR)
+        fcntl.flock(fd, fcntl.LOCK_SH)
+
+        def release():
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+        threading.Timer(0.1, release).start()
+        with self._lock(FcntlWriteLock):
+            pass
+        self.assertIn("The conan process 999999999 that locked it doesn't exist anymore",
+                      self.output)
+
+    def client_test(self):
+        client = TestClient()
+        client.run("config set general.cache_lock_backend=fcntl")
+        client.save({"conanfile.py": """from conans import ConanFile
+class Pkg(ConanFile):
+    pass
+"""})
+        client.run("create . Pkg/0.1@user/channel")
+        self.assertIn("Pkg/0.1@user/channel: Package '5ab84d6acfe1f23c4fae0ab88f26e3a396351ac9' "
+                      "created", client.out)
+        store = client.client_cache.store
+        self.assertTrue(os.path.exists(os.path.join(store, "Pkg/0.1/user/channel.flock")))
+        self.assertFalse(os.path.exists(os.path.join(store, "Pkg/0.1/user/channel.count")))
+        client.run("remove --locks")
+        self.assertTrue(os.path.exists(os.path.join(store, "Pkg/0.1/user/channel.flock")))
+        client.run("remove Pkg* -f")
+        client.run("config set general.cache_lock_backend=whatever")
+        error = client.run("create . Pkg/0.1@user/channel", ignore_error=True)
+        self.assertTrue(error)
+        self.assertIn("Invalid general.cache_lock_backend 'whatever'", client.out)
+
+
+_slots_holder = """import sys
+from conans.util.locks import JobSlots
+slots = JobSlots(sys.argv[1], 4)
+slots.acquire(int(sys.argv[2]))
+print("ready")
+sys.stdout.flush()
+sys.stdin.read()
+slots.release()
+"""
+
+
+class JobSlotsTest(unittest.TestCase):
+
+    def _holder(self, folder, jobs):
+        """ another conan process taking job slots, until its stdin is closed
+        """
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join([os.getcwd()] + sys.path)
+        process = subprocess.Popen([sys.executable, "-c", _slots_holder, folder, str(jobs)],
+                                   stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=env)
+        self.assertEqual(process.stdout.readline().strip(), b"ready")
+        return process
+
+    def _release(self, process):
+        process.stdin.close()
+        process.wait()
+
+    def shared_slots_test(self):
+        folder = temp_folder()
+        output = TestBufferConanOutput()
+        with tools.environment_append({"CONAN_JOB_SLOTS": "4", "CONAN_JOB_SLOTS_FOLDER": folder,
+                                       "CONAN_CPU_COUNT": "8"}):
+            with tools.job_slots(output) as jobs:
+                self.assertEqual(jobs, 4)
+                self.assertEqual(tools.cpu_count(), 4)
+            self.assertEqual(tools.cpu_count(), 8)
+
+            process = self._holder(folder, 3)
+            with tools.job_slots(output) as jobs:
+                self.assertEqual(jobs, 1)
+                self.assertEqual(tools.cpu_count(), 1)
+            self._release(process)
+
+            # All the slots busy, waits for one
+            process = self._holder(folder, 4)
+            threading.Timer(0.3, self._release, args=(process, )).start()
+            with tools.job_slots(output) as jobs:
+                self.assertGreaterEqual(jobs, 1)
+            self.assertIn("Waiting for a free build job slot", output)
+
+        # Not enabled
+        with tools.environment_append({"CONAN_CPU_COUNT": "8"}):
+            with tools.job_slots(output) as jobs:
+                self.assertEqual(jobs, 8)
+
+    def fair_share_test(self):
+        folder = temp_folder()
+        output = TestBufferConanOutput()
+        with tools.environment_append({"CONAN_JOB_SLOTS": "4", "CONAN_JOB_SLOTS_FOLDER": folder,
+                                       "CONAN_CPU_COUNT": "8"}):
+            # 3 free slots, but only 2 for each of the 2 builds
+            process = self._holder(folder, 1)
+            with tools.job_slots(output) as jobs:
+                self.assertEqual(jobs, 2)
+
+            # 2 free slots, 1 for each of the 3 builds
+            process2 = self._holder(folder, 1)
+            with tools.job_slots(output) as jobs:
+                self.assertEqual(jobs, 1)
+            self._release(process)
+            self._release(process2)
+
+            with tools.job_slots(output) as jobs:
+                self.assertEqual(jobs, 4)
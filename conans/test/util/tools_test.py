@@ -751,6 +751,74 @@ ProgramFiles(x86)=C:\Program Files (x86)
         tools.download("https://httpbin.org/basic-auth/user/passwd", dest,
                        headers={"Authorization": "Basic dXNlcjpwYXNzd2Q="}, overwrite=True)
 
+    def download_cache_test(self):
+        class Response(object):
+            ok = True
+            status_code = 200
+            headers = {}
+            content = b"archive contents"
+
+        class Requester(object):
+            urls = []
+
+            def get(self, url, **kwargs):
+                self.urls.append(url)
+                return Response()
+
+        out = TestBufferConanOutput()
+        requester = Requester()
+        set_global_instances(out, requester)
+        cache_folder = temp_folder()
+        with tools.environment_append({"CONAN_DOWNLOAD_CACHE": cache_folder,
+                                       "CONAN_DOWNLOAD_CACHE_MAX_SIZE": "20"}):
+            for _ in range(2):
+                dest = os.path.join(temp_folder(), "file.tgz")
+                tools.download("http://myserver.com/file.tgz", dest, out=out)
+                self.assertEqual(load(dest), "archive contents")
+            self.assertEqual(requester.urls, ["http://myserver.com/file.tgz"])
+            self.assertIn("Got http://myserver.com/file.tgz from the download cache", out)
+
+            # A corrupted cached file is downloaded again
+            cached = [f for f in os.listdir(cache_folder) if f.startswith("url-")
+                      and not f.endswith(".json")][0]
+            save(os.path.join(cache_folder, cached), "corrupted")
+            tools.download("http://myserver.com/file.tgz", os.path.join(temp_folder(), "f.tgz"),
+                           out=out)
+            self.assertEqual(len(requester.urls), 2)
+
+            # By checksum, a mirror with the same file is a hit, the other file is evicted
+            sha256 = tools.sha256sum(dest)
+            tools.download("http://myserver.com/file.tgz", os.path.join(temp_folder(), "f.tgz"),
+                           out=out, sha256=sha256)
+            self.assertEqual(len(requester.urls), 3)
+            tools.download("http://mirror.com/file.tgz", os.path.join(temp_folder(), "f.tgz"),
+                           out=out, sha256=sha256)
+            self.assertEqual(len(requester.urls), 3)
+            self.assertEqual(sorted(os.listdir(cache_folder)),
+                             [".lock", "sha256-%s" % sha256, "sha256-%s.json" % sha256])
+
+            # A failed copy from the cache doesn't leave a partial file, it is downloaded
+            def failed_copy(_, dst):
+                save(dst, "partial")
+                raise IOError("No space left on device")
+
+            dest = os.path.join(temp_folder(), "f.tgz")
+            with mock.patch("conans.client.store.download_cache.shutil.copyfile",
+                            side_effect=failed_copy):
+                tools.download("http://mirror.com/file.tgz", dest, out=out, sha256=sha256)
+            self.assertEqual(len(requester.urls), 4)
+            self.assertEqual(load(dest), "archive contents")
+
+            # The downloads with authorization headers are not cached
+            for _ in range(2):
+                tools.download("http://private.com/file.tgz", os.path.join(temp_folder(), "f"),
+                               out=out, headers={"Authorization": "Bearer token"})
+            self.assertEqual(len(requester.urls), 6)
+            self.assertFalse(any("private" in load(os.path.join(cache_folder, f))
+                                 for f in os.listdir(cache_folder) if f.endswith(".json")))
+
+        set_global_instances(out, requests)
+
     def get_gnu_triplet_test(self):
         def get_values(this_os, this_arch, setting_os, setting_arch, compiler=None):
             build = tools.get_gnu_triplet(this_os, this_arch, compiler)
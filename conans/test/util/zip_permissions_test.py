@@ -7,8 +7,8 @@ from unittest import TestCase
 from os.path import basename
 
 from conans.test.utils.test_files import temp_folder
-from conans.tools import unzip
-from conans.util.files import save
+from conans.tools import unzip, environment_append
+from conans.util.files import save, load
 
 
 class ZipPermissionsTest(TestCase):
@@ -35,3 +35,47 @@ class ZipPermissionsTest(TestCase):
                         self.assertEquals(stat.S_IMODE(os.stat(dest_file).st_mode), perm_set)
                     else:
                         self.assertNotEquals(stat.S_IMODE(os.stat(dest_file).st_mode), perm_set)
+
+    def test_many_files_and_symlinks(self):
+        tmp_dir = temp_folder()
+        zip_path = os.path.join(tmp_dir, 'zipfile.zip')
+        with zipfile.ZipFile(zip_path, mode='w', compression=zipfile.ZIP_DEFLATED) as zf:
+            for i in range(500):
+                zf.writestr("folder%d/file%d.txt" % (i % 7, i), "contents %d" % i)
+            for name, target in (("link.txt", "folder0/file0.txt"), ("outside.txt", "../out")):
+                info = zipfile.ZipInfo(name)
+                info.external_attr = (stat.S_IFLNK | 0o777) << 16
+                zf.writestr(info, target)
+
+        dest_dir = temp_folder()
+        with environment_append({"CONAN_CPU_COUNT": "4"}):  # Extracted by several threads
+            unzip(zip_path, dest_dir)
+        for i in range(500):
+            self.assertEqual(load(os.path.join(dest_dir, "folder%d" % (i % 7), "file%d.txt" % i)),
+                             "contents %d" % i)
+        link = os.path.join(dest_dir, "link.txt")
+        outside = os.path.join(dest_dir, "outside.txt")
+        if platform.system() != "Windows":
+            self.assertTrue(os.path.islink(link))
+            self.assertEqual(load(link), "contents 0")
+        # Never a link pointing out of the destination folder
+        self.assertFalse(os.path.islink(outside))
+        self.assertEqual(load(outside), "../out")
+
+    def test_member_outside_destination(self):
+        tmp_dir = temp_folder()
+        zip_path = os.path.join(tmp_dir, 'zipfile.zip')
+        with zipfile.ZipFile(zip_path, mode='w') as zf:
+            zf.writestr("../escaped_dir/file.txt", "contents")
+            zf.writestr("/abs_dir/file.txt", "abs contents")
+            zf.writestr("dir/../other/file.txt", "other contents")
+
+        dest_dir = os.path.join(tmp_dir, "dest")
+        with environment_append({"CONAN_CPU_COUNT": "4"}):
+            unzip(zip_path, dest_dir)
+        self.assertFalse(os.path.exists(os.path.join(tmp_dir, "escaped_dir")))
+        self.assertEqual(load(os.path.join(dest_dir, "escaped_dir", "file.txt")), "contents")
+        # Where ZipFile.extract() puts them
+        self.assertEqual(load(os.path.join(dest_dir, "abs_dir", "file.txt")), "abs contents")
+        self.assertEqual(load(os.path.join(dest_dir, "dir", "other", "file.txt")),
+                         "other contents")
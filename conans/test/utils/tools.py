@@ -2,6 +2,7 @@ import os
 import shlex
 import shutil
 import sys
+import threading
 import uuid
 from collections import Counter
 from contextlib import contextmanager
@@ -176,6 +177,40 @@ class TestRequester(object):
             kwargs["headers"].update(mock_request.headers)
 
 
+class UpstreamTestRequester(TestRequester):
+    """ The requests of a pull-through cache TestServer to its upstream TestServer. The bottle
+    request is thread-local, so they are done in another thread not to mess the ongoing one
+    """
+
+    def _in_thread(self, method, url, **kwargs):
+        result = []
+
+        def call():
+            try:
+                result.append((method(self, url, **kwargs), None))
+            except Exception as exc:
+                result.append((None, exc))
+        thread = threading.Thread(target=call)
+        thread.start()
+        thread.join()
+        response, exc = result[0]
+        if exc:
+            raise exc
+        return response
+
+    def get(self, url, **kwargs):
+        return self._in_thread(TestRequester.get, url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self._in_thread(TestRequester.put, url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self._in_thread(TestRequester.delete, url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self._in_thread(TestRequester.post, url, **kwargs)
+
+
 class TestServer(object):
     from conans import __version__ as SERVER_VERSION
     from conans.server.conf import MIN_CLIENT_COMPATIBLE_VERSION
@@ -184,12 +219,14 @@ class TestServer(object):
                  write_permissions=None, users=None, plugins=None, base_path=None,
                  server_version=Version(SERVER_VERSION),
                  min_client_compatible_version=Version(MIN_CLIENT_COMPATIBLE_VERSION),
-                 server_capabilities=None, complete_urls=False):
+                 server_capabilities=None, complete_urls=False, upstream=None):
         """
              'read_permissions' and 'write_permissions' is a list of:
                  [("opencv/2.3.4@lasote/testing", "user1, user2")]
 
              'users':  {username: plain-text-passwd}
+
+             'upstream': TestServer of which this one is a pull-through cache
         """
         # Unique identifier for this server, will be used by TestRequester
         # to determine where to call. Why? remote_manager just assing an url
@@ -205,13 +242,17 @@ class TestServer(object):
         self.fake_url = "http://fake%s.com" % str(uuid.uuid4()).replace("-", "")
         min_client_ver = min_client_compatible_version
         base_url = "%s/v1" % self.fake_url if complete_urls else "v1"
-        self.test_server = TestServerLauncher(base_path, read_permissions,
-                                              write_permissions, users,
-                                              base_url=base_url,
-                                              plugins=plugins,
-                                              server_version=server_version,
-                                              min_client_compatible_version=min_client_ver,
-                                              server_capabilities=server_capabilities)
+        upstream_env = {"CONAN_SERVER_UPSTREAM_URL": upstream.fake_url} if upstream else {}
+        upstream_requester = UpstreamTestRequester({"upstream": upstream}) if upstream else None
+        with tools.environment_append(upstream_env):
+            self.test_server = TestServerLauncher(base_path, read_permissions,
+                                                  write_permissions, users,
+                                                  base_url=base_url,
+                                                  plugins=plugins,
+                                                  server_version=server_version,
+                                                  min_client_compatible_version=min_client_ver,
+                                                  server_capabilities=server_capabilities,
+                                                  upstream_requester=upstream_requester)
         self.app = TestApp(self.test_server.ra.root_app)
 
     @property
@@ -9,7 +9,7 @@ from conans.util.env_reader import get_env
 # noinspection PyUnresolvedReferences
 from conans.util.files import (_generic_algorithm_sum, load, sha256sum,
                                sha1sum, md5sum, md5, touch, relative_dirs,
-                               rmdir, mkdir, to_file_bytes)
+                               rmdir, mkdir, to_file_bytes, break_hardlink)
 
 
 def save(path, content, append=False):
@@ -23,6 +23,7 @@ def save(path, content, append=False):
     except:
         pass
 
+    break_hardlink(path)
     mode = "ab" if append else "wb"
     with open(path, mode) as handle:
         handle.write(to_file_bytes(content))
@@ -0,0 +1,35 @@
+from multiprocessing.pool import ThreadPool
+
+
+def parallel_map(function, iterable, max_workers=8):
+    """ returns [function(item) for item in iterable], computed by up to max_workers threads.
+    The order is kept, and the first exception raised by function is re-raised in the caller
+    """
+    items = list(iterable)
+    if max_workers < 2 or len(items) < 2:
+        return [function(item) for item in items]
+    pool = ThreadPool(min(max_workers, len(items)))
+    try:
+        return pool.map(function, items)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def parallel_imap(function, iterable, max_workers=8):
+    """ yields function(item) for every item, in order, as soon as each one is available, all of
+    them computed by up to max_workers threads. If the caller stops iterating, the remaining ones
+    are not waited for
+    """
+    items = list(iterable)
+    if max_workers < 2 or len(items) < 2:
+        for item in items:
+            yield function(item)
+        return
+    pool = ThreadPool(min(max_workers, len(items)))
+    try:
+        results = [pool.apply_async(function, (item, )) for item in items]
+        for result in results:
+            yield result.get()
+    finally:
+        pool.close()
@@ -20,6 +20,19 @@ def get_bool_from_text(value):
     raise ConanException("Unrecognized boolean value '%s'" % value)
 
 
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+
+
+def parse_size(value):
+    """ "500", "300M", "10GB", "1.5g" => bytes
+    """
+    match = re.match(r"^\s*(\d+(?:\.\d+)?)\s*([kmgt]?)i?b?\s*$", str(value), re.IGNORECASE)
+    if not match:
+        raise ConanException("Invalid size '%s', use a number of bytes or a number followed by "
+                             "K, M, G or T" % value)
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2).upper()])
+
+
 class ConfigParser(object):
     """ util class to load a file with sections as [section1]
     checking the values of those sections, and returns each section
@@ -12,6 +12,7 @@ import six
 from conans.util.log import logger
 import tarfile
 import stat
+import time
 
 
 def make_read_only(path):
@@ -102,12 +103,27 @@ def _generic_algorithm_sum(file_path, algorithm_name):
         return m.hexdigest()
 
 
+def break_hardlink(path):
+    """ if path is a hardlink, replaces it with a copy, so writing it in place doesn't modify
+    the other linked files (e.g. a build folder linked to the source one)
+    """
+    try:
+        if os.stat(path).st_nlink < 2:
+            return
+    except OSError:  # Doesn't exist yet
+        return
+    tmp = path + ".conan_unlink"
+    shutil.copy2(path, tmp)
+    os.rename(tmp, path)
+
+
 def save_append(path, content):
     try:
         os.makedirs(os.path.dirname(path))
     except:
         pass
 
+    break_hardlink(path)
     with open(path, "ab") as handle:
         handle.write(to_file_bytes(content))
 
@@ -124,6 +140,7 @@ def save(path, content):
     except:
         pass
 
+    break_hardlink(path)
     with open(path, "wb") as handle:
         handle.write(to_file_bytes(content))
 
@@ -207,6 +224,79 @@ def mkdir(path):
             raise
 
 
+_FICLONE = 0x40049409  # Linux ioctl to clone the extents of a file (btrfs, xfs, ...)
+
+
+def _reflink(src, dst):
+    try:
+        import fcntl
+    except ImportError:
+        raise OSError("Reflinks are not supported in this platform")
+    with open(src, "rb") as src_file:
+        with open(dst, "wb") as dst_file:
+            fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+    shutil.copystat(src, dst)
+
+
+def copy_tree_linking(src, dst, link, excluded=()):
+    """ copies the src folder to dst, as shutil.copytree(symlinks=True), but making the regular
+    files hardlinks (link="hardlink") or copy-on-write clones (link="reflink") of the src ones.
+    If the file system doesn't allow it (other device, no reflink support), they are copied.
+    excluded: relative paths of files that are always copied
+    Returns the number of linked files
+    """
+    linked = 0
+    for root, dirs, files in os.walk(src):
+        rel_root = os.path.relpath(root, src)
+        dst_root = os.path.normpath(os.path.join(dst, rel_root))
+        mkdir(dst_root)
+        for name in dirs + files:
+            src_path = os.path.join(root, name)
+            dst_path = os.path.join(dst_root, name)
+            if os.path.islink(src_path):
+                os.symlink(os.readlink(src_path), dst_path)
+                continue
+            if name in dirs:
+                continue
+            rel_path = os.path.normpath(os.path.join(rel_root, name)).replace("\\", "/")
+            if link_or_copy(src_path, dst_path, link if rel_path not in excluded else None):
+                linked += 1
+            elif link and rel_path not in excluded:
+                link = None  # Don't retry for every file
+    return linked
+
+
+def link_or_copy(src, dst, link):
+    """ hardlinks (link="hardlink") or clones (link="reflink") the src file to dst, copying it
+    if link is None or the file system doesn't allow it. Returns True if the file was linked
+    """
+    if link:
+        try:
+            if link == "reflink":
+                _reflink(src, dst)
+            else:
+                os.link(src, dst)
+            return True
+        except (OSError, IOError) as e:
+            logger.debug("Cannot %s %s, copying it: %s" % (link, src, str(e)))
+    if not os.path.lexists(dst):
+        shutil.copy2(src, dst)
+        return False
+    # Never written in place, it could be a link to another file (e.g. one of the cache)
+    fd, tmp = tempfile.mkstemp(prefix=os.path.basename(dst) + ".",
+                               dir=os.path.dirname(dst) or ".")
+    os.close(fd)
+    try:
+        shutil.copy2(src, tmp)
+        if platform.system() == "Windows":
+            os.remove(dst)
+        os.rename(tmp, dst)
+    finally:
+        if os.path.lexists(tmp):
+            os.remove(tmp)
+    return False
+
+
 def path_exists(path, basedir):
     """Case sensitive, for windows, optional
     basedir for skip caps check for tmp folders in testing for example (returned always
@@ -292,17 +382,68 @@ def tar_extract(fileobj, destination_dir):
     the_tar.close()
 
 
-def list_folder_subdirs(basedir, level):
-    ret = []
-    for root, dirs, _ in os.walk(basedir):
-        rel_path = os.path.relpath(root, basedir)
-        if rel_path == ".":
-            continue
-        dir_split = rel_path.split(os.sep)
-        if len(dir_split) == level:
-            ret.append("/".join(dir_split))
-            dirs[:] = []  # Stop iterate subdirs
-    return ret
+def _subdir_names(folder):
+    if hasattr(os, "scandir"):  # Python >= 3.5, avoids a stat() call per entry
+        return [entry.name for entry in os.scandir(folder)
+                if entry.is_dir(follow_symlinks=False)]
+    return [name for name in os.listdir(folder)
+            if os.path.isdir(os.path.join(folder, name)) and
+            not os.path.islink(os.path.join(folder, name))]
+
+
+def file_signature(path):
+    """ Returns a string that changes if the file is modified, or None if it was modified so
+    recently that it could be modified again without changing it (mtime resolution)
+    Raises OSError if the file doesn't exist
+    """
+    st = os.stat(path)
+    if time.time() - st.st_mtime < 2:
+        return None
+    return "%r-%d" % (st.st_mtime, st.st_size)
+
+
+def _cached_subdir_names(folder, rel_path, listings, new_listings, now):
+    mtime = os.stat(folder).st_mtime
+    cached = listings.get(rel_path)
+    if cached is not None and cached[0] is not None and cached[0] == mtime:
+        names = cached[1]
+    else:
+        names = _subdir_names(folder)
+        # A folder modified right now could change again without changing its mtime (resolution)
+        if now - mtime < 2:
+            mtime = None
+    new_listings[rel_path] = (mtime, names)
+    return names
+
+
+def list_folder_subdirs(basedir, level, listings=None):
+    """ Returns the relative paths ("a/b/c/d" for level=4) of the subfolders found at the given
+    depth. Only that depth is listed, and, as os.walk, symlinks to folders are not followed
+    listings: optional {rel_path: (mtime, [subfolder_names])} of the folders listed by a previous
+    call, that is updated, so only the folders modified since then are listed again
+    """
+    new_listings = {}
+    now = time.time()
+    current = [""]
+    for _ in range(level):
+        subdirs = []
+        for rel_path in current:
+            folder = os.path.join(basedir, rel_path)
+            try:
+                if listings is None:
+                    names = _subdir_names(folder)
+                else:
+                    names = _cached_subdir_names(folder, rel_path, listings, new_listings, now)
+            except OSError:
+                continue
+            if rel_path:
+                names = ["%s/%s" % (rel_path, name) for name in names]
+            subdirs.extend(names)
+        current = subdirs
+    if listings is not None:
+        listings.clear()
+        listings.update(new_listings)
+    return current
 
 
 def exception_message_safe(exc):
@@ -1,12 +1,48 @@
 import fasteners
 from conans.util.log import logger
 import time
-from conans.util.files import save, load
+from conans.util.files import save, load, mkdir
+from conans.util.tracer import log_lock_wait
 import os
+import errno
+import socket
+import threading
+from collections import defaultdict
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+FLOCK_EXTENSION = ".flock"
+
+_lock_waits = defaultdict(float)  # {locked item: seconds waited} in this process
+_lock_waits_mutex = threading.Lock()
+
+
+def _record_wait(locked_item, seconds):
+    with _lock_waits_mutex:
+        _lock_waits[str(locked_item)] += seconds
+    logger.debug("Locks: waited %.3fs for %s" % (seconds, locked_item))
+    log_lock_wait(str(locked_item), seconds)
+
+
+def lock_wait_times():
+    """ returns {locked item: seconds} waited by this process to acquire the cache locks
+    """
+    with _lock_waits_mutex:
+        return dict(_lock_waits)
 
 
 class NoLock(object):
 
+    def try_acquire(self):
+        return True
+
+    def release(self):
+        pass
+
     def __enter__(self):
         pass
 
@@ -19,6 +55,14 @@ class SimpleLock(object):
     def __init__(self, filename):
         self._lock = fasteners.InterProcessLock(filename, logger=logger)
 
+    def try_acquire(self):
+        """ non blocking, returns True if the lock was acquired, then release() must be called
+        """
+        return self._lock.acquire(blocking=False)
+
+    def release(self):
+        self._lock.release()
+
     def __enter__(self):
         self._lock.acquire()
 
@@ -34,10 +78,11 @@ class Lock(object):
 
     @staticmethod
     def clean(folder):
-        if os.path.exists(folder + ".count"):
-            os.remove(folder + ".count")
-        if os.path.exists(folder + ".count.lock"):
-            os.remove(folder + ".count.lock")
+        # Not the FLOCK_EXTENSION file: removing it while other process holds it would break the
+        # exclusion, and the OS already releases the flocks of the crashed processes
+        for lock_file in (folder + ".count", folder + ".count.lock"):
+            if os.path.exists(lock_file):
+                os.remove(lock_file)
 
     def __init__(self, folder, locked_item, output):
         self._count_file = folder + ".count"
@@ -53,10 +98,15 @@ class Lock(object):
     def _info_locked(self):
         if self._first_lock:
             self._first_lock = False
+            self._wait_start = time.time()
             self._output.info("%s is locked by another concurrent conan process, wait..."
                               % str(self._locked_item))
             self._output.info("If not the case, quit, and do 'conan remove --locks'")
 
+    def _acquired(self):
+        if not self._first_lock:
+            _record_wait(self._locked_item, time.time() - self._wait_start)
+
     def _readers(self):
         try:
             return int(load(self._count_file))
@@ -75,6 +125,7 @@ class ReadLock(Lock):
                     break
             self._info_locked()
             time.sleep(READ_BUSY_DELAY)
+        self._acquired()
 
     def __exit__(self, exc_type, exc_val, exc_tb):   # @UnusedVariable
         with fasteners.InterProcessLock(self._count_lock_file, logger=logger):
@@ -84,6 +135,18 @@ class ReadLock(Lock):
 
 class WriteLock(Lock):
 
+    def try_acquire(self):
+        """ non blocking, returns True if the lock was acquired, then release() must be called
+        """
+        with fasteners.InterProcessLock(self._count_lock_file, logger=logger):
+            if self._readers() == 0:
+                save(self._count_file, "-1")
+                return True
+        return False
+
+    def release(self):
+        self.__exit__(None, None, None)
+
     def __enter__(self):
         while True:
             with fasteners.InterProcessLock(self._count_lock_file, logger=logger):
@@ -93,7 +156,187 @@ class WriteLock(Lock):
                     break
             self._info_locked()
             time.sleep(WRITE_BUSY_DELAY)
+        self._acquired()
 
     def __exit__(self, exc_type, exc_val, exc_tb):  # @UnusedVariable
         with fasteners.InterProcessLock(self._count_lock_file, logger=logger):
             save(self._count_file, "0")
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except OSError as e:
+        return e.errno == errno.EPERM
+    return True
+
+
+class FcntlLock(object):
+    """ Reader/writer lock of a cache folder, a shared or exclusive fcntl.flock() of the
+    folder + ".flock" file. Waiting blocks in the kernel instead of polling, and the locks of
+    crashed processes are released by the OS, so they never leak. The holders write their
+    pid to the file, to detect stale owners: the lock inherited by a child process that
+    outlived its conan parent
+    """
+    _exclusive = False
+
+    @staticmethod
+    def available():
+        return fcntl is not None
+
+    def __init__(self, folder, locked_item, output):
+        self._lock_file = folder + FLOCK_EXTENSION
+        self._locked_item = locked_item
+        self._output = output
+        self._fd = None
+
+    @property
+    def files(self):
+        return (self._lock_file, )
+
+    def _open(self):
+        mkdir(os.path.dirname(self._lock_file))
+        fd = os.open(self._lock_file, os.O_RDWR | os.O_CREAT, 0o666)
+        # Not inherited by the build processes, they would keep the lock when conan exits
+        fcntl.fcntl(fd, fcntl.F_SETFD, fcntl.fcntl(fd, fcntl.F_GETFD) | fcntl.FD_CLOEXEC)
+        return fd
+
+    def _owner(self):
+        try:
+            pid, host = load(self._lock_file).split()[:2]
+            return int(pid), host
+        except (IOError, ValueError):
+            return None, None
+
+    def _info_locked(self):
+        self._output.info("%s is locked by another concurrent conan process, wait..."
+                          % str(self._locked_item))
+        pid, host = self._owner()
+        if pid and host == socket.gethostname() and not _pid_alive(pid):
+            self._output.warn("The conan process %d that locked it doesn't exist anymore, some "
+                              "process launched by it could still be holding the lock" % pid)
+
+    def _acquire(self, blocking):
+        operation = fcntl.LOCK_EX if self._exclusive else fcntl.LOCK_SH
+        fd = self._open()
+        try:
+            try:
+                fcntl.flock(fd, operation | fcntl.LOCK_NB)
+            except (IOError, OSError) as e:
+                if e.errno not in (errno.EAGAIN, errno.EACCES) or not blocking:
+                    raise
+                self._info_locked()
+                start = time.time()
+                fcntl.flock(fd, operation)
+                _record_wait(self._locked_item, time.time() - start)
+        except (IOError, OSError) as e:
+            os.close(fd)
+            if e.errno in (errno.EAGAIN, errno.EACCES):
+                return False
+            raise
+        if self._exclusive:
+            os.ftruncate(fd, 0)
+            os.write(fd, ("%d %s\n" % (os.getpid(), socket.gethostname())).encode())
+        self._fd = fd
+        return True
+
+    def try_acquire(self):
+        """ non blocking, returns True if the lock was acquired, then release() must be called
+        """
+        return self._acquire(blocking=False)
+
+    def release(self):
+        fd, self._fd = self._fd, None
+        if self._exclusive:
+            os.ftruncate(fd, 0)
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+    def __enter__(self):
+        self._acquire(blocking=True)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):  # @UnusedVariable
+        self.release()
+
+
+class FcntlReadLock(FcntlLock):
+    _exclusive = False
+
+
+class FcntlWriteLock(FcntlLock):
+    _exclusive = True
+
+
+class JobSlots(object):
+    """ Machine wide pool of build job slots, one lock file per slot, so the builds running
+    at the same time (other conan processes, other CI jobs) don't run more compile jobs
+    than slots in total. Every build also holds a "holder" lock file while it takes or waits
+    for slots, and takes at most its fair share of the slots (slots / builds), waiting for
+    at least one.
+    """
+    def __init__(self, folder, slots):
+        self._folder = folder
+        self._slots = slots
+        self._locks = []
+        self._holder = None
+        self._holder_name = None
+
+    def _lock(self, name):
+        return fasteners.InterProcessLock(os.path.join(self._folder, name), logger=logger)
+
+    def _register(self):
+        index = 0
+        while True:
+            name = "holder%d" % index
+            holder = self._lock(name)
+            if holder.acquire(blocking=False):
+                self._holder, self._holder_name = holder, name
+                return
+            index += 1
+
+    def _holders(self):
+        """ the number of builds taking or waiting for slots, this one included
+        """
+        holders = 1
+        for name in os.listdir(self._folder):
+            if not name.startswith("holder") or name == self._holder_name:
+                continue
+            holder = self._lock(name)
+            if holder.acquire(blocking=False):
+                holder.release()
+            else:
+                holders += 1
+        return holders
+
+    def acquire(self, max_jobs, output=None):
+        """ returns the number of slots taken, between 1 and max_jobs
+        """
+        mkdir(self._folder)
+        self._register()
+        t1 = time.time()
+        warned = False
+        while True:
+            jobs = min(max_jobs, max(1, self._slots // self._holders()))
+            for index in range(self._slots):
+                if len(self._locks) >= jobs:
+                    break
+                lock = self._lock("slot%d" % index)
+                if lock.acquire(blocking=False):
+                    self._locks.append(lock)
+            if self._locks:
+                break
+            if output and not warned:
+                output.info("Waiting for a free build job slot in %s" % self._folder)
+                warned = True
+            time.sleep(0.1)
+        if warned:
+            _record_wait(self._folder, time.time() - t1)
+        return len(self._locks)
+
+    def release(self):
+        for lock in self._locks:
+            lock.release()
+        self._locks = []
+        if self._holder is not None:
+            self._holder.release()
+            self._holder = self._holder_name = None